@@ -0,0 +1,92 @@
+// Benchmark tích hợp: mở GenreDetailScreen với một thể loại 5k bài hát rồi cuộn.
+//
+// Chạy trên thiết bị / emulator (nên dùng --profile để số liệu giống bản release):
+//   flutter drive --profile \
+//     --driver=test_driver/perf_driver.dart \
+//     --target=integration_test/genre_scroll_benchmark_test.dart
+//
+// Kết quả được ghi vào build/:
+//  - genre_scroll.timeline_summary.json: thời gian build / raster của từng frame
+//    khi cuộn (average / 90th / 99th percentile, số frame bị trễ)
+//  - genre_scroll_benchmark.json: thời gian dựng màn hình và số dòng đã được dựng
+
+import 'package:app_music/models/artist.dart';
+import 'package:app_music/models/genre.dart';
+import 'package:app_music/models/song.dart';
+import 'package:app_music/providers/audio_provider.dart';
+import 'package:app_music/screens/genre_detail_screen.dart';
+import 'package:flutter/material.dart';
+import 'package:flutter_test/flutter_test.dart';
+import 'package:integration_test/integration_test.dart';
+import 'package:provider/provider.dart';
+
+const int songCount = 5000;
+
+Genre buildGenre(int count) {
+  final createdAt = DateTime.utc(2025, 1, 1);
+  final artists = List.generate(
+    50,
+    (i) => Artist(id: 'artist_$i', title: 'Ca sĩ $i', createdAt: createdAt, updatedAt: createdAt),
+  );
+  return Genre(
+    id: 'genre_bench',
+    title: 'Benchmark',
+    description: 'Thể loại $count bài hát',
+    songs: List.generate(
+      count,
+      (i) => Song(
+        id: 'song_$i',
+        title: 'Bài hát số $i',
+        artist: artists[i % artists.length],
+        url: 'https://example.com/songs/$i.mp3',
+        createdAt: createdAt,
+        updatedAt: createdAt,
+      ),
+    ),
+    createdAt: createdAt,
+    updatedAt: createdAt,
+  );
+}
+
+void main() {
+  final binding = IntegrationTestWidgetsFlutterBinding.ensureInitialized();
+
+  testWidgets('scroll a $songCount-song genre', (tester) async {
+    final genre = buildGenre(songCount);
+
+    // Thời gian từ lúc gắn màn hình đến khi frame đầu tiên được dựng xong
+    final buildWatch = Stopwatch()..start();
+    await tester.pumpWidget(
+      ChangeNotifierProvider(
+        create: (_) => AudioProvider(),
+        child: MaterialApp(home: GenreDetailScreen(genre: genre)),
+      ),
+    );
+    buildWatch.stop();
+    await tester.pumpAndSettle();
+
+    final builtTiles = find.byType(ListTile).evaluate().length;
+    expect(builtTiles, lessThan(100), reason: 'Chỉ các dòng đang hiển thị được dựng');
+
+    final list = find.byKey(GenreDetailScreen.songListKey);
+    await binding.traceAction(
+      () async {
+        for (int i = 0; i < 10; i++) {
+          await tester.fling(list, const Offset(0, -1500), 5000);
+          await tester.pumpAndSettle();
+        }
+        for (int i = 0; i < 10; i++) {
+          await tester.fling(list, const Offset(0, 1500), 5000);
+          await tester.pumpAndSettle();
+        }
+      },
+      reportKey: 'genre_scroll',
+    );
+
+    binding.reportData!['genre_scroll_benchmark'] = {
+      'songCount': songCount,
+      'firstBuildMs': buildWatch.elapsedMilliseconds,
+      'builtTilesAfterOpen': builtTiles,
+    };
+  });
+}
@@ -1,10 +1,13 @@
 import 'package:app_music/providers/artist_provider.dart';
 import 'package:app_music/providers/home_provider.dart';
 import 'package:app_music/providers/search_provider.dart';
-import 'package:app_music/service/user_service.dart';
+import 'package:app_music/service/cover_cache.dart';
+import 'package:app_music/service/json_worker.dart';
+import 'package:app_music/service/startup_coordinator.dart';
+import 'package:app_music/utils/network_trace.dart';
+import 'package:app_music/utils/startup_timeline.dart';
 import 'package:flutter/material.dart';
 import 'package:provider/provider.dart';
-import 'package:shared_preferences/shared_preferences.dart';
 import 'screens/login_screen.dart';
 import 'screens/home_screen.dart';
 import 'screens/search_screen.dart';
@@ -14,7 +17,13 @@ import 'widgets/music_player.dart';
 import 'providers/audio_provider.dart';
 
 void main() {
+  StartupTimeline.start();
   WidgetsFlutterBinding.ensureInitialized();
+  CoverCacheManager.configureMemoryCache();
+  if (NetworkTrace.enabled) JsonWorker().decodeObserver = NetworkTrace.decodeObserver;
+  WidgetsBinding.instance.waitUntilFirstFrameRasterized.then((_) {
+    StartupTimeline.mark('first_frame');
+  });
   runApp(
     MultiProvider(
       providers: [
@@ -36,62 +45,56 @@ class MyApp extends StatefulWidget {
 }
 
 class _MyAppState extends State<MyApp> {
-  bool _isLoggedIn = false;
-  final UserService userService = UserService(baseUrl: 'http://10.0.2.2:8080');
+  // null: chưa đọc xong phiên đăng nhập đã lưu
+  bool? _isLoggedIn;
+  final StartupCoordinator startup = StartupCoordinator();
+  final GlobalKey<NavigatorState> _navigatorKey = GlobalKey<NavigatorState>();
 
   @override
   void initState() {
     super.initState();
+    startup.signedIn.addListener(_onSignedInChanged);
     _checkLoginStatus();
   }
 
-  Future<void> _checkLoginStatus() async {
-    final prefs = await SharedPreferences.getInstance();
-    final accessToken = prefs.getString('accessToken');
+  @override
+  void dispose() {
+    startup.signedIn.removeListener(_onSignedInChanged);
+    super.dispose();
+  }
 
-    if (accessToken == null) {
-      setState(() {
-        _isLoggedIn = false;
-      });
-      return;
+  // Chọn màn hình ngay từ token / user_data đã lưu, không chờ mạng.
+  // Token được kiểm tra với server ở nền, dữ liệu trang chủ được tải song song.
+  Future<void> _checkLoginStatus() async {
+    final restored = await startup.restoreSession();
+    if (!mounted) return;
+    if (restored) {
+      startup.validateSession();
+      startup.loadCatalog();
+      Provider.of<ArtistProvider>(context, listen: false).fetchArtists();
     }
+    setState(() {
+      _isLoggedIn = restored;
+    });
+  }
 
-    // Có token, thử lấy thông tin người dùng từ API
-    try {
-      final user = await userService.getCurrentUser();
-      if (user != null) {
-        setState(() {
-          _isLoggedIn = true;
-        });
-      } else {
-        // Token không hợp lệ, xóa token và user_data
-        await prefs.remove('accessToken');
-        await prefs.remove('user_data');
-        setState(() {
-          _isLoggedIn = false;
-        });
-      }
-    } catch (e) {
-      debugPrint("Error checking login status: $e");
-      // Nếu API thất bại, thử dùng dữ liệu từ SharedPreferences
-      final userJson = prefs.getString('user_data');
-      if (userJson != null) {
-        setState(() {
-          _isLoggedIn = true;
-        });
-      } else {
-        // Không có dữ liệu user, xóa token và chuyển hướng đến LoginScreen
-        await prefs.remove('accessToken');
-        setState(() {
-          _isLoggedIn = false;
-        });
-      }
-    }
+  // Điều hướng theo startup.signedIn sau khi đã chọn màn hình đầu tiên: đăng nhập / đăng ký
+  // thành công, đăng xuất, hoặc server từ chối token (401/403). Thay toàn bộ stack vì
+  // màn hình hiện tại có thể đã được đẩy lên trên home.
+  void _onSignedInChanged() {
+    if (_isLoggedIn == null || !mounted) return;
+    final signedIn = startup.signedIn.value;
+    _isLoggedIn = signedIn;
+    _navigatorKey.currentState?.pushAndRemoveUntil(
+      MaterialPageRoute(builder: (context) => signedIn ? const MainScreen() : const LoginScreen()),
+      (route) => false,
+    );
   }
 
   @override
   Widget build(BuildContext context) {
     return MaterialApp(
+      navigatorKey: _navigatorKey,
       debugShowCheckedModeBanner: false,
       title: 'Music App',
       theme: ThemeData(
@@ -100,7 +103,11 @@ class _MyAppState extends State<MyApp> {
           backgroundColor: Color(0xFFA6B9FF),
         ),
       ),
-      home: _isLoggedIn ? const MainScreen() : const LoginScreen(),
+      home: switch (_isLoggedIn) {
+        null => const Scaffold(backgroundColor: Colors.white),
+        true => const MainScreen(),
+        false => const LoginScreen(),
+      },
     );
   }
 }
@@ -0,0 +1,14 @@
+// Một trang dữ liệu trả về từ API có phân trang theo cursor
+class PageResult<T> {
+  final List<T> items;
+  final String? nextCursor;
+  final int? total;
+
+  PageResult({
+    required this.items,
+    this.nextCursor,
+    this.total,
+  });
+
+  bool get hasMore => nextCursor != null && nextCursor!.isNotEmpty;
+}
\ No newline at end of file
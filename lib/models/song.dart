@@ -14,11 +14,15 @@ class Song {
   final String? slugify;
   final String? url;
   final String? coverImage;
-  final List<String>? likes;
-  final List<Comment>? comments;
   final DateTime createdAt;
   final DateTime updatedAt;
 
+  // likes / comments chỉ được phân tích khi màn hình chi tiết cần đến
+  List<dynamic>? _rawLikes;
+  List<dynamic>? _rawComments;
+  List<String>? _likes;
+  List<Comment>? _comments;
+
   Song({
     required this.id,
     required this.title,
@@ -31,11 +35,38 @@ class Song {
     this.slugify,
     this.url,
     this.coverImage,
-    this.likes,
-    this.comments,
+    List<String>? likes,
+    List<Comment>? comments,
     required this.createdAt,
     required this.updatedAt,
-  });
+  })  : _likes = likes,
+        _comments = comments;
+
+  List<String>? get likes {
+    if (_likes == null && _rawLikes != null) {
+      _likes = List<String>.from(_rawLikes!);
+      _rawLikes = null;
+    }
+    return _likes;
+  }
+
+  List<Comment>? get comments {
+    if (_comments == null && _rawComments != null) {
+      _comments = _rawComments!
+          .map((c) {
+        try {
+          return Comment.fromJson(c);
+        } catch (e) {
+          return null;
+        }
+      })
+          .where((c) => c != null)
+          .cast<Comment>()
+          .toList();
+      _rawComments = null;
+    }
+    return _comments;
+  }
 
   factory Song.fromJson(Map<String, dynamic> json) {
     try {
@@ -43,7 +74,7 @@ class Song {
         throw const FormatException('Missing required fields: _id or title');
       }
 
-      return Song(
+      final song = Song(
         id: json['_id'],
         title: json['title'],
         description: json['description'],
@@ -68,13 +99,12 @@ class Song {
         slugify: json['slugify'],
         url: json['url'],
         coverImage: json['coverImage'],
-        likes: json['likes'] != null ? List<String>.from(json['likes']) : null,
-        comments: json['comments'] != null
-            ? (json['comments'] as List).map((c) => Comment.fromJson(c)).toList()
-            : null,
         createdAt: DateTime.parse(json['createdAt']),
         updatedAt: DateTime.parse(json['updatedAt']),
       );
+      song._rawLikes = json['likes'] as List?;
+      song._rawComments = json['comments'] as List?;
+      return song;
     } catch (e) {
       throw FormatException('Error parsing Song JSON: $e');
     }
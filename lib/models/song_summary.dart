@@ -0,0 +1,99 @@
+import 'package:app_music/models/song.dart';
+
+// Bản rút gọn của Song cho các màn hình danh sách, hàng đợi phát và tìm kiếm:
+// chỉ giữ các trường hiển thị, artist / album / genre được lưu dưới dạng id + tên
+// thay vì đối tượng lồng. lyrics, description, likes, comments chỉ có trong Song
+// và được tải khi cần qua CatalogRepository.getSongById.
+class SongSummary {
+  final String id;
+  final String title;
+  final String? artistId;
+  final String? artistName;
+  final String? albumId;
+  final String? albumTitle;
+  final List<String>? genreIds;
+  final List<String>? genreTitles;
+  final String? duration;
+  final String? url;
+  final String? coverImage;
+
+  const SongSummary({
+    required this.id,
+    required this.title,
+    this.artistId,
+    this.artistName,
+    this.albumId,
+    this.albumTitle,
+    this.genreIds,
+    this.genreTitles,
+    this.duration,
+    this.url,
+    this.coverImage,
+  });
+
+  // Nhận cả payload rút gọn (artist / album / genre là id hoặc {_id, title})
+  // lẫn payload đầy đủ của /api/v1/song
+  factory SongSummary.fromJson(Map<String, dynamic> json) {
+    try {
+      if (json['_id'] == null || json['title'] == null) {
+        throw const FormatException('Missing required fields: _id or title');
+      }
+
+      final artist = json['artist'];
+      final album = json['album'];
+      final genres = json['genre'] as List?;
+      return SongSummary(
+        id: json['_id'],
+        title: json['title'],
+        artistId: _refId(artist),
+        artistName: artist is Map ? artist['title'] : null,
+        albumId: _refId(album),
+        albumTitle: album is Map ? album['title'] : null,
+        genreIds: genres?.map(_refId).whereType<String>().toList(growable: false),
+        genreTitles: genres
+            ?.whereType<Map>()
+            .map((g) => g['title'])
+            .whereType<String>()
+            .toList(growable: false),
+        duration: json['duration'],
+        url: json['url'],
+        coverImage: json['coverImage'],
+      );
+    } catch (e) {
+      throw FormatException('Error parsing SongSummary JSON: $e');
+    }
+  }
+
+  // Dùng cho các bài hát đã có đầy đủ (vd. lồng trong Genre)
+  factory SongSummary.fromSong(Song song) {
+    return SongSummary(
+      id: song.id,
+      title: song.title,
+      artistId: song.artist?.id,
+      artistName: song.artist?.title,
+      albumId: song.album?.id,
+      albumTitle: song.album?.title,
+      genreIds: song.genres?.map((g) => g.id).toList(growable: false),
+      genreTitles: song.genres?.map((g) => g.title).whereType<String>().toList(growable: false),
+      duration: song.duration,
+      url: song.url,
+      coverImage: song.coverImage,
+    );
+  }
+
+  static String? _refId(dynamic ref) {
+    if (ref is Map) return ref['_id'] as String?;
+    return ref is String ? ref : null;
+  }
+
+  Map<String, dynamic> toJson() => {
+    '_id': id,
+    'title': title,
+    'artist': artistId == null ? null : {'_id': artistId, 'title': artistName},
+    'album': albumId == null ? null : {'_id': albumId, 'title': albumTitle},
+    'genre': genreIds,
+    'duration': duration,
+    'url': url,
+    'coverImage': coverImage,
+  };
+}
@@ -1,6 +1,7 @@
 import 'package:flutter/material.dart';
 import '../models/artist.dart';
-import '../service/artist_service.dart';
+import '../service/catalog_repository.dart';
+import '../utils/app_log.dart';
 
 class ArtistProvider with ChangeNotifier {
   List<Artist> _artists = [];
@@ -9,37 +10,35 @@ class ArtistProvider with ChangeNotifier {
   List<Artist> get artists => _artists;
   bool get isLoading => _isLoading;
 
-  final ArtistService _artistService = ArtistService();
+  final CatalogRepository _repository = CatalogRepository();
 
-  Future<void> fetchArtists() async {
+  Future<void> fetchArtists({bool forceRefresh = false}) async {
     try {
       _isLoading = true;
       notifyListeners(); // Thông báo đang tải
 
-      _artists = await _artistService.fetchArtists();
-      print("Artists loaded: ${_artists.map((a) => a.title).toList()}");
+      _artists = await _repository.fetchArtists(
+        forceRefresh: forceRefresh,
+        onUpdated: (artists) {
+          // Cache đã được làm mới ở nền
+          _artists = artists;
+          notifyListeners();
+        },
+      );
+      AppLog.d('ArtistProvider', () => "Artists loaded: ${_artists.length}");
 
       _isLoading = false;
       notifyListeners(); // Thông báo hoàn tất
     } catch (e) {
-      print("Error loading artists: $e");
+      AppLog.e('ArtistProvider', "Error loading artists", e);
       _artists = [];
       _isLoading = false;
       notifyListeners(); // Thông báo lỗi (nếu cần)
     }
   }
 
+  // Tra cứu theo id trong CatalogRepository (O(1))
   String getArtistNameById(String? artistId) {
-    if (artistId == null) return 'Unknown Artist';
-    final artist = _artists.firstWhere(
-          (a) => a.id == artistId,
-      orElse: () => Artist(
-        id: '',
-        title: 'Unknown Artist',
-        createdAt: DateTime.now(),
-        updatedAt: DateTime.now(),
-      ),
-    );
-    return artist.title;
+    return _repository.artistNameById(artistId);
   }
 }
\ No newline at end of file
@@ -1,6 +1,9 @@
 import 'package:audioplayers/audioplayers.dart';
 import 'package:flutter/material.dart';
-import 'dart:math'; // Để tạo số ngẫu nhiên cho shuffle
+import '../models/song_summary.dart';
+import '../service/catalog_repository.dart';
+import '../utils/app_log.dart';
+import 'play_queue.dart';
 
 // Enum cho chế độ lặp lại, đặt ngoài class AudioProvider
 enum RepeatMode {
@@ -13,52 +16,132 @@ class AudioProvider with ChangeNotifier {
   static final AudioProvider _instance = AudioProvider._internal();
   factory AudioProvider() => _instance;
 
-  final AudioPlayer _audioPlayer = AudioPlayer();
+  // Nạp sẵn bài kế tiếp khi bài hiện tại còn lại ít hơn khoảng này
+  static const Duration preloadLead = Duration(seconds: 20);
+  static const int maxTimeToAudioSamples = 50;
+  // Khoảng tối thiểu giữa hai lần cập nhật vị trí phát (vị trí được làm tròn theo giây)
+  static const Duration positionUpdateInterval = Duration(milliseconds: 500);
+
+  // Hai player luân phiên: một player đang phát, player còn lại nạp sẵn bài kế tiếp
+  // để khi chuyển bài chỉ cần đổi vai và resume, không phải kết nối / buffer lại.
+  final List<AudioPlayer> _players = [AudioPlayer(), AudioPlayer()];
+  int _activePlayer = 0;
   String? _currentSongUrl;
+  Duration _duration = Duration.zero;
+
+  String? _preloadedUrl; // Bài đã được nạp trên player dự phòng
+  bool _preloading = false;
 
+  // Độ trễ từ lúc yêu cầu chuyển bài đến khi có âm thanh (vị trí phát > 0)
+  final Stopwatch _transitionWatch = Stopwatch();
+  bool _transitionPreloaded = false;
+  final ValueNotifier<Duration?> timeToAudio = ValueNotifier<Duration?>(null);
+  final List<({Duration latency, bool preloaded})> timeToAudioSamples = [];
+
+  // Các kênh trạng thái riêng: widget chỉ lắng nghe kênh mình cần qua
+  // ValueListenableBuilder. Chuyển bài chỉ đi qua currentSongData, thay đổi hàng đợi
+  // qua queueVersion. notifyListeners() của provider chỉ được gọi khi hàng đợi hoặc
+  // chế độ shuffle / repeat thay đổi.
   ValueNotifier<bool> isPlayingNotifier = ValueNotifier<bool>(false);
   ValueNotifier<Map<String, String>?> currentSongData = ValueNotifier<Map<String, String>?>(null);
   ValueNotifier<double> audioPosition = ValueNotifier<double>(0.0);
   ValueNotifier<double> totalTime = ValueNotifier<double>(0.0);
+  ValueNotifier<int> queueVersion = ValueNotifier<int>(0); // Tăng mỗi khi hàng đợi thay đổi
+  final Stopwatch _positionThrottle = Stopwatch()..start();
 
-  List<Map<String, String>> _songs = [];
-  int _currentIndex = -1;
+  // Hàng đợi chỉ giữ id bài hát, thông tin bài hát lấy từ CatalogRepository
+  final PlayQueue _queue = PlayQueue();
+  List<String>? _queueSource; // Danh sách id truyền cho setQueueIds lần gần nhất
+  final CatalogRepository _repository = CatalogRepository();
 
   // Trạng thái cho shuffle và repeat
   bool _isShuffleEnabled = false; // Bật/tắt chế độ phát ngẫu nhiên
   RepeatMode _repeatMode = RepeatMode.none; // Chế độ lặp lại
 
   // Getter
-  List<Map<String, String>> get songs => _songs;
-  int get currentIndex => _currentIndex;
+  int get queueLength => _queue.length;
+  int get currentIndex => _queue.currentIndex;
   bool get isShuffleEnabled => _isShuffleEnabled;
   RepeatMode get repeatMode => _repeatMode;
 
+  SongSummary? songAt(int index) {
+    if (index < 0 || index >= _queue.length || !_queue.isPlayable(index)) return null;
+    return _repository.songById(_queue.idAt(index));
+  }
+
+  // Vị trí của bài trong hàng đợi, -1 nếu không có
+  int indexOfSong(String songId) => _queue.indexOf(songId);
+
+  AudioPlayer get _player => _players[_activePlayer];
+  AudioPlayer get _standby => _players[1 - _activePlayer];
+
   AudioProvider._internal() {
-    _audioPlayer.onPositionChanged.listen((Duration p) {
-      audioPosition.value = p.inSeconds.toDouble();
-      notifyListeners();
-    });
+    for (final player in _players) {
+      // Bỏ qua sự kiện của player dự phòng (đang nạp sẵn)
+      player.onPositionChanged.listen((Duration p) {
+        if (!identical(player, _player)) return;
+        _recordTimeToAudio(p);
+        _maybePreload(p);
+        _updatePosition(p);
+      });
 
-    _audioPlayer.onDurationChanged.listen((Duration d) {
-      totalTime.value = d.inSeconds.toDouble();
-      notifyListeners();
-    });
+      player.onDurationChanged.listen((Duration d) {
+        if (!identical(player, _player)) return;
+        _setDuration(d);
+      });
 
-    _audioPlayer.onPlayerStateChanged.listen((PlayerState state) {
-      isPlayingNotifier.value = (state == PlayerState.playing);
-      notifyListeners();
-    });
+      player.onPlayerStateChanged.listen((PlayerState state) {
+        if (!identical(player, _player)) return;
+        isPlayingNotifier.value = (state == PlayerState.playing);
+      });
 
-    _audioPlayer.onPlayerComplete.listen((_) {
-      _handleSongCompletion();
-    });
+      player.onPlayerComplete.listen((_) {
+        if (!identical(player, _player)) return;
+        _handleSongCompletion();
+      });
+    }
+  }
+
+  // Thay hàng đợi bằng danh sách bài hát (chỉ lưu id)
+  void setQueue(List<SongSummary> songs) {
+    _repository.registerSongs(songs);
+    setQueueIds([for (final song in songs) song.id]);
+  }
+
+  // Thay hàng đợi bằng id của các bài CatalogRepository đã biết, không dựng hay đăng ký
+  // lại từng bài. Gọi lại với cùng một danh sách (vd. chạm nhiều bài trong một màn hình)
+  // thì giữ nguyên hàng đợi.
+  void setQueueIds(List<String> ids) {
+    if (identical(ids, _queueSource)) return;
+    _queueSource = ids;
+    _queue.replace(ids);
+    _queueChanged();
+  }
+
+  // Thêm vào cuối hàng đợi
+  void addToQueue(SongSummary song) {
+    _repository.registerSongs([song]);
+    _queue.enqueue(song.id);
+    _queueSource = null; // Hàng đợi không còn giống danh sách nguồn
+    _queueChanged();
+  }
+
+  // Phát ngay sau bài hiện tại
+  void playNextInQueue(SongSummary song) {
+    _repository.registerSongs([song]);
+    _queue.enqueueNext(song.id);
+    _queueSource = null;
+    _queueChanged();
+  }
+
+  void removeFromQueue(int index) {
+    _queue.remove(index);
+    _queueSource = null;
+    _queueChanged();
   }
 
-  // Thiết lập danh sách bài hát
-  void setSongs(List<Map<String, String>> songs) {
-    _songs = songs;
-    _currentIndex = -1;
+  void _queueChanged() {
+    queueVersion.value++;
     notifyListeners();
   }
 
@@ -66,58 +149,133 @@ class AudioProvider with ChangeNotifier {
   Future<void> play(String url, String title, String artist, String imagePath) async {
     try {
       if (_currentSongUrl == url && isPlayingNotifier.value) {
-        await _audioPlayer.pause();
+        await _player.pause();
       } else {
-        await _audioPlayer.stop();
-        await _audioPlayer.play(UrlSource(url));
-        _currentSongUrl = url;
-        currentSongData.value = {
+        await _startTrack({
           "songUrl": url,
           "title": title,
           "artist": artist,
           "imagePath": imagePath,
-        };
+        });
       }
-      notifyListeners();
     } catch (e) {
-      print("Error playing audio: $e");
+      AppLog.e('AudioProvider', "Error playing audio", e);
     }
   }
 
   // Phát bài hát theo index
   void playSong(int index) {
-    if (index < 0 || index >= _songs.length) return;
-    final song = _songs[index];
-    play(
-      song["songUrl"]!,
-      song["title"]!,
-      song["artist"]!,
-      song["imagePath"]!,
-    );
-    _currentIndex = index;
-    notifyListeners();
+    if (!_queue.jumpTo(index)) return;
+    _playCurrent();
+  }
+
+  void _playCurrent() {
+    final song = songAt(_queue.currentIndex);
+    if (song == null) return;
+    // Widget nhận bài mới qua currentSongData, không qua notifyListeners()
+    _startTrack(_trackData(song)).catchError((e) {
+      AppLog.e('AudioProvider', "Error playing audio", e);
+    });
+  }
+
+  // Dữ liệu hiển thị của bài đang phát (chỉ dựng cho một bài, khi chuyển bài)
+  Map<String, String> _trackData(SongSummary song) {
+    return {
+      "songId": song.id,
+      "songUrl": song.url ?? '',
+      "title": song.title,
+      "artist": song.artistName ?? _repository.artistNameById(song.artistId),
+      "imagePath": song.coverImage ?? '',
+    };
+  }
+
+  // Bắt đầu phát một bài: dùng player dự phòng nếu bài đã được nạp sẵn,
+  // nếu không thì dừng player hiện tại và tải từ đầu
+  Future<void> _startTrack(Map<String, String> song) async {
+    final url = song["songUrl"]!;
+    final previous = _player;
+    _transitionWatch
+      ..reset()
+      ..start();
+    _transitionPreloaded = _preloadedUrl == url;
+    _currentSongUrl = url;
+    currentSongData.value = song;
+    audioPosition.value = 0.0;
+
+    if (_transitionPreloaded) {
+      _activePlayer = 1 - _activePlayer;
+      _preloadedUrl = null;
+      await _player.resume();
+      await previous.stop();
+      // onDurationChanged đã phát ra lúc player còn là dự phòng
+      final duration = await _player.getDuration();
+      if (duration != null) _setDuration(duration);
+    } else {
+      _setDuration(Duration.zero);
+      await previous.stop();
+      await previous.play(UrlSource(url));
+    }
+  }
+
+  // Làm tròn theo giây và giới hạn tần suất để thanh tiến trình không rebuild mỗi tick
+  void _updatePosition(Duration p, {bool force = false}) {
+    if (!force && _positionThrottle.elapsed < positionUpdateInterval) return;
+    _positionThrottle
+      ..reset()
+      ..start();
+    audioPosition.value = p.inSeconds.toDouble();
+  }
+
+  void _setDuration(Duration d) {
+    _duration = d;
+    totalTime.value = d.inSeconds.toDouble();
+  }
+
+  void _maybePreload(Duration position) {
+    if (_preloading || _duration == Duration.zero || _repeatMode == RepeatMode.one) return;
+    if (_duration - position > preloadLead) return;
+    final index = _queue.peekNext(wrap: _repeatMode == RepeatMode.all);
+    if (index == null) return;
+    final url = songAt(index)?.url;
+    if (url == null || url.isEmpty || url == _preloadedUrl || url == _currentSongUrl) return;
+    _preload(url);
+  }
+
+  Future<void> _preload(String url) async {
+    final standby = _standby;
+    _preloading = true;
+    _preloadedUrl = null;
+    try {
+      await standby.setSource(UrlSource(url));
+      // Bỏ kết quả nếu trong lúc nạp player đã đổi vai
+      if (identical(standby, _standby)) _preloadedUrl = url;
+    } catch (e) {
+      AppLog.w('AudioProvider', "Error preloading audio", e);
+    } finally {
+      _preloading = false;
+    }
+  }
+
+  void _recordTimeToAudio(Duration position) {
+    if (!_transitionWatch.isRunning || position <= Duration.zero) return;
+    _transitionWatch.stop();
+    final latency = _transitionWatch.elapsed;
+    timeToAudio.value = latency;
+    timeToAudioSamples.add((latency: latency, preloaded: _transitionPreloaded));
+    if (timeToAudioSamples.length > maxTimeToAudioSamples) {
+      timeToAudioSamples.removeAt(0);
+    }
+    AppLog.d('AudioProvider', () => "Time to audio: ${latency.inMilliseconds}ms (preloaded: $_transitionPreloaded)");
   }
 
   // Chuyển bài tiếp theo
   void playNext() {
-    if (_isShuffleEnabled) {
-      _playRandomSong();
-    } else if (_currentIndex < _songs.length - 1) {
-      playSong(_currentIndex + 1);
-    } else if (_repeatMode == RepeatMode.all) {
-      playSong(0); // Quay lại bài đầu tiên nếu lặp toàn bộ
-    }
+    if (_queue.advance(wrap: _repeatMode == RepeatMode.all) != null) _playCurrent();
   }
 
-  // Quay lại bài trước
+  // Quay lại bài trước (theo lịch sử phát, kể cả khi shuffle)
   void playPrevious() {
-    if (_isShuffleEnabled) {
-      _playRandomSong();
-    } else if (_currentIndex > 0) {
-      playSong(_currentIndex - 1);
-    } else if (_repeatMode == RepeatMode.all) {
-      playSong(_songs.length - 1); // Quay lại bài cuối nếu lặp toàn bộ
-    }
+    if (_queue.previous(wrap: _repeatMode == RepeatMode.all) != null) _playCurrent();
   }
 
   // Chuyển đổi play/pause
@@ -126,36 +284,49 @@ class AudioProvider with ChangeNotifier {
       if (_currentSongUrl == null) return;
 
       if (isPlayingNotifier.value) {
-        await _audioPlayer.pause();
+        await _player.pause();
       } else {
-        await _audioPlayer.resume();
+        await _player.resume();
       }
-      notifyListeners();
     } catch (e) {
-      print("Error toggling play/pause: $e");
+      AppLog.e('AudioProvider', "Error toggling play/pause", e);
     }
   }
 
   // Dừng phát
   Future<void> stop() async {
-    await _audioPlayer.stop();
+    _transitionWatch.stop();
+    _preloadedUrl = null;
+    await Future.wait(_players.map((player) => player.stop()));
     _currentSongUrl = null;
     currentSongData.value = null;
-    _currentIndex = -1;
-    notifyListeners();
+  }
+
+  // Đăng xuất: dừng phát và bỏ hàng đợi của phiên trước
+  Future<void> clearQueue() async {
+    try {
+      await stop();
+    } catch (e) {
+      AppLog.w('AudioProvider', "Error stopping playback", e);
+    }
+    _queueSource = null;
+    _queue.replace(const []);
+    _queueChanged();
   }
 
   // Tua đến vị trí
   void seekTo(double position) {
-    _audioPlayer.seek(Duration(seconds: position.toInt()));
-    notifyListeners();
+    final target = Duration(seconds: position.toInt());
+    _player.seek(target);
+    _updatePosition(target, force: true);
   }
 
   // Bật/tắt chế độ shuffle
   void toggleShuffle() {
     _isShuffleEnabled = !_isShuffleEnabled;
+    _queue.setShuffle(_isShuffleEnabled);
     notifyListeners();
-    print("Shuffle mode: $_isShuffleEnabled");
+    AppLog.d('AudioProvider', () => "Shuffle mode: $_isShuffleEnabled");
   }
 
   // Chuyển đổi chế độ lặp lại
@@ -172,32 +343,24 @@ class AudioProvider with ChangeNotifier {
         break;
     }
     notifyListeners();
-    print("Repeat mode: $_repeatMode");
-  }
-
-  // Phát bài ngẫu nhiên
-  void _playRandomSong() {
-    if (_songs.isEmpty) return;
-    final random = Random();
-    int nextIndex;
-    do {
-      nextIndex = random.nextInt(_songs.length);
-    } while (nextIndex == _currentIndex && _songs.length > 1); // Tránh lặp lại bài hiện tại nếu có thể
-    playSong(nextIndex);
+    AppLog.d('AudioProvider', () => "Repeat mode: $_repeatMode");
   }
 
   // Xử lý khi bài hát kết thúc
   void _handleSongCompletion() {
     if (_repeatMode == RepeatMode.one) {
-      playSong(_currentIndex); // Lặp lại bài hiện tại
-    } else if (_repeatMode == RepeatMode.all && _currentIndex == _songs.length - 1) {
-      playSong(0); // Quay lại bài đầu tiên nếu lặp toàn bộ
-    } else if (_isShuffleEnabled) {
-      _playRandomSong(); // Phát ngẫu nhiên nếu bật shuffle
-    } else if (_currentIndex < _songs.length - 1) {
-      playNext(); // Phát bài tiếp theo nếu không lặp
+      // Lặp lại bài hiện tại trên cùng player, không cần tải lại
+      _transitionWatch
+        ..reset()
+        ..start();
+      _transitionPreloaded = true;
+      _player.seek(Duration.zero).then((_) => _player.resume());
+      return;
+    }
+    if (_queue.advance(wrap: _repeatMode == RepeatMode.all) != null) {
+      _playCurrent();
     } else {
       stop(); // Dừng nếu không có chế độ lặp
     }
   }
-}
\ No newline at end of file
+}
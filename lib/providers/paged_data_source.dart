@@ -0,0 +1,175 @@
+import 'package:flutter/material.dart';
+import '../models/page_result.dart';
+import '../utils/app_log.dart';
+
+typedef PageFetcher<T> = Future<PageResult<T>> Function(String? cursor, bool forceRefresh);
+
+// Nguồn dữ liệu phân trang cho ListView.builder.
+// Tải trước trang kế tiếp khi người dùng cuộn gần cuối danh sách và chỉ giữ
+// các trang quanh vùng đang hiển thị trong bộ nhớ; trang đã bị giải phóng sẽ
+// được tải lại (thường từ cache) khi người dùng cuộn ngược về.
+class PagedDataSource<T> extends ChangeNotifier {
+  final PageFetcher<T> fetchPage;
+  final int prefetchDistance; // Số phần tử còn lại trước khi tải trang kế tiếp
+  final int maxResidentPages; // Số trang tối đa được giữ trong bộ nhớ
+
+  PagedDataSource({
+    required this.fetchPage,
+    this.prefetchDistance = 10,
+    this.maxResidentPages = 5,
+  });
+
+  // _cursors[i] là cursor để tải trang i, _pageStarts[i] là vị trí phần tử đầu tiên của trang i
+  final List<String?> _cursors = [null];
+  final List<int> _pageStarts = [];
+  final List<int> _pageLengths = [];
+  final Map<int, List<T>> _pages = {};
+  final Set<int> _loadingPages = {};
+  bool _hasMore = true;
+  Object? _error;
+  int? _total;
+  bool _disposed = false;
+  int _generation = 0; // Tăng mỗi lần refresh để bỏ qua kết quả của các request cũ
+
+  int get itemCount => _pageStarts.isEmpty ? 0 : _pageStarts.last + _pageLengths.last;
+  bool get hasMore => _hasMore;
+  bool get isLoading => _loadingPages.isNotEmpty;
+  Object? get error => _error;
+  int? get total => _total;
+  int get residentPageCount => _pages.length;
+
+  Future<void> loadFirstPage() => _loadPage(0);
+
+  // Tải trang kế tiếp nếu còn dữ liệu
+  Future<void> loadMore() async {
+    if (!_hasMore) return;
+    await _loadPage(_pageStarts.length);
+  }
+
+  // Thử lại sau khi lỗi (nút "Thử lại")
+  Future<void> retry() async {
+    _error = null;
+    notifyListeners();
+    await (itemCount == 0 ? loadFirstPage() : loadMore());
+  }
+
+  Future<void> refresh() async {
+    _generation++;
+    _loadingPages.clear();
+    _cursors
+      ..clear()
+      ..add(null);
+    _pageStarts.clear();
+    _pageLengths.clear();
+    _pages.clear();
+    _hasMore = true;
+    _error = null;
+    await _loadPage(0, forceRefresh: true);
+  }
+
+  // Gọi từ itemBuilder. Trả về null nếu trang chứa phần tử đang được tải lại.
+  T? itemAt(int index) {
+    if (index < 0 || index >= itemCount) return null;
+    final page = _pageOf(index);
+
+    // Không tự thử lại sau lỗi, tránh vòng lặp request mỗi lần build
+    if (_error == null) {
+      if (!_pages.containsKey(page)) {
+        _loadPage(page);
+      }
+      if (_hasMore && index >= itemCount - prefetchDistance) {
+        loadMore();
+      }
+    }
+    _evictAround(page);
+
+    final items = _pages[page];
+    final offset = index - _pageStarts[page];
+    if (items == null || offset >= items.length) return null;
+    return items[offset];
+  }
+
+  // Đọc phần tử nếu trang của nó đang trong bộ nhớ, không kích hoạt tải trang
+  T? peek(int index) {
+    if (index < 0 || index >= itemCount) return null;
+    final page = _pageOf(index);
+    final items = _pages[page];
+    final offset = index - _pageStarts[page];
+    if (items == null || offset >= items.length) return null;
+    return items[offset];
+  }
+
+  // Các phần tử liên tiếp đang nằm trong bộ nhớ quanh vị trí index
+  ({int start, List<T> items}) residentRange(int index) {
+    if (index < 0 || index >= itemCount) return (start: 0, items: <T>[]);
+    final page = _pageOf(index);
+    if (!_pages.containsKey(page)) return (start: index, items: <T>[]);
+
+    int first = page;
+    while (_pages.containsKey(first - 1)) {
+      first--;
+    }
+    final items = <T>[];
+    for (int p = first; _pages.containsKey(p); p++) {
+      items.addAll(_pages[p]!);
+    }
+    return (start: _pageStarts[first], items: items);
+  }
+
+  int _pageOf(int index) {
+    int low = 0;
+    int high = _pageStarts.length - 1;
+    while (low < high) {
+      final mid = (low + high + 1) ~/ 2;
+      if (_pageStarts[mid] <= index) {
+        low = mid;
+      } else {
+        high = mid - 1;
+      }
+    }
+    return low;
+  }
+
+  // Giải phóng các trang xa vùng đang hiển thị nhất
+  void _evictAround(int page) {
+    if (_pages.length <= maxResidentPages) return;
+    final resident = _pages.keys.toList()
+      ..sort((a, b) => (b - page).abs().compareTo((a - page).abs()));
+    for (final p in resident) {
+      if (_pages.length <= maxResidentPages) break;
+      if (p != page) _pages.remove(p);
+    }
+  }
+
+  Future<void> _loadPage(int page, {bool forceRefresh = false}) async {
+    if (_loadingPages.contains(page) || page >= _cursors.length) return;
+    final generation = _generation;
+    _loadingPages.add(page);
+    try {
+      final result = await fetchPage(_cursors[page], forceRefresh);
+      if (_disposed || generation != _generation) return;
+      _error = null;
+      _pages[page] = result.items;
+      if (page == _pageStarts.length) {
+        // Trang mới được nối vào cuối danh sách
+        _pageStarts.add(page == 0 ? 0 : _pageStarts[page - 1] + _pageLengths[page - 1]);
+        _pageLengths.add(result.items.length);
+        _total = result.total ?? _total;
+        _hasMore = result.hasMore && result.items.isNotEmpty;
+        if (_hasMore) _cursors.add(result.nextCursor);
+      }
+    } catch (e) {
+      AppLog.w('PagedDataSource', "Lỗi khi tải trang $page", e);
+      if (generation == _generation) _error = e;
+    } finally {
+      if (generation == _generation) _loadingPages.remove(page);
+      if (!_disposed) notifyListeners();
+    }
+  }
+
+  @override
+  void dispose() {
+    _disposed = true;
+    super.dispose();
+  }
+}
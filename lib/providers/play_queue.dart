@@ -0,0 +1,228 @@
+import 'dart:collection';
+import 'dart:math';
+
+// Hàng đợi phát nhạc của AudioProvider, chỉ lưu id bài hát (thông tin bài hát
+// được lấy từ CatalogRepository khi cần nên thay hàng đợi 10k bài không phải
+// dựng lại dữ liệu cho từng bài).
+// - Shuffle dùng hoán vị Fisher-Yates sinh dần: mỗi lần chuyển bài chỉ cố định
+//   thêm một vị trí (O(1)), mỗi bài phát đúng một lần trong một vòng.
+// - "Phát tiếp theo" được ưu tiên trước thứ tự thường.
+// - Lịch sử có giới hạn để quay lại đúng bài trước đó, kể cả khi shuffle.
+// - Xoá chỉ đánh dấu (O(1)), các vị trí đã xoá được bỏ qua khi chuyển bài.
+class PlayQueue {
+  final int maxHistory;
+  final Random _random;
+
+  PlayQueue({this.maxHistory = 100, Random? random}) : _random = random ?? Random();
+
+  List<String> _ids = [];
+  final Set<int> _removed = {};
+  final Set<int> _detached = {}; // Bài thêm bằng "phát tiếp theo", không nằm trong thứ tự thường
+  List<int>? _order; // Khi shuffle: _order[position] = index trong _ids
+  int _shuffledUntil = -1; // _order[0.._shuffledUntil] đã được cố định
+  int _position = -1; // Vị trí hiện tại trong thứ tự phát (tuần tự hoặc shuffle)
+  int _current = -1; // Index của bài đang phát trong _ids
+  final ListQueue<int> _upNext = ListQueue<int>();
+  final ListQueue<({int index, int position})> _history = ListQueue();
+  Map<String, int>? _indexById; // Chỉ dựng khi cần tra vị trí theo id
+
+  int get length => _ids.length;
+  int get currentIndex => _current;
+  String? get currentId => _current >= 0 ? _ids[_current] : null;
+  bool get isShuffled => _order != null;
+  int get historyLength => _history.length;
+
+  String idAt(int index) => _ids[index];
+  bool isPlayable(int index) => !_removed.contains(index) && !_detached.contains(index);
+
+  // Thay toàn bộ hàng đợi
+  void replace(List<String> ids) {
+    _ids = List.of(ids);
+    _removed.clear();
+    _detached.clear();
+    _upNext.clear();
+    _history.clear();
+    _indexById = null;
+    _current = -1;
+    _position = -1;
+    if (_order != null) _resetShuffle(-1);
+  }
+
+  int indexOf(String id) {
+    final indexById = _indexById ??= () {
+      final map = <String, int>{};
+      for (int i = 0; i < _ids.length; i++) {
+        map.putIfAbsent(_ids[i], () => i);
+      }
+      return map;
+    }();
+    final index = indexById[id];
+    return index == null || _removed.contains(index) ? -1 : index;
+  }
+
+  // Thêm vào cuối hàng đợi. Khi shuffle, vị trí mới nằm trong phần hoán vị chưa
+  // cố định nên sẽ được xáo ngẫu nhiên cùng các bài chưa phát.
+  int enqueue(String id) {
+    final index = _append(id);
+    _order?.add(index);
+    return index;
+  }
+
+  // Phát ngay sau bài hiện tại
+  int enqueueNext(String id) {
+    final index = _append(id);
+    _detached.add(index);
+    _upNext.addFirst(index);
+    return index;
+  }
+
+  int _append(String id) {
+    final index = _ids.length;
+    _ids.add(id);
+    _indexById?.putIfAbsent(id, () => index);
+    return index;
+  }
+
+  void remove(int index) {
+    if (index < 0 || index >= _ids.length) return;
+    _removed.add(index);
+  }
+
+  // Người dùng chọn trực tiếp một bài
+  bool jumpTo(int index) {
+    if (index < 0 || index >= _ids.length || _removed.contains(index)) return false;
+    _pushHistory();
+    _current = index;
+    if (_order != null) {
+      // Bắt đầu vòng shuffle mới từ bài được chọn
+      _resetShuffle(index);
+      _position = 0;
+    } else {
+      _position = index;
+    }
+    return true;
+  }
+
+  void setShuffle(bool enabled) {
+    if (enabled == isShuffled) return;
+    if (enabled) {
+      _resetShuffle(_current);
+      _position = _current >= 0 ? 0 : -1;
+    } else {
+      _order = null;
+      _position = _current;
+    }
+  }
+
+  // Bài sẽ phát tiếp theo mà không chuyển bài (dùng để nạp trước)
+  int? peekNext({bool wrap = false}) {
+    for (final index in _upNext) {
+      if (!_removed.contains(index)) return index;
+    }
+    final position = _nextPosition(_position, wrap);
+    return position == null ? null : _slotAt(position);
+  }
+
+  // Chuyển sang bài tiếp theo, trả về index hoặc null nếu đã hết hàng đợi
+  int? advance({bool wrap = false}) {
+    while (_upNext.isNotEmpty) {
+      final index = _upNext.removeFirst();
+      if (_removed.contains(index)) continue;
+      _pushHistory();
+      _current = index; // Không đổi _position: sau đó tiếp tục thứ tự thường
+      return index;
+    }
+    final position = _nextPosition(_position, wrap);
+    if (position == null) return null;
+    _pushHistory();
+    _position = position;
+    _current = _slotAt(position);
+    return _current;
+  }
+
+  // Quay lại bài đã phát trước đó; nếu không còn lịch sử thì lùi theo thứ tự phát
+  int? previous({bool wrap = false}) {
+    while (_history.isNotEmpty) {
+      final entry = _history.removeLast();
+      if (_removed.contains(entry.index)) continue;
+      _current = entry.index;
+      if (_order == null) {
+        if (!_detached.contains(entry.index)) _position = entry.index;
+      } else if (entry.position >= 0 &&
+          entry.position < _orderLength &&
+          _slotAt(entry.position) == entry.index) {
+        _position = entry.position;
+      }
+      return _current;
+    }
+
+    final position = _previousPosition(_position, wrap);
+    if (position == null) return null;
+    _position = position;
+    _current = _slotAt(position);
+    return _current;
+  }
+
+  void _pushHistory() {
+    if (_current < 0) return;
+    _history.addLast((index: _current, position: _position));
+    if (_history.length > maxHistory) _history.removeFirst();
+  }
+
+  // Hoán vị mới, bài [first] (nếu có) đứng đầu
+  void _resetShuffle(int first) {
+    final order = List<int>.generate(_ids.length, (i) => i);
+    _shuffledUntil = -1;
+    if (first >= 0) {
+      order[first] = 0;
+      order[0] = first;
+      _shuffledUntil = 0;
+    }
+    _order = order;
+  }
+
+  // Index trong _ids của vị trí phát [position], cố định thêm hoán vị nếu cần
+  int _slotAt(int position) {
+    final order = _order;
+    if (order == null) return position;
+    while (_shuffledUntil < position) {
+      _shuffledUntil++;
+      final j = _shuffledUntil + _random.nextInt(order.length - _shuffledUntil);
+      final swap = order[_shuffledUntil];
+      order[_shuffledUntil] = order[j];
+      order[j] = swap;
+    }
+    return order[position];
+  }
+
+  // Số vị trí trong thứ tự phát (hoán vị shuffle không chứa bài "phát tiếp theo")
+  int get _orderLength => _order?.length ?? _ids.length;
+
+  int? _nextPosition(int from, bool wrap) {
+    final n = _orderLength;
+    int position = from;
+    for (int step = 0; step < n; step++) {
+      position++;
+      if (position >= n) {
+        if (!wrap) return null;
+        position = 0;
+      }
+      if (isPlayable(_slotAt(position))) return position;
+    }
+    return null;
+  }
+
+  int? _previousPosition(int from, bool wrap) {
+    final n = _orderLength;
+    int position = from >= 0 ? from : (wrap ? n : 0);
+    for (int step = 0; step < n; step++) {
+      position--;
+      if (position < 0) {
+        if (!wrap) return null;
+        position = n - 1;
+      }
+      if (isPlayable(_slotAt(position))) return position;
+    }
+    return null;
+  }
+}
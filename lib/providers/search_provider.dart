@@ -1,38 +1,66 @@
+import 'dart:async';
 import 'package:flutter/material.dart';
-import '../models/song.dart';
+import '../models/song_summary.dart';
+import '../service/search_index.dart';
 import 'dart:collection';
 
 class SearchProvider extends ChangeNotifier {
-  List<Song> _allSongs = [];
-  List<Song> _filteredSongs = [];
+  // Thời gian chờ sau phím cuối cùng trước khi lọc lại danh sách
+  final Duration debounce;
+
+  SearchProvider({this.debounce = const Duration(milliseconds: 150)});
+
+  List<SongSummary> _allSongs = [];
+  List<SongSummary> _filteredSongs = [];
+  SearchIndex _index = SearchIndex(const []);
   String _searchQuery = "";
+  String _appliedQuery = "";
+  Timer? _debounceTimer;
 
-  List<Song> get allSongs => UnmodifiableListView(_allSongs);
-  List<Song> get filteredSongs => UnmodifiableListView(_filteredSongs);
+  List<SongSummary> get allSongs => UnmodifiableListView(_allSongs);
+  List<SongSummary> get filteredSongs => UnmodifiableListView(_filteredSongs);
+  String get searchQuery => _searchQuery;
 
-  void setSongs(List<Song> songs) {
+  void setSongs(List<SongSummary> songs) {
     if (_allSongs != songs) {
       _allSongs = songs;
+      // Dựng chỉ mục một lần cho mỗi danh sách bài hát
+      _index = SearchIndex(songs);
       _filterSongs();
       notifyListeners();
     }
   }
 
   void updateSearchQuery(String query) {
-    if (_searchQuery != query) {
-      _searchQuery = query;
-      _filterSongs();
-      notifyListeners();
+    if (_searchQuery == query) return;
+    _searchQuery = query;
+    _debounceTimer?.cancel();
+
+    // Phím đầu tiên và thao tác xoá được áp dụng ngay, các phím tiếp theo chờ debounce
+    if (query.trim().isEmpty || _appliedQuery.trim().isEmpty || debounce == Duration.zero) {
+      _applyQuery();
+    } else {
+      _debounceTimer = Timer(debounce, _applyQuery);
     }
   }
 
+  void _applyQuery() {
+    _filterSongs();
+    notifyListeners();
+  }
+
   void _filterSongs() {
-    if (_searchQuery.isEmpty) {
+    _appliedQuery = _searchQuery;
+    if (_searchQuery.trim().isEmpty) {
       _filteredSongs = _allSongs;
     } else {
-      _filteredSongs = _allSongs
-          .where((song) => song.title.toLowerCase().contains(_searchQuery.toLowerCase()))
-          .toList();
+      _filteredSongs = _index.search(_searchQuery).map((i) => _allSongs[i]).toList();
     }
   }
+
+  @override
+  void dispose() {
+    _debounceTimer?.cancel();
+    super.dispose();
+  }
 }
@@ -1,7 +1,9 @@
-import 'package:app_music/service/album_service.dart';
+import 'package:app_music/service/catalog_repository.dart';
 import 'package:flutter/material.dart';
 import 'package:intl/intl.dart';
 import '../models/album.dart';
+import '../providers/paged_data_source.dart';
+import '../widgets/cover_image.dart';
 
 class AlbumListScreen extends StatefulWidget {
   const AlbumListScreen({super.key});
@@ -11,19 +13,26 @@ class AlbumListScreen extends StatefulWidget {
 }
 
 class _AlbumListScreenState extends State<AlbumListScreen> {
-  late Future<List<Album>> futureAlbums;
+  final CatalogRepository _repository = CatalogRepository();
+  late final PagedDataSource<Album> _albums = PagedDataSource<Album>(
+    fetchPage: (cursor, forceRefresh) => _repository.fetchAlbumsPage(
+      cursor: cursor,
+      forceRefresh: forceRefresh,
+    ),
+  );
+
+  static const int prefetchAhead = 6;
 
   @override
   void initState() {
     super.initState();
-    futureAlbums = AlbumService().fetchAlbums();
+    _albums.loadFirstPage();
   }
 
-  // Hàm làm mới danh sách album
-  Future<void> _refreshAlbums() async {
-    setState(() {
-      futureAlbums = AlbumService().fetchAlbums();
-    });
+  @override
+  void dispose() {
+    _albums.dispose();
+    super.dispose();
   }
 
   @override
@@ -33,37 +42,56 @@ class _AlbumListScreenState extends State<AlbumListScreen> {
         title: const Text('Album List'),
       ),
       body: RefreshIndicator(
-        onRefresh: _refreshAlbums,
-        child: FutureBuilder<List<Album>>(
-          future: futureAlbums,
-          builder: (context, snapshot) {
-            if (snapshot.connectionState == ConnectionState.waiting) {
-              return const Center(child: CircularProgressIndicator());
-            } else if (snapshot.hasError) {
-              return Center(child: Text('Error: ${snapshot.error}'));
-            } else if (!snapshot.hasData || snapshot.data!.isEmpty) {
-              return const Center(child: Text('No albums found'));
+        // Hàm làm mới danh sách album
+        onRefresh: _albums.refresh,
+        child: AnimatedBuilder(
+          animation: _albums,
+          builder: (context, child) {
+            if (_albums.itemCount == 0) {
+              if (_albums.error != null) {
+                return Center(child: Text('Error: ${_albums.error}'));
+              }
+              return _albums.hasMore
+                  ? const Center(child: CircularProgressIndicator())
+                  : const Center(child: Text('No albums found'));
             }
 
-            final albums = snapshot.data!;
             return ListView.builder(
-              itemCount: albums.length,
+              itemCount: _albums.itemCount + (_albums.hasMore ? 1 : 0),
               itemBuilder: (context, index) {
-                final album = albums[index];
+                if (index >= _albums.itemCount) {
+                  return _albums.error != null
+                      ? Center(
+                    child: TextButton(
+                      onPressed: _albums.retry,
+                      child: const Text('Thử lại'),
+                    ),
+                  )
+                      : const Padding(
+                    padding: EdgeInsets.all(16.0),
+                    child: Center(child: CircularProgressIndicator()),
+                  );
+                }
+
+                final album = _albums.itemAt(index);
+                // Tải trước ảnh bìa của các album sắp cuộn tới
+                CoverImage.prefetch(context, _albums.peek(index + prefetchAhead)?.coverImageURL, width: 50, height: 50);
+                if (album == null) {
+                  // Trang đang được tải lại
+                  return const Card(
+                    margin: EdgeInsets.all(8.0),
+                    child: ListTile(leading: Icon(Icons.album, size: 50)),
+                  );
+                }
                 return Card(
                   margin: const EdgeInsets.all(8.0),
                   child: ListTile(
-                    leading: album.coverImageURL != null
-                        ? Image.network(
-                      album.coverImageURL!,
+                    leading: CoverImage(
+                      url: album.coverImageURL,
                       width: 50,
                       height: 50,
-                      fit: BoxFit.cover,
-                      errorBuilder: (context, error, stackTrace) {
-                        return const Icon(Icons.album, size: 50);
-                      },
-                    )
-                        : const Icon(Icons.album, size: 50),
+                      placeholderIcon: Icons.album,
+                    ),
                     title: Text(album.title),
                     subtitle: Column(
                       crossAxisAlignment: CrossAxisAlignment.start,
@@ -85,4 +113,4 @@ class _AlbumListScreenState extends State<AlbumListScreen> {
       ),
     );
   }
-}
\ No newline at end of file
+}
@@ -1,146 +1,185 @@
 import 'package:flutter/material.dart';
 import 'package:provider/provider.dart';
-import 'package:cached_network_image/cached_network_image.dart';
 import '../models/genre.dart';
+import '../models/song.dart';
+import '../models/song_summary.dart';
 import '../providers/audio_provider.dart';
+import '../service/catalog_repository.dart';
+import '../widgets/cover_image.dart';
+
+class GenreDetailScreen extends StatefulWidget {
+  // Dùng bởi integration benchmark để cuộn danh sách bài hát
+  static const Key songListKey = Key('genre_song_list');
 
-class GenreDetailScreen extends StatelessWidget {
   final Genre genre;
 
   const GenreDetailScreen({super.key, required this.genre});
 
   @override
-  Widget build(BuildContext context) {
+  State<GenreDetailScreen> createState() => _GenreDetailScreenState();
+}
+
+class _GenreDetailScreenState extends State<GenreDetailScreen> {
+  late List<Song> _songs;
+  // Id các bài của thể loại, dựng một lần khi mở màn hình và dùng lại cho mọi lần chạm
+  late List<String> _queueIds;
+
+  @override
+  void initState() {
+    super.initState();
+    _load();
+  }
+
+  @override
+  void didUpdateWidget(GenreDetailScreen oldWidget) {
+    super.didUpdateWidget(oldWidget);
+    if (!identical(oldWidget.genre, widget.genre)) _load();
+  }
+
+  void _load() {
+    _songs = widget.genre.songs ?? const <Song>[];
+    CatalogRepository().registerSongs(_songs.map(SongSummary.fromSong).toList());
+    _queueIds = List.unmodifiable(_songs.map((song) => song.id));
+  }
+
+  void _playFrom(int index, String message) {
     final audioProvider = Provider.of<AudioProvider>(context, listen: false);
+    audioProvider.setQueueIds(_queueIds);
+    audioProvider.playSong(index);
+    ScaffoldMessenger.of(context).showSnackBar(
+      SnackBar(content: Text(message)),
+    );
+  }
 
-    // Thiết lập danh sách bài hát cho AudioProvider
-    final songsForProvider = (genre.songs ?? []).map((song) {
-      return {
-        'songUrl': song.url ?? '',
-        'title': song.title,
-        'artist': song.artist?.title ?? 'Unknown Artist',
-        'imagePath': song.coverImage ?? 'default_image_url',
-      };
-    }).toList();
+  @override
+  Widget build(BuildContext context) {
+    final genre = widget.genre;
+    final songs = _songs;
 
     return Scaffold(
       appBar: AppBar(
         title: Text(genre.title ?? 'Unknown Genre'),
         backgroundColor: Colors.grey[100],
       ),
-      body: SingleChildScrollView(
-        child: Padding(
-          padding: const EdgeInsets.all(16.0),
-          child: Column(
-            crossAxisAlignment: CrossAxisAlignment.start,
-            children: [
-              // Ảnh bìa thể loại
-              if (genre.coverImage != null)
-                Center(
-                  child: ClipRRect(
-                    borderRadius: BorderRadius.circular(12),
-                    child: CachedNetworkImage(
-                      imageUrl: genre.coverImage!,
-                      width: 200,
-                      height: 200,
-                      fit: BoxFit.cover,
-                      placeholder: (context, url) => const CircularProgressIndicator(),
-                      errorWidget: (context, url, error) => const Icon(Icons.album, size: 100),
+      // Chỉ dựng các bài hát đang hiển thị, thể loại có hàng nghìn bài vẫn mở ngay
+      body: CustomScrollView(
+        key: GenreDetailScreen.songListKey,
+        slivers: [
+          SliverPadding(
+            padding: const EdgeInsets.fromLTRB(16, 16, 16, 12),
+            sliver: SliverToBoxAdapter(
+              child: Column(
+                crossAxisAlignment: CrossAxisAlignment.start,
+                children: [
+                  // Ảnh bìa thể loại
+                  if (genre.coverImage != null)
+                    Center(
+                      child: ClipRRect(
+                        borderRadius: BorderRadius.circular(12),
+                        child: CoverImage(
+                          url: genre.coverImage,
+                          width: 200,
+                          height: 200,
+                          placeholderIcon: Icons.album,
+                        ),
+                      ),
+                    ),
+                  const SizedBox(height: 16),
+
+                  // Tiêu đề
+                  Text(
+                    genre.title ?? 'Unknown Genre',
+                    style: const TextStyle(
+                      fontSize: 24,
+                      fontWeight: FontWeight.bold,
+                      color: Colors.black87,
                     ),
                   ),
-                ),
-              const SizedBox(height: 16),
-
-              // Tiêu đề
-              Text(
-                genre.title ?? 'Unknown Genre',
-                style: const TextStyle(
-                  fontSize: 24,
-                  fontWeight: FontWeight.bold,
-                  color: Colors.black87,
-                ),
-              ),
 
-              // Mô tả
-              if (genre.description != null && genre.description!.isNotEmpty) ...[
-                const SizedBox(height: 8),
-                Text(
-                  genre.description!,
-                  style: const TextStyle(
-                    fontSize: 16,
-                    color: Colors.black54,
+                  // Mô tả
+                  if (genre.description != null && genre.description!.isNotEmpty) ...[
+                    const SizedBox(height: 8),
+                    Text(
+                      genre.description!,
+                      style: const TextStyle(
+                        fontSize: 16,
+                        color: Colors.black54,
+                      ),
+                    ),
+                  ],
+                  const SizedBox(height: 24),
+
+                  // Nút phát tất cả
+                  if (songs.isNotEmpty)
+                    ElevatedButton.icon(
+                      onPressed: () => _playFrom(0, 'Playing all songs in ${genre.title ?? 'Unknown Genre'}'),
+                      icon: const Icon(Icons.play_arrow),
+                      label: const Text('Play All'),
+                      style: ElevatedButton.styleFrom(
+                        backgroundColor: const Color(0xFFA6B9FF),
+                        foregroundColor: Colors.white,
+                      ),
+                    ),
+                  const SizedBox(height: 16),
+
+                  // Danh sách bài hát
+                  const Text(
+                    'Songs',
+                    style: TextStyle(
+                      fontSize: 20,
+                      fontWeight: FontWeight.bold,
+                      color: Colors.black87,
+                    ),
                   ),
-                ),
-              ],
-              const SizedBox(height: 24),
-
-              // Nút phát tất cả
-              if (genre.songs != null && genre.songs!.isNotEmpty)
-                ElevatedButton.icon(
-                  onPressed: () {
-                    audioProvider.setSongs(songsForProvider);
-                    audioProvider.playSong(0); // Phát bài đầu tiên
-                    ScaffoldMessenger.of(context).showSnackBar(
-                      SnackBar(content: Text('Playing all songs in ${genre.title ?? 'Unknown Genre'}')),
+                ],
+              ),
+            ),
+          ),
+          if (songs.isEmpty)
+            const SliverToBoxAdapter(
+              child: Center(child: Text('No songs available')),
+            )
+          else
+            SliverPadding(
+              padding: const EdgeInsets.fromLTRB(16, 0, 16, 16),
+              // Các dòng cao bằng nhau: đo một lần theo prototype, cuộn nhanh không cần dựng các dòng phía trên
+              sliver: SliverPrototypeExtentList(
+                prototypeItem: _GenreSongTile(song: songs.first, onTap: () {}),
+                delegate: SliverChildBuilderDelegate(
+                  (context, index) {
+                    final song = songs[index];
+                    return _GenreSongTile(
+                      key: ValueKey(song.id),
+                      song: song,
+                      onTap: () => _playFrom(index, 'Playing: ${song.title}'),
                     );
                   },
-                  icon: const Icon(Icons.play_arrow),
-                  label: const Text('Play All'),
-                  style: ElevatedButton.styleFrom(
-                    backgroundColor: const Color(0xFFA6B9FF),
-                    foregroundColor: Colors.white,
-                  ),
-                ),
-              const SizedBox(height: 16),
-
-              // Danh sách bài hát
-              Text(
-                'Songs',
-                style: const TextStyle(
-                  fontSize: 20,
-                  fontWeight: FontWeight.bold,
-                  color: Colors.black87,
+                  childCount: songs.length,
                 ),
               ),
-              const SizedBox(height: 12),
-              genre.songs == null || genre.songs!.isEmpty
-                  ? const Center(child: Text('No songs available'))
-                  : ListView.builder(
-                shrinkWrap: true,
-                physics: const NeverScrollableScrollPhysics(),
-                itemCount: genre.songs!.length,
-                itemBuilder: (context, index) {
-                  final song = genre.songs![index];
-                  return Card(
-                    margin: const EdgeInsets.symmetric(vertical: 8.0),
-                    child: ListTile(
-                      leading: song.coverImage != null
-                          ? CachedNetworkImage(
-                        imageUrl: song.coverImage!,
-                        width: 50,
-                        height: 50,
-                        fit: BoxFit.cover,
-                        placeholder: (context, url) => const CircularProgressIndicator(),
-                        errorWidget: (context, url, error) => const Icon(Icons.music_note, size: 50),
-                      )
-                          : const Icon(Icons.music_note, size: 50),
-                      title: Text(song.title),
-                      subtitle: Text(song.artist?.title ?? 'Unknown Artist'),
-                      onTap: () {
-                        audioProvider.setSongs(songsForProvider);
-                        audioProvider.playSong(index);
-                        ScaffoldMessenger.of(context).showSnackBar(
-                          SnackBar(content: Text('Playing: ${song.title}')),
-                        );
-                      },
-                    ),
-                  );
-                },
-              ),
-            ],
-          ),
-        ),
+            ),
+        ],
+      ),
+    );
+  }
+}
+
+class _GenreSongTile extends StatelessWidget {
+  final Song song;
+  final VoidCallback onTap;
+
+  const _GenreSongTile({super.key, required this.song, required this.onTap});
+
+  @override
+  Widget build(BuildContext context) {
+    return Card(
+      margin: const EdgeInsets.symmetric(vertical: 8.0),
+      child: ListTile(
+        leading: CoverImage(url: song.coverImage, width: 50, height: 50),
+        title: Text(song.title, maxLines: 1, overflow: TextOverflow.ellipsis),
+        subtitle: Text(song.artist?.title ?? 'Unknown Artist', maxLines: 1, overflow: TextOverflow.ellipsis),
+        onTap: onTap,
       ),
     );
   }
-}
\ No newline at end of file
+}
@@ -1,17 +1,15 @@
-import 'dart:convert';
-import 'package:flutter/foundation.dart';
 import 'package:flutter/material.dart';
 import 'package:provider/provider.dart';
-import 'package:shared_preferences/shared_preferences.dart';
 import '../models/album.dart';
-import '../models/song.dart';
+import '../models/song_summary.dart';
 import '../models/user.dart';
-import '../service/song_service.dart';
-import '../service/user_service.dart';
-import '../service/album_service.dart';
+import '../service/startup_coordinator.dart';
+import '../utils/app_log.dart';
+import '../utils/startup_timeline.dart';
 import '../widgets/song_card.dart';
 import '../widgets/album_card.dart';
 import '../widgets/artist_card.dart';
+import '../widgets/cover_image.dart';
 import '../providers/audio_provider.dart';
 import '../providers/search_provider.dart';
 import '../providers/artist_provider.dart';
@@ -28,13 +26,18 @@ class HomeScreen extends StatefulWidget {
 }
 
 class _HomeScreenState extends State<HomeScreen> {
-  String _username = "Loading...";
+  final StartupCoordinator _startup = StartupCoordinator();
   List<Album> _albums = [];
+  // Danh sách "Recommended Songs" đang hiển thị, tách khỏi hàng đợi phát
+  List<SongSummary> _songs = [];
+  List<String> _queueIds = const [];
+  Map<String, int> _indexById = const {};
   final TextEditingController _searchController = TextEditingController();
 
   @override
   void initState() {
     super.initState();
+    _startup.refreshedSongs.addListener(_onSongsRefreshed);
     WidgetsBinding.instance.addPostFrameCallback((_) {
       _loadData();
     });
@@ -42,37 +45,15 @@ class _HomeScreenState extends State<HomeScreen> {
 
   @override
   void dispose() {
+    _startup.refreshedSongs.removeListener(_onSongsRefreshed);
     _searchController.dispose();
     super.dispose();
   }
 
-  Future<User?> _loadUserFromPreferences() async {
-    final prefs = await SharedPreferences.getInstance();
-    final userJson = prefs.getString('user_data');
-    if (userJson != null) {
-      final userMap = jsonDecode(userJson) as Map<String, dynamic>;
-      return User.fromJson(userMap);
-    }
-    return null;
-  }
-
-  Future<User?> _fetchUser() async {
-    const String baseUrl = "http://10.0.2.2:8080";
-    final userService = UserService(baseUrl: baseUrl);
-    User? user = await userService.getCurrentUser();
-
-    if (user == null) {
-      debugPrint("User is null from API. Trying to load from SharedPreferences.");
-      user = await _loadUserFromPreferences();
-    }
-
-    return user;
-  }
-
-  Future<void> _loadData() async {
+  Future<void> _loadData({bool forceRefresh = false}) async {
     try {
-      // Lấy thông tin người dùng
-      User? user = await _fetchUser();
+      // Người dùng đã được khôi phục từ máy khi khởi động, không chờ server
+      User? user = await _startup.currentUser();
 
       if (user == null) {
         if (mounted) {
@@ -84,77 +65,70 @@ class _HomeScreenState extends State<HomeScreen> {
         return;
       }
 
-      // Lấy dữ liệu bài hát và album
-      final songService = SongService();
-      final albumService = AlbumService();
+      // Dữ liệu đã được bắt đầu tải song song từ lúc mở ứng dụng
       final artistProvider = Provider.of<ArtistProvider>(context, listen: false);
-      final audioProvider = Provider.of<AudioProvider>(context, listen: false);
-      final searchProvider = Provider.of<SearchProvider>(context, listen: false);
-
-      List<Song> fetchedSongs = [];
-      List<Album> fetchedAlbums = [];
-
-      try {
-        fetchedSongs = await songService.fetchSongs();
-      } catch (e) {
-        debugPrint("Failed to fetch songs: $e");
-      }
-
-      try {
-        fetchedAlbums = await albumService.fetchAlbums();
-      } catch (e) {
-        debugPrint("Failed to fetch albums: $e");
-      }
-
-      try {
-        await artistProvider.fetchArtists();
-      } catch (e) {
-        debugPrint("Failed to fetch artists: $e");
+      if (forceRefresh || (artistProvider.artists.isEmpty && !artistProvider.isLoading)) {
+        artistProvider.fetchArtists(forceRefresh: forceRefresh);
       }
+      final catalog = await _startup.loadCatalog(forceRefresh: forceRefresh);
+      if (!mounted) return;
 
       // Cập nhật state
       setState(() {
-        _username = user.firstName.trim().isNotEmpty
-            ? user.firstName
-            : (user.email.trim().isNotEmpty
-            ? user.email
-            : "User");
-        _albums = fetchedAlbums;
+        _albums = catalog.albums;
       });
 
-      // Cập nhật AudioProvider với tên ca sĩ từ ArtistProvider
-      final songsForProvider = fetchedSongs.map((song) {
-        String artistName;
-        if (song.artist == null) {
-          artistName = 'Unknown Artist';
-        } else {
-          artistName = artistProvider.getArtistNameById(song.artist!.id);
-        }
-        return {
-          'songUrl': song.url ?? '',
-          'title': song.title,
-          'artist': artistName,
-          'imagePath': song.coverImage ?? 'default_image_url',
-        };
-      }).toList();
-
-      audioProvider.setSongs(songsForProvider);
-      searchProvider.setSongs(fetchedSongs);
+      _applySongs(catalog.songs);
+      StartupTimeline.mark('home_data_ready');
     } catch (e) {
-      debugPrint("Unexpected error loading data: $e");
-      setState(() {
-        _username = "User";
-      });
+      AppLog.e('HomeScreen', "Unexpected error loading data", e);
+      if (!mounted) return;
       ScaffoldMessenger.of(context).showSnackBar(
         SnackBar(content: Text("Unexpected error: $e")),
       );
-      if (mounted) {
-        Navigator.pushReplacement(
-          context,
-          MaterialPageRoute(builder: (context) => const LoginScreen()),
-        );
-      }
+      Navigator.pushReplacement(
+        context,
+        MaterialPageRoute(builder: (context) => const LoginScreen()),
+      );
+    }
+  }
+
+  // Cache bài hát được làm mới ở nền sau khi trang chủ đã hiển thị
+  void _onSongsRefreshed() {
+    final songs = _startup.refreshedSongs.value;
+    if (songs != null && mounted) _applySongs(songs);
+  }
+
+  String _displayName(User? user) {
+    if (user == null) return "Loading...";
+    return user.firstName.trim().isNotEmpty
+        ? user.firstName
+        : (user.email.trim().isNotEmpty ? user.email : "User");
+  }
+
+  // Cập nhật danh sách hiển thị và chỉ mục tìm kiếm. Hàng đợi phát chỉ được thay khi
+  // người dùng chọn một bài, để lần làm mới ở nền không cắt ngang bài đang phát
+  // hay thay hàng đợi người dùng đã chọn ở màn hình khác.
+  void _applySongs(List<SongSummary> fetchedSongs) {
+    final searchProvider = Provider.of<SearchProvider>(context, listen: false);
+    searchProvider.setSongs(fetchedSongs);
+
+    final indexById = <String, int>{};
+    for (int i = 0; i < fetchedSongs.length; i++) {
+      indexById.putIfAbsent(fetchedSongs[i].id, () => i);
     }
+    setState(() {
+      _songs = fetchedSongs;
+      _queueIds = List.unmodifiable(fetchedSongs.map((song) => song.id));
+      _indexById = indexById;
+    });
+  }
+
+  // Bài hát đã có trong CatalogRepository (fetchSongs), chỉ cần truyền id
+  void _playFrom(int index) {
+    final audioProvider = Provider.of<AudioProvider>(context, listen: false);
+    audioProvider.setQueueIds(_queueIds);
+    audioProvider.playSong(index);
   }
 
   void _navigateToSearch() {
@@ -172,11 +146,8 @@ class _HomeScreenState extends State<HomeScreen> {
   @override
   Widget build(BuildContext context) {
     final searchProvider = Provider.of<SearchProvider>(context);
-    final audioProvider = Provider.of<AudioProvider>(context);
-    final artistProvider = Provider.of<ArtistProvider>(context);
     final isSearching = _searchController.text.isNotEmpty;
     final filteredSongs = searchProvider.filteredSongs;
-    final recommendedSongs = audioProvider.songs;
 
     return Scaffold(
       backgroundColor: Colors.grey[100],
@@ -187,10 +158,16 @@ class _HomeScreenState extends State<HomeScreen> {
           children: [
             const Icon(Icons.music_note, color: Color(0xFFA6B9FF), size: 30),
             const SizedBox(width: 8),
-            Text(
-              "Hi, $_username",
-              style: const TextStyle(fontSize: 24, color: Colors.black),
-              semanticsLabel: "Hi, $_username",
+            ValueListenableBuilder<User?>(
+              valueListenable: _startup.user,
+              builder: (context, user, child) {
+                final username = _displayName(user);
+                return Text(
+                  "Hi, $username",
+                  style: const TextStyle(fontSize: 24, color: Colors.black),
+                  semanticsLabel: "Hi, $username",
+                );
+              },
             ),
           ],
         ),
@@ -199,160 +176,114 @@ class _HomeScreenState extends State<HomeScreen> {
       ),
       body: Consumer<ArtistProvider>(
         builder: (context, artistProvider, child) {
-          if (artistProvider.isLoading) {
-            return const Center(child: CircularProgressIndicator());
-          }
           return RefreshIndicator(
-            onRefresh: _loadData,
-            child: SingleChildScrollView(
-              child: Padding(
-                padding: const EdgeInsets.all(16.0),
-                child: Column(
-                  crossAxisAlignment: CrossAxisAlignment.start,
-                  children: [
-                    // Thanh tìm kiếm
-                    Container(
-                      padding: const EdgeInsets.symmetric(horizontal: 16, vertical: 8),
-                      decoration: BoxDecoration(
-                        color: Colors.white,
-                        borderRadius: BorderRadius.circular(30),
-                        boxShadow: [
-                          BoxShadow(
-                            color: Colors.black.withOpacity(0.1),
-                            blurRadius: 8,
-                            offset: const Offset(0, 2),
-                          ),
-                        ],
+            onRefresh: () => _loadData(forceRefresh: true),
+            // Danh sách bài hát được dựng theo từng dòng khi cuộn tới, không dựng trước cả catalog
+            child: CustomScrollView(
+              slivers: [
+                SliverPadding(
+                  padding: const EdgeInsets.all(16.0),
+                  sliver: SliverMainAxisGroup(
+                    slivers: [
+                      SliverToBoxAdapter(
+                        child: Padding(
+                          padding: const EdgeInsets.only(bottom: 24),
+                          child: _buildSearchBar(searchProvider),
+                        ),
                       ),
-                      child: TextField(
-                        controller: _searchController,
-                        decoration: InputDecoration(
-                          hintText: "Search music",
-                          hintStyle: const TextStyle(color: Colors.grey),
-                          border: InputBorder.none,
-                          icon: const Icon(Icons.search, color: Color(0xFFA6B9FF)),
-                          suffixIcon: _searchController.text.isNotEmpty
-                              ? IconButton(
-                            icon: const Icon(Icons.clear, color: Colors.grey),
-                            onPressed: () {
-                              _searchController.clear();
-                              searchProvider.updateSearchQuery("");
+                      if (isSearching) ...[
+                        SliverToBoxAdapter(
+                          child: Padding(
+                            padding: const EdgeInsets.only(bottom: 12),
+                            child: _buildSectionHeader("Search Results", onViewAll: () {}),
+                          ),
+                        ),
+                        filteredSongs.isEmpty
+                            ? const SliverToBoxAdapter(child: Center(child: Text("No results found")))
+                            : SliverList(
+                          delegate: SliverChildBuilderDelegate(
+                            (context, index) {
+                              final song = filteredSongs[index];
+                              final artistName = song.artistName ?? artistProvider.getArtistNameById(song.artistId);
+                              final songIndex = _indexById[song.id] ?? -1;
+                              return Padding(
+                                key: ValueKey(song.id),
+                                padding: const EdgeInsets.only(bottom: 8.0),
+                                child: SongCard(
+                                  imagePath: song.coverImage ?? '',
+                                  title: song.title,
+                                  artist: artistName,
+                                  songUrl: song.url ?? '',
+                                  index: songIndex,
+                                  onPlay: songIndex < 0 ? null : () => _playFrom(songIndex),
+                                ),
+                              );
                             },
-                          )
-                              : null,
+                            childCount: filteredSongs.length,
+                          ),
                         ),
-                        onChanged: (value) {
-                          searchProvider.updateSearchQuery(value);
-                        },
-                        onSubmitted: (_) => _navigateToSearch(),
-                      ),
-                    ),
-                    const SizedBox(height: 24),
+                      ] else ...[
+                        SliverToBoxAdapter(
+                          child: Column(
+                            crossAxisAlignment: CrossAxisAlignment.start,
+                            children: [
+                              _buildSectionHeader("Popular Albums", onViewAll: () {
+                                Navigator.push(
+                                  context,
+                                  MaterialPageRoute(builder: (context) => const AlbumListScreen()),
+                                );
+                              }),
+                              const SizedBox(height: 12),
+                              _buildAlbumRow(),
+                              const SizedBox(height: 24),
 
-                    if (isSearching) ...[
-                      _buildSectionHeader("Search Results", onViewAll: () {}),
-                      const SizedBox(height: 12),
-                      filteredSongs.isEmpty
-                          ? const Center(child: Text("No results found"))
-                          : Column(
-                        children: filteredSongs.map((song) {
-                          final artistName = song.artist != null
-                              ? artistProvider.getArtistNameById(song.artist!.id)
-                              : 'Unknown Artist';
-                          return Padding(
-                            padding: const EdgeInsets.only(bottom: 8.0),
-                            child: SongCard(
-                              imagePath: song.coverImage ?? 'default_image_url',
-                              title: song.title,
-                              artist: artistName,
-                              songUrl: song.url ?? '',
-                              index: audioProvider.songs.indexWhere((s) => s['songUrl'] == song.url),
-                            ),
-                          );
-                        }).toList(),
-                      ),
-                    ] else ...[
-                      _buildSectionHeader("Popular Albums", onViewAll: () {
-                        Navigator.push(
-                          context,
-                          MaterialPageRoute(builder: (context) => const AlbumListScreen()),
-                        );
-                      }),
-                      const SizedBox(height: 12),
-                      SizedBox(
-                        height: 200,
-                        child: _albums.isEmpty
-                            ? const Center(child: Text("No albums available"))
-                            : ListView.separated(
-                          scrollDirection: Axis.horizontal,
-                          itemCount: _albums.length > 5 ? 5 : _albums.length,
-                          separatorBuilder: (context, index) => const SizedBox(width: 12),
-                          itemBuilder: (context, index) {
-                            final album = _albums[index];
-                            return AlbumCard(
-                              imagePath: album.coverImageURL ?? 'https://via.placeholder.com/160x200',
-                              title: album.title,
-                            );
-                          },
-                        ),
-                      ),
-                      const SizedBox(height: 24),
+                              _buildSectionHeader("Popular Artists", onViewAll: () {
+                                // Navigator.push(
+                                //   context,
+                                //   MaterialPageRoute(builder: (context) => const ArtistListScreen()),
+                                // );
+                              }),
+                              const SizedBox(height: 12),
+                              _buildArtistRow(artistProvider),
+                              const SizedBox(height: 24),
 
-                      _buildSectionHeader("Popular Artists", onViewAll: () {
-                        // Navigator.push(
-                        //   context,
-                        //   MaterialPageRoute(builder: (context) => const ArtistListScreen()),
-                        // );
-                      }),
-                      const SizedBox(height: 12),
-                      SizedBox(
-                        height: 120,
-                        child: artistProvider.artists.isEmpty
-                            ? const Center(child: Text("No artists available"))
-                            : ListView.separated(
-                          scrollDirection: Axis.horizontal,
-                          itemCount: artistProvider.artists.length > 5 ? 5 : artistProvider.artists.length,
-                          separatorBuilder: (context, index) => const SizedBox(width: 12),
-                          itemBuilder: (context, index) {
-                            final artist = artistProvider.artists[index];
-                            return ArtistCard(
-                              name: artist.title,
-                              imagePath: artist.avatar ?? 'default_image_url',
-                            );
-                          },
+                              _buildSectionHeader("Recommended Songs", onViewAll: () {
+                                Navigator.push(
+                                  context,
+                                  MaterialPageRoute(builder: (context) => const SongListScreen()),
+                                );
+                              }),
+                              const SizedBox(height: 12),
+                            ],
+                          ),
                         ),
-                      ),
-                      const SizedBox(height: 24),
-
-                      _buildSectionHeader("Recommended Songs", onViewAll: () {
-                        Navigator.push(
-                          context,
-                          MaterialPageRoute(builder: (context) => const SongListScreen()),
-                        );
-                      }),
-                      const SizedBox(height: 12),
-                      recommendedSongs.isEmpty
-                          ? const Center(child: Text("No songs available"))
-                          : Column(
-                        children: recommendedSongs.asMap().entries.map((entry) {
-                          final index = entry.key;
-                          final song = entry.value;
-                          return Padding(
-                            padding: const EdgeInsets.only(bottom: 8.0),
-                            child: SongCard(
-                              imagePath: song['imagePath'] ?? 'default_image_url',
-                              title: song['title'] ?? 'Unknown Title',
-                              artist: song['artist'] ?? 'Unknown Artist',
-                              songUrl: song['songUrl'] ?? '',
-                              index: index,
-                            ),
-                          );
-                        }).toList(),
-                      ),
+                        _songs.isEmpty
+                            ? const SliverToBoxAdapter(child: Center(child: Text("No songs available")))
+                            : SliverList(
+                          delegate: SliverChildBuilderDelegate(
+                            (context, index) {
+                              final song = _songs[index];
+                              return Padding(
+                                key: ValueKey(song.id),
+                                padding: const EdgeInsets.only(bottom: 8.0),
+                                child: SongCard(
+                                  imagePath: song.coverImage ?? '',
+                                  title: song.title,
+                                  artist: song.artistName ?? artistProvider.getArtistNameById(song.artistId),
+                                  songUrl: song.url ?? '',
+                                  index: index,
+                                  onPlay: () => _playFrom(index),
+                                ),
+                              );
+                            },
+                            childCount: _songs.length,
+                          ),
+                        ),
+                      ],
                     ],
-                  ],
+                  ),
                 ),
-              ),
+              ],
             ),
           );
         },
@@ -360,6 +291,98 @@ class _HomeScreenState extends State<HomeScreen> {
     );
   }
 
+  Widget _buildSearchBar(SearchProvider searchProvider) {
+    return Container(
+      padding: const EdgeInsets.symmetric(horizontal: 16, vertical: 8),
+      decoration: BoxDecoration(
+        color: Colors.white,
+        borderRadius: BorderRadius.circular(30),
+        boxShadow: [
+          BoxShadow(
+            color: Colors.black.withOpacity(0.1),
+            blurRadius: 8,
+            offset: const Offset(0, 2),
+          ),
+        ],
+      ),
+      child: TextField(
+        controller: _searchController,
+        decoration: InputDecoration(
+          hintText: "Search music",
+          hintStyle: const TextStyle(color: Colors.grey),
+          border: InputBorder.none,
+          icon: const Icon(Icons.search, color: Color(0xFFA6B9FF)),
+          suffixIcon: _searchController.text.isNotEmpty
+              ? IconButton(
+            icon: const Icon(Icons.clear, color: Colors.grey),
+            onPressed: () {
+              _searchController.clear();
+              searchProvider.updateSearchQuery("");
+            },
+          )
+              : null,
+        ),
+        onChanged: (value) {
+          searchProvider.updateSearchQuery(value);
+        },
+        onSubmitted: (_) => _navigateToSearch(),
+      ),
+    );
+  }
+
+  Widget _buildAlbumRow() {
+    return SizedBox(
+      height: 200,
+      child: _albums.isEmpty
+          ? const Center(child: Text("No albums available"))
+          : ListView.separated(
+        scrollDirection: Axis.horizontal,
+        itemCount: _albums.length > 5 ? 5 : _albums.length,
+        separatorBuilder: (context, index) => const SizedBox(width: 12),
+        itemBuilder: (context, index) {
+          final album = _albums[index];
+          if (index + 1 < _albums.length) {
+            CoverImage.prefetch(context, _albums[index + 1].coverImageURL, width: 160, height: 200);
+          }
+          return AlbumCard(
+            key: ValueKey(album.id),
+            imagePath: album.coverImageURL,
+            title: album.title,
+          );
+        },
+      ),
+    );
+  }
+
+  Widget _buildArtistRow(ArtistProvider artistProvider) {
+    return SizedBox(
+      height: 120,
+      child: artistProvider.artists.isEmpty
+          ? Center(
+              child: artistProvider.isLoading
+                  ? const CircularProgressIndicator()
+                  : const Text("No artists available"),
+            )
+          : ListView.separated(
+        scrollDirection: Axis.horizontal,
+        itemCount: artistProvider.artists.length > 5 ? 5 : artistProvider.artists.length,
+        separatorBuilder: (context, index) => const SizedBox(width: 12),
+        itemBuilder: (context, index) {
+          final artist = artistProvider.artists[index];
+          // Tải trước ảnh của các ca sĩ sắp cuộn vào màn hình
+          for (int ahead = 1; ahead <= 3 && index + ahead < artistProvider.artists.length; ahead++) {
+            CoverImage.prefetch(context, artistProvider.artists[index + ahead].avatar, width: 80, height: 80);
+          }
+          return ArtistCard(
+            key: ValueKey(artist.id),
+            name: artist.title,
+            imagePath: artist.avatar,
+          );
+        },
+      ),
+    );
+  }
+
   Widget _buildSectionHeader(String title, {required VoidCallback onViewAll}) {
     return Row(
       mainAxisAlignment: MainAxisAlignment.spaceBetween,
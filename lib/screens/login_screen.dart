@@ -1,6 +1,7 @@
 import 'package:flutter/material.dart';
-import '../main.dart';
+import '../service/startup_coordinator.dart';
 import '../service/user_service.dart';
+import '../utils/app_log.dart';
 import 'register_screen.dart';
 
 class LoginScreen extends StatefulWidget {
@@ -15,7 +16,7 @@ class _LoginScreenState extends State<LoginScreen> {
   final TextEditingController _passwordController = TextEditingController();
   String? _errorText;
   bool _isLoading = false;
-  final UserService _userService = UserService(baseUrl: 'http://10.0.2.2:8080');
+  final UserService _userService = UserService();
 
   Future<void> _login() async {
     String email = _emailController.text.trim();
@@ -27,18 +28,13 @@ class _LoginScreenState extends State<LoginScreen> {
     });
 
     try {
-      final user = await _userService.login(email: email, password: password);
-      print("Phản hồi từ login: $user"); // Debug phản hồi từ server
-      print("Token đã lưu: ${user['accessToken']}"); // Debug token
+      await _userService.login(email: email, password: password);
+      AppLog.i('LoginScreen', "Đăng nhập thành công");
 
-      if (mounted) {
-        Navigator.pushReplacement(
-          context,
-          MaterialPageRoute(builder: (context) => const MainScreen()),
-        );
-      }
+      // MyApp chuyển sang MainScreen khi StartupCoordinator.signedIn đổi thành true
+      await StartupCoordinator().startSession();
     } catch (e) {
-      print("Lỗi đăng nhập: $e"); // Debug lỗi
+      AppLog.w('LoginScreen', "Lỗi đăng nhập", e);
       setState(() {
         if (e.toString().contains("This email does not exist")) {
           _errorText = "Email not found";
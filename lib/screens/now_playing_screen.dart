@@ -1,6 +1,10 @@
 import 'package:flutter/material.dart';
 import 'package:provider/provider.dart';
+import '../models/song.dart';
 import '../providers/audio_provider.dart'; // Chỉ cần import AudioProvider
+import '../service/catalog_repository.dart';
+import '../utils/rebuild_stats.dart';
+import '../widgets/cover_image.dart';
 
 class NowPlayingScreen extends StatefulWidget {
   const NowPlayingScreen({super.key});
@@ -18,7 +22,9 @@ class _NowPlayingScreenState extends State<NowPlayingScreen> {
 
   @override
   Widget build(BuildContext context) {
-    final audioProvider = Provider.of<AudioProvider>(context);
+    // Từng phần lắng nghe kênh riêng của AudioProvider, màn hình không rebuild theo vị trí phát
+    final audioProvider = Provider.of<AudioProvider>(context, listen: false);
+    RebuildStats.record('NowPlayingScreen');
 
     return Scaffold(
       backgroundColor: Colors.white,
@@ -44,12 +50,11 @@ class _NowPlayingScreenState extends State<NowPlayingScreen> {
                 const SizedBox(height: 20),
                 ClipRRect(
                   borderRadius: BorderRadius.circular(16),
-                  child: Image.network(
-                    songData["imagePath"] ?? 'default_image_url',
-                    width: double.infinity,
+                  child: CoverImage(
+                    url: songData["imagePath"],
+                    width: MediaQuery.of(context).size.width - 40,
                     height: MediaQuery.of(context).size.width - 40,
-                    fit: BoxFit.cover,
-                    errorBuilder: (context, error, stackTrace) => const Icon(Icons.image_not_supported),
+                    placeholderIcon: Icons.image_not_supported,
                   ),
                 ),
                 const SizedBox(height: 20),
@@ -68,6 +73,7 @@ class _NowPlayingScreenState extends State<NowPlayingScreen> {
                     return ValueListenableBuilder<double>(
                       valueListenable: audioProvider.totalTime, // Truy cập trực tiếp
                       builder: (context, totalTime, child) {
+                        RebuildStats.record('NowPlayingScreen.progress');
                         return Column(
                           children: [
                             Slider(
@@ -117,6 +123,14 @@ class _NowPlayingScreenState extends State<NowPlayingScreen> {
                   },
                 ),
                 const SizedBox(height: 20),
+                // Lời bài hát / lượt thích chỉ được tải khi mở màn hình này
+                if (songData["songId"] != null)
+                  Expanded(
+                    child: _SongDetails(
+                      key: ValueKey(songData["songId"]),
+                      songId: songData["songId"]!,
+                    ),
+                  ),
               ],
             ),
           );
@@ -124,4 +138,56 @@ class _NowPlayingScreenState extends State<NowPlayingScreen> {
       ),
     );
   }
+}
+
+class _SongDetails extends StatefulWidget {
+  final String songId;
+
+  const _SongDetails({super.key, required this.songId});
+
+  @override
+  State<_SongDetails> createState() => _SongDetailsState();
+}
+
+class _SongDetailsState extends State<_SongDetails> {
+  // Tạo một lần cho mỗi bài, CatalogRepository giữ lại các bài vừa xem
+  late final Future<Song?> _detail = CatalogRepository().getSongById(widget.songId);
+
+  @override
+  Widget build(BuildContext context) {
+    return FutureBuilder<Song?>(
+      future: _detail,
+      builder: (context, snapshot) {
+        if (snapshot.connectionState != ConnectionState.done) {
+          return const Center(child: CircularProgressIndicator(strokeWidth: 2));
+        }
+        final song = snapshot.data;
+        if (song == null) return const SizedBox.shrink();
+
+        final lyrics = song.lyrics;
+        return SingleChildScrollView(
+          child: Column(
+            crossAxisAlignment: CrossAxisAlignment.start,
+            children: [
+              Row(
+                children: [
+                  const Icon(Icons.favorite, size: 18, color: Color(0xFFA6B9FF)),
+                  const SizedBox(width: 6),
+                  Text('${song.likes?.length ?? 0}', style: const TextStyle(color: Colors.black54)),
+                  const SizedBox(width: 16),
+                  const Icon(Icons.comment, size: 18, color: Color(0xFFA6B9FF)),
+                  const SizedBox(width: 6),
+                  Text('${song.comments?.length ?? 0}', style: const TextStyle(color: Colors.black54)),
+                ],
+              ),
+              if (lyrics != null && lyrics.isNotEmpty) ...[
+                const SizedBox(height: 12),
+                Text(lyrics, style: const TextStyle(fontSize: 16, height: 1.5)),
+              ],
+            ],
+          ),
+        );
+      },
+    );
+  }
 }
\ No newline at end of file
@@ -1,9 +1,8 @@
-import 'dart:convert';
 import 'package:flutter/material.dart';
 import 'package:shared_preferences/shared_preferences.dart';
 import '../screens/login_screen.dart';
-import '../service/user_service.dart';
-import '../models/user.dart';
+import '../service/startup_coordinator.dart';
+import '../utils/app_log.dart';
 
 class ProfileScreen extends StatefulWidget {
   const ProfileScreen({super.key});
@@ -22,26 +21,10 @@ class _ProfileScreenState extends State<ProfileScreen> {
     _loadUserInfo();
   }
 
-  Future<User?> _loadUserFromPreferences() async {
-    final prefs = await SharedPreferences.getInstance();
-    final userJson = prefs.getString('user_data');
-    if (userJson != null) {
-      final userMap = jsonDecode(userJson) as Map<String, dynamic>;
-      return User.fromJson(userMap);
-    }
-    return null;
-  }
-
   Future<void> _loadUserInfo() async {
     try {
-      const String baseUrl = "http://10.0.2.2:8080";
-      final userService = UserService(baseUrl: baseUrl);
-      User? user = await userService.getCurrentUser();
-
-      if (user == null) {
-        debugPrint("User is null from API. Trying to load from SharedPreferences.");
-        user = await _loadUserFromPreferences();
-      }
+      // Dùng người dùng đã được khôi phục khi khởi động thay vì gọi lại API
+      final user = await StartupCoordinator().currentUser();
 
       if (user == null) {
         // Không có dữ liệu user, chuyển hướng đến màn hình đăng nhập
@@ -66,7 +49,7 @@ class _ProfileScreenState extends State<ProfileScreen> {
         _email = nonNullUser.email.trim().isNotEmpty ? nonNullUser.email : "Unknown Email";
       });
     } catch (e) {
-      debugPrint("Lỗi khi tải thông tin người dùng: $e");
+      AppLog.e('ProfileScreen', "Lỗi khi tải thông tin người dùng", e);
       setState(() {
         _username = "Unknown User";
         _email = "Unknown Email";
@@ -83,12 +66,8 @@ class _ProfileScreenState extends State<ProfileScreen> {
   Future<void> _logout() async {
     final SharedPreferences prefs = await SharedPreferences.getInstance();
     await prefs.clear();
-    if (mounted) {
-      Navigator.pushReplacement(
-        context,
-        MaterialPageRoute(builder: (context) => const LoginScreen()),
-      );
-    }
+    // MyApp quay về LoginScreen khi signedIn đổi thành false
+    await StartupCoordinator().signOut();
   }
 
   @override
@@ -1,7 +1,8 @@
-import 'package:app_music/main.dart';
 import 'package:flutter/material.dart';
 import 'package:shared_preferences/shared_preferences.dart';
+import '../service/startup_coordinator.dart';
 import '../service/user_service.dart';
+import '../utils/app_log.dart';
 
 class RegisterScreen extends StatefulWidget {
   const RegisterScreen({super.key});
@@ -19,7 +20,7 @@ class _RegisterScreenState extends State<RegisterScreen> {
   final TextEditingController _addressController = TextEditingController();
   String? _errorText;
   bool _isLoading = false;
-  final UserService _userService = UserService(baseUrl: 'http://10.0.2.2:8080');
+  final UserService _userService = UserService();
 
   Future<void> _register() async {
     String firstName = _firstNameController.text.trim();
@@ -50,21 +51,15 @@ class _RegisterScreenState extends State<RegisterScreen> {
         email: email,
         password: password,
       );
-      print("Phản hồi từ login: $loginResponse"); // Debug phản hồi
 
       // Bước 3: Lưu accessToken và trạng thái đăng nhập
       SharedPreferences prefs = await SharedPreferences.getInstance();
       await prefs.setString('accessToken', loginResponse['accessToken']);
       await prefs.setBool('isLoggedIn', true);
-      print("Token đã lưu: ${prefs.getString('accessToken')}"); // Debug token
+      AppLog.i('RegisterScreen', "Đăng ký và đăng nhập thành công");
 
-      // Bước 4: Chuyển sang MainScreen
-      if (mounted) {
-        Navigator.pushReplacement(
-          context,
-          MaterialPageRoute(builder: (context) => const MainScreen()),
-        );
-      }
+      // Bước 4: Bắt đầu phiên, MyApp chuyển sang MainScreen khi signedIn đổi thành true
+      await StartupCoordinator().startSession();
     } catch (e) {
       setState(() {
         _errorText = "Đăng ký hoặc đăng nhập không thành công: $e";
@@ -2,9 +2,9 @@ import 'dart:convert';
 import 'package:flutter/material.dart';
 import 'package:provider/provider.dart';
 import '../models/genre.dart';
-import '../service/genre_service.dart';
-import '../service/song_service.dart';
+import '../service/catalog_repository.dart';
 import '../providers/search_provider.dart';
+import '../utils/app_log.dart';
 import '../widgets/genre_grid.dart';
 import '../widgets/search_results.dart';
 import 'package:shared_preferences/shared_preferences.dart';
@@ -20,8 +20,7 @@ class SearchScreen extends StatefulWidget {
 
 class _SearchScreenState extends State<SearchScreen> with TickerProviderStateMixin {
   final TextEditingController _searchController = TextEditingController();
-  final GenreService genreService = GenreService();
-  final SongService songService = SongService();
+  final CatalogRepository repository = CatalogRepository();
   List<Genre> genres = [];
   bool isLoading = true;
   String? errorMessage;
@@ -54,8 +53,16 @@ class _SearchScreenState extends State<SearchScreen> with TickerProviderStateMix
 
   Future<void> fetchData() async {
     try {
-      genres = await genreService.getGenres();
-      final songs = await songService.fetchSongs();
+      genres = await repository.fetchGenres(
+        onUpdated: (fresh) {
+          if (mounted) setState(() => genres = fresh);
+        },
+      );
+      final songs = await repository.fetchSongs(
+        onUpdated: (fresh) {
+          if (mounted) context.read<SearchProvider>().setSongs(fresh);
+        },
+      );
       context.read<SearchProvider>().setSongs(songs);
       await _loadGenreColors();
       if (mounted) {
@@ -88,7 +95,7 @@ class _SearchScreenState extends State<SearchScreen> with TickerProviderStateMix
         }
       }
     } catch (e) {
-      debugPrint('Lỗi khi tải màu thể loại: $e');
+      AppLog.w('SearchScreen', 'Lỗi khi tải màu thể loại', e);
     }
   }
 
@@ -196,24 +203,27 @@ class _SearchScreenState extends State<SearchScreen> with TickerProviderStateMix
         slivers: [
           SliverPadding(
             padding: const EdgeInsets.all(16.0),
-            sliver: SliverToBoxAdapter(
-              child: FadeTransition(
-                opacity: _fadeAnimation,
-                child: _searchController.text.isEmpty
-                    ? Column(
-                  crossAxisAlignment: CrossAxisAlignment.start,
-                  children: [
-                    const Text(
-                      'Thể loại',
-                      style: TextStyle(
-                        fontSize: 24,
-                        fontWeight: FontWeight.bold,
-                        color: Colors.black87,
+            sliver: SliverFadeTransition(
+              opacity: _fadeAnimation,
+              sliver: _searchController.text.isEmpty
+                  ? SliverMainAxisGroup(
+                slivers: [
+                  const SliverToBoxAdapter(
+                    child: Padding(
+                      padding: EdgeInsets.only(bottom: 16),
+                      child: Text(
+                        'Thể loại',
+                        style: TextStyle(
+                          fontSize: 24,
+                          fontWeight: FontWeight.bold,
+                          color: Colors.black87,
+                        ),
                       ),
                     ),
-                    const SizedBox(height: 16),
-                    genres.isEmpty
-                        ? Center(
+                  ),
+                  genres.isEmpty
+                      ? SliverToBoxAdapter(
+                    child: Center(
                       child: Column(
                         mainAxisAlignment: MainAxisAlignment.center,
                         children: [
@@ -232,11 +242,13 @@ class _SearchScreenState extends State<SearchScreen> with TickerProviderStateMix
                           ),
                         ],
                       ),
-                    )
-                        : GenreGrid(genres: genres, genreColors: genreColors),
-                  ],
-                )
-                    : Column(
+                    ),
+                  )
+                      : GenreGrid(genres: genres, genreColors: genreColors),
+                ],
+              )
+                  : SliverToBoxAdapter(
+                child: Column(
                   crossAxisAlignment: CrossAxisAlignment.start,
                   children: [
                     const Text(
@@ -1,7 +1,10 @@
 import 'package:flutter/material.dart';
 import 'package:provider/provider.dart';
+import '../models/song_summary.dart';
 import '../providers/audio_provider.dart';
-import '../service/song_service.dart';
+import '../providers/paged_data_source.dart';
+import '../service/catalog_repository.dart';
+import '../widgets/cover_image.dart';
 import '../widgets/music_player.dart';
 import 'now_playing_screen.dart';
 
@@ -13,28 +16,40 @@ class SongListScreen extends StatefulWidget {
 }
 
 class _SongListScreenState extends State<SongListScreen> {
-  final SongService _songService = SongService();
-  bool _isLoading = true;
+  final CatalogRepository _repository = CatalogRepository();
+  late final PagedDataSource<SongSummary> _songs = PagedDataSource<SongSummary>(
+    fetchPage: (cursor, forceRefresh) => _repository.fetchSongsPage(
+      cursor: cursor,
+      forceRefresh: forceRefresh,
+    ),
+  );
+
+  static const int prefetchAhead = 8;
 
   @override
   void initState() {
     super.initState();
-    _fetchSongs();
+    _songs.loadFirstPage();
+  }
+
+  @override
+  void dispose() {
+    _songs.dispose();
+    super.dispose();
   }
 
-  Future<void> _fetchSongs() async {
-    final songs = await _songService.fetchSongs();
-    Provider.of<AudioProvider>(context, listen: false).setSongs(
-      songs.map((song) => {
-        'songUrl': song.url ?? '',
-        'title': song.title,
-        'artist': song.artist?.title ?? 'Unknown Artist',
-        'imagePath': song.coverImage ?? 'default_image_url',
-      }).toList(),
+  // Đưa các bài hát đang có trong bộ nhớ quanh vị trí được chọn vào danh sách phát
+  void _playFrom(int index) {
+    final audioProvider = Provider.of<AudioProvider>(context, listen: false);
+    final range = _songs.residentRange(index);
+    if (range.items.isEmpty) return;
+
+    audioProvider.setQueue(range.items);
+    audioProvider.playSong(index - range.start);
+    Navigator.push(
+      context,
+      MaterialPageRoute(builder: (context) => const NowPlayingScreen()),
     );
-    setState(() {
-      _isLoading = false;
-    });
   }
 
   @override
@@ -44,34 +59,55 @@ class _SongListScreenState extends State<SongListScreen> {
       body: Column(
         children: [
           Expanded(
-            child: _isLoading
-                ? const Center(child: CircularProgressIndicator())
-                : Consumer<AudioProvider>(
-              builder: (context, audioProvider, child) {
-                final songs = audioProvider.songs;
-                return ListView.builder(
-                  itemCount: songs.length,
-                  itemBuilder: (context, index) {
-                    final song = songs[index];
-                    return ListTile(
-                      leading: Image.network(
-                        song["imagePath"]!,
-                        width: 50,
-                        height: 50,
-                        fit: BoxFit.cover,
-                        errorBuilder: (context, error, stackTrace) => const Icon(Icons.music_note),
+            child: AnimatedBuilder(
+              animation: _songs,
+              builder: (context, child) {
+                if (_songs.itemCount == 0) {
+                  if (_songs.error != null) {
+                    return Center(
+                      child: TextButton(
+                        onPressed: _songs.retry,
+                        child: const Text('Thử lại'),
                       ),
-                      title: Text(song["title"]!),
-                      subtitle: Text(song["artist"]!),
-                      onTap: () {
-                        audioProvider.playSong(index);
-                        Navigator.push(
-                          context,
-                          MaterialPageRoute(builder: (context) => const NowPlayingScreen()),
-                        );
-                      },
                     );
-                  },
+                  }
+                  return _songs.hasMore
+                      ? const Center(child: CircularProgressIndicator())
+                      : const Center(child: Text('No songs available'));
+                }
+
+                return RefreshIndicator(
+                  onRefresh: _songs.refresh,
+                  child: ListView.builder(
+                    itemCount: _songs.itemCount + (_songs.hasMore ? 1 : 0),
+                    itemExtent: 72,
+                    itemBuilder: (context, index) {
+                      if (index >= _songs.itemCount) {
+                        return _songs.error != null
+                            ? Center(
+                          child: TextButton(
+                            onPressed: _songs.retry,
+                            child: const Text('Thử lại'),
+                          ),
+                        )
+                            : const Center(child: CircularProgressIndicator());
+                      }
+
+                      final song = _songs.itemAt(index);
+                      // Tải trước ảnh bìa của các bài sắp cuộn tới
+                      CoverImage.prefetch(context, _songs.peek(index + prefetchAhead)?.coverImage, width: 50, height: 50);
+                      if (song == null) {
+                        // Trang đang được tải lại
+                        return const ListTile(leading: Icon(Icons.music_note));
+                      }
+                      return ListTile(
+                        leading: CoverImage(url: song.coverImage, width: 50, height: 50),
+                        title: Text(song.title),
+                        subtitle: Text(song.artistName ?? 'Unknown Artist'),
+                        onTap: () => _playFrom(index),
+                      );
+                    },
+                  ),
                 );
               },
             ),
@@ -81,4 +117,4 @@ class _SongListScreenState extends State<SongListScreen> {
       ),
     );
   }
-}
\ No newline at end of file
+}
@@ -1,47 +1,62 @@
-import 'dart:convert';
-import 'package:http/http.dart' as http;
-import 'package:shared_preferences/shared_preferences.dart';
+import 'dart:typed_data';
 import '../models/album.dart';
+import '../models/page_result.dart';
+import '../utils/app_log.dart';
+import 'catalog_cache.dart';
+import 'json_worker.dart';
 
 class AlbumService {
-  final String baseUrl = "http://10.0.2.2:8080";
+  static const int defaultPageSize = 50;
 
-  Future<List<Album>> fetchAlbums() async {
-    try {
-      // Lấy access token từ SharedPreferences
-      final prefs = await SharedPreferences.getInstance();
-      final accessToken = prefs.getString('accessToken');
-
-      if (accessToken == null) {
-        print("Không có access token được lưu trữ");
-        throw Exception('Không có access token');
-      }
+  final CatalogCache _catalogCache = CatalogCache();
+  final JsonWorker _jsonWorker = JsonWorker();
 
-      final response = await http.get(
-        Uri.parse('$baseUrl/api/v1/album'),
-        headers: {
-          'Authorization': 'Bearer $accessToken',
-          'Content-Type': 'application/json',
-        },
+  Future<List<Album>> fetchAlbums({
+    bool forceRefresh = false,
+    void Function(List<Album> albums)? onUpdated,
+  }) async {
+    try {
+      final body = await _catalogCache.getBody(
+        '/api/v1/album',
+        forceRefresh: forceRefresh,
+        onRevalidated: onUpdated == null
+            ? null
+            : (fresh) async {
+                onUpdated(await _parseAlbums(fresh));
+              },
       );
-
-      if (response.statusCode == 200) {
-        final data = json.decode(response.body);
-        print("API response: $data"); // Debug
-        if (data['success'] == true) {
-          return (data['data'] as List).map((json) => Album.fromJson(json)).toList();
-        } else {
-          print('API error: ${data['message']}');
-          return [];
-        }
-      } else {
-        print('Error: ${response.statusCode}');
-        print('Response body: ${response.body}'); // Debug thêm
-        return [];
-      }
+      return await _parseAlbums(body);
     } catch (e) {
-      print("Lỗi khi lấy album: $e");
+      AppLog.e('AlbumService', "Lỗi khi lấy album", e);
       return [];
     }
   }
+
+  // Lấy một trang album theo cursor (cursor = null là trang đầu tiên)
+  Future<PageResult<Album>> fetchAlbumsPage({
+    String? cursor,
+    int limit = defaultPageSize,
+    bool forceRefresh = false,
+  }) async {
+    final query = {
+      'limit': '$limit',
+      if (cursor != null) 'cursor': cursor,
+    };
+    final body = await _catalogCache.getBody('/api/v1/album', query: query, forceRefresh: forceRefresh);
+    final page = await _jsonWorker.parsePage(
+      body,
+      Album.fromJson,
+      traceKey: CatalogCache.keyFor('/api/v1/album', query),
+    );
+    return PageResult(
+      items: page.items,
+      nextCursor: page.meta['nextCursor']?.toString(),
+      total: (page.meta['total'] as num?)?.toInt(),
+    );
+  }
+
+  // Giải mã và dựng model trên isolate nền
+  Future<List<Album>> _parseAlbums(Uint8List body) {
+    return _jsonWorker.parseList(body, Album.fromJson, traceKey: '/api/v1/album');
+  }
 }
\ No newline at end of file
@@ -0,0 +1,168 @@
+import 'dart:async';
+import 'dart:convert';
+import 'dart:math';
+import 'package:http/http.dart' as http;
+import 'package:shared_preferences/shared_preferences.dart';
+import '../utils/network_trace.dart';
+// Cấu hình pool kết nối chỉ áp dụng khi có dart:io, bản web dùng BrowserClient
+import 'http_client_web.dart' if (dart.library.io) 'http_client_io.dart';
+
+// Client HTTP dùng chung cho tất cả các service.
+// Giữ một pool kết nối keep-alive, lưu token trong bộ nhớ,
+// yêu cầu nén gzip và tự động thử lại các request GET khi lỗi mạng.
+// Mỗi request được ghi thành một RequestSpan (NetworkTrace) khi bật tracing.
+class ApiClient {
+  // Đổi server khi build, vd. mock server trên máy host cho thiết bị thật:
+  // --dart-define=API_BASE_URL=http://192.168.1.10:8080
+  static const String defaultBaseUrl = String.fromEnvironment('API_BASE_URL', defaultValue: "http://10.0.2.2:8080");
+
+  static final ApiClient _instance = ApiClient._internal();
+  factory ApiClient() => _instance;
+
+  final String baseUrl = defaultBaseUrl;
+  final Duration timeout = const Duration(seconds: 15);
+  final int maxRetries = 2;
+  final Duration retryDelay = const Duration(milliseconds: 400);
+
+  late final http.Client _client;
+  String? _accessToken;
+  bool _tokenLoaded = false;
+
+  ApiClient._internal() {
+    _client = createHttpClient();
+  }
+
+  // Lấy token từ bộ nhớ, chỉ đọc SharedPreferences ở lần đầu tiên
+  Future<String?> getToken() async {
+    if (!_tokenLoaded) {
+      final prefs = await SharedPreferences.getInstance();
+      _accessToken = prefs.getString('accessToken');
+      _tokenLoaded = true;
+    }
+    return _accessToken;
+  }
+
+  // Cập nhật token khi đăng nhập / đăng xuất
+  Future<void> setToken(String? token) async {
+    _accessToken = token;
+    _tokenLoaded = true;
+    final prefs = await SharedPreferences.getInstance();
+    if (token == null) {
+      await prefs.remove('accessToken');
+    } else {
+      await prefs.setString('accessToken', token);
+    }
+  }
+
+  Uri _uri(String path, [Map<String, String>? query]) {
+    final uri = Uri.parse('$baseUrl$path');
+    return query == null || query.isEmpty ? uri : uri.replace(queryParameters: query);
+  }
+
+  Future<Map<String, String>> _headers({required bool auth, Map<String, String>? extra}) async {
+    final headers = <String, String>{
+      'Content-Type': 'application/json',
+      ...transportHeaders,
+    };
+    if (auth) {
+      final token = await getToken();
+      if (token == null) {
+        throw Exception('Không có access token');
+      }
+      headers['Authorization'] = 'Bearer $token';
+    }
+    if (extra != null) headers.addAll(extra);
+    return headers;
+  }
+
+  // Gửi GET, thử lại với backoff khi lỗi mạng, timeout hoặc lỗi 5xx tạm thời.
+  // span do bên gọi tạo (vd. CatalogCache) thì bên gọi tự kết thúc span đó.
+  Future<http.Response> get(
+    String path, {
+    Map<String, String>? query,
+    Map<String, String>? headers,
+    bool auth = true,
+    Duration? timeout,
+    RequestSpan? span,
+  }) async {
+    final uri = _uri(path, query);
+    final trace = span ?? NetworkTrace.begin(_traceKey(uri));
+    try {
+      final requestHeaders = await _headers(auth: auth, extra: headers);
+
+      int attempt = 0;
+      while (true) {
+        try {
+          trace?.attempts = attempt + 1;
+          final response = await _send('GET', uri, requestHeaders, trace).timeout(timeout ?? this.timeout);
+          if (_isRetryableStatus(response.statusCode) && attempt < maxRetries) {
+            await _backoff(attempt++);
+            continue;
+          }
+          trace?.received(response.statusCode, response.bodyBytes.length);
+          return response;
+        } on TimeoutException {
+          if (attempt >= maxRetries) rethrow;
+        } on http.ClientException {
+          // Gồm cả lỗi socket: IOClient bọc SocketException thành ClientException
+          if (attempt >= maxRetries) rethrow;
+        }
+        await _backoff(attempt++);
+      }
+    } catch (e) {
+      trace?.failed(e);
+      rethrow;
+    } finally {
+      if (span == null) NetworkTrace.finish(trace);
+    }
+  }
+
+  // POST không được thử lại tự động vì không idempotent
+  Future<http.Response> post(
+    String path, {
+    Object? body,
+    Map<String, String>? headers,
+    bool auth = false,
+    Duration? timeout,
+  }) async {
+    final uri = _uri(path);
+    final trace = NetworkTrace.begin(_traceKey(uri), method: 'POST');
+    try {
+      final requestHeaders = await _headers(auth: auth, extra: headers);
+      trace?.attempts = 1;
+      final response = await _send('POST', uri, requestHeaders, trace, body is String ? body : json.encode(body))
+          .timeout(timeout ?? this.timeout);
+      trace?.received(response.statusCode, response.bodyBytes.length);
+      return response;
+    } catch (e) {
+      trace?.failed(e);
+      rethrow;
+    } finally {
+      NetworkTrace.finish(trace);
+    }
+  }
+
+  // Gửi request dạng stream để đo thời gian tới byte đầu tiên (khi nhận xong header)
+  Future<http.Response> _send(
+    String method,
+    Uri uri,
+    Map<String, String> headers,
+    RequestSpan? span, [
+    String? body,
+  ]) async {
+    final request = http.Request(method, uri)..headers.addAll(headers);
+    if (body != null) request.body = body;
+    final streamed = await _client.send(request);
+    span?.firstByte();
+    return http.Response.fromStream(streamed);
+  }
+
+  String _traceKey(Uri uri) => uri.hasQuery ? '${uri.path}?${uri.query}' : uri.path;
+
+  bool _isRetryableStatus(int statusCode) =>
+      statusCode == 502 || statusCode == 503 || statusCode == 504;
+
+  Future<void> _backoff(int attempt) {
+    return Future.delayed(retryDelay * pow(2, attempt).toInt());
+  }
+}
@@ -1,93 +1,64 @@
 import 'dart:convert';
-import 'package:http/http.dart' as http;
-import 'package:shared_preferences/shared_preferences.dart';
+import 'dart:typed_data';
 import '../models/artist.dart';
+import '../utils/app_log.dart';
+import 'api_client.dart';
+import 'catalog_cache.dart';
+import 'json_worker.dart';
 
 class ArtistService {
-  final String baseUrl = "http://10.0.2.2:8080";
+  final ApiClient _apiClient = ApiClient();
+  final CatalogCache _catalogCache = CatalogCache();
+  final JsonWorker _jsonWorker = JsonWorker();
 
-  Future<List<Artist>> fetchArtists() async {
+  Future<List<Artist>> fetchArtists({
+    bool forceRefresh = false,
+    void Function(List<Artist> artists)? onUpdated,
+  }) async {
     try {
-      // Lấy access token từ SharedPreferences
-      final prefs = await SharedPreferences.getInstance();
-      final accessToken = prefs.getString('accessToken');
-
-      if (accessToken == null) {
-        print("Không có access token được lưu trữ");
-        throw Exception('Không có access token');
-      }
-
-      // Gửi yêu cầu GET đến endpoint /api/v1/artist
-      final response = await http.get(
-        Uri.parse('$baseUrl/api/v1/artist'),
-        headers: {
-          'Authorization': 'Bearer $accessToken',
-          'Content-Type': 'application/json',
-        },
+      // Lấy danh sách từ cache, làm mới endpoint /api/v1/artist ở nền
+      final body = await _catalogCache.getBody(
+        '/api/v1/artist',
+        forceRefresh: forceRefresh,
+        onRevalidated: onUpdated == null
+            ? null
+            : (fresh) async {
+                onUpdated(await _parseArtists(fresh));
+              },
       );
-
-      if (response.statusCode == 200) {
-        final data = json.decode(response.body);
-        print("API response (artists): $data"); // Debug dữ liệu trả về
-
-        if (data['success'] == true) {
-          // Kiểm tra xem data['data'] là String hay List
-          if (data['data'] is String) {
-            print("Không có artist nào: ${data['data']}");
-            return [];
-          }
-          return (data['data'] as List).map((json) => Artist.fromJson(json)).toList();
-        } else {
-          print('API error: ${data['message']}');
-          return [];
-        }
-      } else {
-        print('Error: ${response.statusCode}');
-        print('Response body: ${response.body}');
-        return [];
-      }
+      return await _parseArtists(body);
     } catch (e) {
-      print("Lỗi khi lấy danh sách artist: $e");
+      AppLog.e('ArtistService', "Lỗi khi lấy danh sách artist", e);
       return [];
     }
   }
 
+  // Giải mã và dựng model trên isolate nền
+  Future<List<Artist>> _parseArtists(Uint8List body) {
+    return _jsonWorker.parseList(body, Artist.fromJson, traceKey: '/api/v1/artist');
+  }
+
   // Nếu bạn muốn lấy một artist cụ thể theo ID
   Future<Artist?> getArtistById(String aid) async {
     try {
-      final prefs = await SharedPreferences.getInstance();
-      final accessToken = prefs.getString('accessToken');
-
-      if (accessToken == null) {
-        print("Không có access token được lưu trữ");
-        throw Exception('Không có access token');
-      }
-
-      final response = await http.get(
-        Uri.parse('$baseUrl/api/v1/artist/$aid'),
-        headers: {
-          'Authorization': 'Bearer $accessToken',
-          'Content-Type': 'application/json',
-        },
-      );
+      final response = await _apiClient.get('/api/v1/artist/$aid');
 
       if (response.statusCode == 200) {
         final data = json.decode(response.body);
-        print("API response (artist by ID): $data"); // Debug dữ liệu
 
         if (data['success'] == true) {
           return Artist.fromJson(data['data']);
         } else {
-          print('API error: ${data['message']}');
+          AppLog.w('ArtistService', 'API error: ${data['message']}');
           return null;
         }
       } else {
-        print('Error: ${response.statusCode}');
-        print('Response body: ${response.body}');
+        AppLog.w('ArtistService', 'Lỗi lấy artist $aid. Mã lỗi: ${response.statusCode}');
+        AppLog.d('ArtistService', () => 'Response body: ${response.body}');
         return null;
       }
     } catch (e) {
-      print("Lỗi khi lấy artist theo ID: $e");
+      AppLog.e('ArtistService', "Lỗi khi lấy artist theo ID", e);
       return null;
     }
   }
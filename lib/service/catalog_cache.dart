@@ -0,0 +1,273 @@
+import 'dart:async';
+import 'dart:convert';
+import 'dart:io';
+import 'dart:typed_data';
+import 'package:http/http.dart' as http;
+import 'package:path_provider/path_provider.dart';
+import '../utils/app_log.dart';
+import '../utils/network_trace.dart';
+import 'api_client.dart';
+
+// Thông tin của một mục trong cache: ETag / Last-Modified và thời điểm lưu
+class CatalogCacheEntry {
+  final String? etag;
+  final String? lastModified;
+  final DateTime storedAt;
+
+  CatalogCacheEntry({
+    this.etag,
+    this.lastModified,
+    required this.storedAt,
+  });
+
+  factory CatalogCacheEntry.fromJson(Map<String, dynamic> json) {
+    try {
+      return CatalogCacheEntry(
+        etag: json['etag'],
+        lastModified: json['lastModified'],
+        storedAt: DateTime.parse(json['storedAt']),
+      );
+    } catch (e) {
+      throw FormatException('Error parsing CatalogCacheEntry JSON: $e');
+    }
+  }
+
+  Map<String, dynamic> toJson() => {
+    'etag': etag,
+    'lastModified': lastModified,
+    'storedAt': storedAt.toIso8601String(),
+  };
+}
+
+// Cache trên đĩa cho các danh sách song / album / artist / genre.
+// Lưu nguyên body của response (chưa giải mã) để việc giải mã JSON diễn ra trên
+// isolate nền. Trả dữ liệu đã lưu ngay lập tức rồi làm mới ở nền bằng request có
+// điều kiện (If-None-Match / If-Modified-Since), server trả 304 thì không tải lại payload.
+class CatalogCache {
+  static final CatalogCache _instance = CatalogCache._internal();
+  factory CatalogCache() => _instance;
+  CatalogCache._internal();
+
+  final int maxEntries = 32;
+  final int maxBytes = 20 * 1024 * 1024; // 20 MB
+
+  final ApiClient _apiClient = ApiClient();
+  final Map<String, CatalogCacheEntry> _entries = {};
+  final Map<String, Future<Uint8List?>> _revalidating = {};
+  int _generation = 0; // Tăng mỗi lần clear(), request bắt đầu trước đó không ghi vào cache
+  Directory? _directory;
+
+  Future<Directory> _cacheDirectory() async {
+    if (_directory != null) return _directory!;
+    final base = await getApplicationSupportDirectory();
+    final dir = Directory('${base.path}/catalog_cache');
+    if (!await dir.exists()) {
+      await dir.create(recursive: true);
+    }
+    _directory = dir;
+    return dir;
+  }
+
+  String _baseName(String path) => path.replaceAll(RegExp(r'[^A-Za-z0-9]+'), '_');
+
+  Future<File> _bodyFile(String path) async {
+    final dir = await _cacheDirectory();
+    return File('${dir.path}/${_baseName(path)}.body');
+  }
+
+  Future<File> _metaFile(String path) async {
+    final dir = await _cacheDirectory();
+    return File('${dir.path}/${_baseName(path)}.meta');
+  }
+
+  Future<CatalogCacheEntry?> readEntry(String path) async {
+    final cached = _entries[path];
+    if (cached != null) return cached;
+    try {
+      final metaFile = await _metaFile(path);
+      if (!await metaFile.exists() || !await (await _bodyFile(path)).exists()) return null;
+      final entry = CatalogCacheEntry.fromJson(json.decode(await metaFile.readAsString()));
+      _entries[path] = entry;
+      return entry;
+    } catch (e) {
+      AppLog.w('CatalogCache', "Lỗi khi đọc cache $path", e);
+      return null;
+    }
+  }
+
+  Future<Uint8List?> readBody(String path) async {
+    try {
+      final file = await _bodyFile(path);
+      if (!await file.exists()) return null;
+      final bytes = await file.readAsBytes();
+      await file.setLastModified(DateTime.now()); // Đánh dấu vừa dùng để xóa theo LRU
+      return bytes;
+    } catch (e) {
+      AppLog.w('CatalogCache', "Lỗi khi đọc cache $path", e);
+      return null;
+    }
+  }
+
+  Future<void> write(String path, Uint8List body, CatalogCacheEntry entry) async {
+    _entries[path] = entry;
+    try {
+      await (await _bodyFile(path)).writeAsBytes(body, flush: true);
+      await (await _metaFile(path)).writeAsString(json.encode(entry.toJson()), flush: true);
+      await _evict();
+    } catch (e) {
+      AppLog.w('CatalogCache', "Lỗi khi ghi cache $path", e);
+    }
+  }
+
+  // Xóa toàn bộ body đã lưu cùng file .meta (ETag / Last-Modified), vd. khi đăng xuất.
+  // Request làm mới đang chạy vẫn trả kết quả cho bên gọi nhưng không ghi lại vào cache.
+  Future<void> clear() async {
+    _generation++;
+    _entries.clear();
+    _revalidating.clear();
+    try {
+      final dir = await _cacheDirectory();
+      await for (final entity in dir.list()) {
+        if (entity is File && (entity.path.endsWith('.body') || entity.path.endsWith('.meta'))) {
+          await entity.delete();
+        }
+      }
+    } catch (e) {
+      AppLog.w('CatalogCache', "Lỗi khi xóa cache", e);
+    }
+  }
+
+  // Xóa các mục ít được dùng nhất khi vượt quá giới hạn số lượng hoặc dung lượng
+  Future<void> _evict() async {
+    final dir = await _cacheDirectory();
+    final files = await dir
+        .list()
+        .where((e) => e is File && e.path.endsWith('.body'))
+        .cast<File>()
+        .toList();
+    final stats = <String, FileStat>{};
+    for (final file in files) {
+      stats[file.path] = await file.stat();
+    }
+    files.sort((a, b) => stats[a.path]!.modified.compareTo(stats[b.path]!.modified));
+
+    int totalBytes = stats.values.fold(0, (sum, stat) => sum + stat.size);
+    int count = files.length;
+    for (final file in files) {
+      if (count <= maxEntries && totalBytes <= maxBytes) break;
+      totalBytes -= stats[file.path]!.size;
+      count--;
+      final baseName = file.uri.pathSegments.last.replaceAll('.body', '');
+      _entries.removeWhere((key, _) => _baseName(key) == baseName);
+      await file.delete();
+      final metaFile = File('${dir.path}/$baseName.meta');
+      if (await metaFile.exists()) await metaFile.delete();
+    }
+  }
+
+  // Lấy body của response theo kiểu stale-while-revalidate.
+  // Nếu có cache: trả về ngay, làm mới ở nền và gọi onRevalidated khi dữ liệu thay đổi.
+  // Nếu không có cache hoặc forceRefresh: chờ request mạng (vẫn gửi kèm validator nếu có).
+  // query (vd. trang / cursor) là một phần của khóa cache.
+  Future<Uint8List> getBody(
+    String path, {
+    Map<String, String>? query,
+    bool forceRefresh = false,
+    FutureOr<void> Function(Uint8List body)? onRevalidated,
+  }) async {
+    final key = keyFor(path, query);
+    final readWatch = Stopwatch()..start();
+    final entry = await readEntry(key);
+    final cachedBody = entry != null ? await readBody(key) : null;
+    final readTime = readWatch.elapsed;
+    if (cachedBody != null && !forceRefresh) {
+      NetworkTrace.awaitDecode(NetworkTrace.cacheHit(key, cachedBody.length, readTime));
+      _revalidate(path, query, entry).then((fresh) async {
+        if (fresh == null) return;
+        if (onRevalidated != null) {
+          await onRevalidated(fresh);
+        } else {
+          // Không ai giải mã body mới, kết thúc span của request làm mới
+          NetworkTrace.finish(NetworkTrace.takeAwaitingDecode(key));
+        }
+      }).catchError((e) {
+        AppLog.w('CatalogCache', "Lỗi khi làm mới cache $key", e);
+      });
+      return cachedBody;
+    }
+
+    final fresh = await _revalidate(path, query, cachedBody != null ? entry : null);
+    if (fresh != null) return fresh;
+    // Server trả 304: dùng body đã lưu
+    NetworkTrace.awaitDecode(NetworkTrace.cacheHit(key, cachedBody!.length, readTime));
+    return cachedBody;
+  }
+
+  // Khóa cache của một endpoint, cũng là traceKey khi giải mã body bằng JsonWorker
+  static String keyFor(String path, Map<String, String>? query) {
+    if (query == null || query.isEmpty) return path;
+    final keys = query.keys.toList()..sort();
+    return '$path?${keys.map((k) => '$k=${query[k]}').join('&')}';
+  }
+
+  // Gộp các lần làm mới đồng thời cho cùng một endpoint
+  Future<Uint8List?> _revalidate(String path, Map<String, String>? query, CatalogCacheEntry? cached) {
+    final key = keyFor(path, query);
+    final inFlight = _revalidating[key];
+    if (inFlight != null) return inFlight;
+    late final Future<Uint8List?> future;
+    future = _fetch(path, query, cached).whenComplete(() {
+      // clear() có thể đã bỏ request này và một request mới đang chạy cho cùng key
+      if (identical(_revalidating[key], future)) _revalidating.remove(key);
+    });
+    _revalidating[key] = future;
+    return future;
+  }
+
+  // Trả về null nếu server báo dữ liệu không đổi (304)
+  Future<Uint8List?> _fetch(String path, Map<String, String>? query, CatalogCacheEntry? cached) async {
+    final key = keyFor(path, query);
+    final headers = <String, String>{};
+    if (cached?.etag != null) headers['If-None-Match'] = cached!.etag!;
+    if (cached?.lastModified != null) headers['If-Modified-Since'] = cached!.lastModified!;
+
+    final generation = _generation;
+    final span = NetworkTrace.begin(key);
+    final http.Response response;
+    try {
+      response = await _apiClient.get(path, query: query, headers: headers, span: span);
+    } catch (e) {
+      NetworkTrace.finish(span);
+      rethrow;
+    }
+
+    if (response.statusCode == 304 && cached != null) {
+      NetworkTrace.finish(span);
+      try {
+        await (await _bodyFile(key)).setLastModified(DateTime.now());
+      } catch (_) {}
+      return null;
+    }
+
+    if (response.statusCode != 200) {
+      NetworkTrace.finish(span);
+      AppLog.d('CatalogCache', () => 'Response body: ${response.body}');
+      throw Exception('Failed to fetch $key: ${response.statusCode}');
+    }
+
+    NetworkTrace.awaitDecode(span);
+
+    // Cache đã bị xóa trong lúc chờ (đăng xuất): không lưu dữ liệu của phiên trước
+    if (generation != _generation) return response.bodyBytes;
+    await write(
+      key,
+      response.bodyBytes,
+      CatalogCacheEntry(
+        etag: response.headers['etag'],
+        lastModified: response.headers['last-modified'],
+        storedAt: DateTime.now(),
+      ),
+    );
+    return response.bodyBytes;
+  }
+}
@@ -0,0 +1,256 @@
+import 'dart:async';
+import 'dart:collection';
+import '../models/album.dart';
+import '../models/artist.dart';
+import '../models/genre.dart';
+import '../models/page_result.dart';
+import '../models/song.dart';
+import '../models/song_summary.dart';
+import 'album_service.dart';
+import 'artist_service.dart';
+import 'genre_service.dart';
+import 'song_service.dart';
+
+// Kho dữ liệu catalog dùng chung cho toàn ứng dụng.
+// - Lưu song / artist / album / genre theo id: tra cứu O(1) và mỗi thực thể chỉ
+//   có một đối tượng. Bài hát trong danh sách là SongSummary (chỉ id + tên của
+//   artist / album / genre), Song đầy đủ chỉ được tải khi cần qua getSongById.
+// - Gộp các request đang chạy: nhiều màn hình gọi cùng một endpoint cùng lúc chỉ
+//   tạo một lần tải + giải mã, onUpdated của tất cả các bên đều được gọi khi cache làm mới.
+class CatalogRepository {
+  static final CatalogRepository _instance = CatalogRepository._internal();
+  factory CatalogRepository() => _instance;
+  CatalogRepository._internal();
+
+  final SongService _songService = SongService();
+  final AlbumService _albumService = AlbumService();
+  final ArtistService _artistService = ArtistService();
+  final GenreService _genreService = GenreService();
+
+  // Số Song đầy đủ (có lyrics / comments / likes) giữ lại, bỏ bản dùng lâu nhất
+  static const int maxSongDetails = 50;
+
+  final Map<String, SongSummary> _songs = {};
+  final LinkedHashMap<String, Song> _songDetails = LinkedHashMap();
+  final Map<String, Artist> _artists = {};
+  final Map<String, Album> _albums = {};
+  final Map<String, Genre> _genres = {};
+  final Map<String, _Flight> _inFlight = {};
+
+  SongSummary? songById(String? id) => id == null ? null : _songs[id];
+  Artist? artistById(String? id) => id == null ? null : _artists[id];
+  Album? albumById(String? id) => id == null ? null : _albums[id];
+  Genre? genreById(String? id) => id == null ? null : _genres[id];
+
+  String artistNameById(String? id) => artistById(id)?.title ?? 'Unknown Artist';
+
+  // Ghi nhận các bài hát không đi qua fetch của kho (vd. bài hát lồng trong Genre)
+  // để có thể tra cứu theo id, bài đã có trong kho được giữ nguyên
+  void registerSongs(List<SongSummary> songs) {
+    for (final song in songs) {
+      _songs.putIfAbsent(song.id, () => song);
+    }
+  }
+
+  Future<List<SongSummary>> fetchSongs({
+    bool forceRefresh = false,
+    void Function(List<SongSummary> songs)? onUpdated,
+  }) {
+    return _singleFlight('songs', forceRefresh, onUpdated, (notify) async {
+      final songs = await _songService.fetchSongs(
+        forceRefresh: forceRefresh,
+        onUpdated: (fresh) => notify(_putSongs(fresh)),
+      );
+      return _putSongs(songs);
+    });
+  }
+
+  Future<PageResult<SongSummary>> fetchSongsPage({
+    String? cursor,
+    int limit = SongService.defaultPageSize,
+    bool forceRefresh = false,
+  }) {
+    return _singleFlight('songs?cursor=$cursor&limit=$limit', forceRefresh, null, (_) async {
+      final page = await _songService.fetchSongsPage(
+        cursor: cursor,
+        limit: limit,
+        forceRefresh: forceRefresh,
+      );
+      return PageResult(items: _putSongs(page.items), nextCursor: page.nextCursor, total: page.total);
+    });
+  }
+
+  Future<List<Album>> fetchAlbums({
+    bool forceRefresh = false,
+    void Function(List<Album> albums)? onUpdated,
+  }) {
+    return _singleFlight('albums', forceRefresh, onUpdated, (notify) async {
+      final albums = await _albumService.fetchAlbums(
+        forceRefresh: forceRefresh,
+        onUpdated: (fresh) => notify(_putAlbums(fresh)),
+      );
+      return _putAlbums(albums);
+    });
+  }
+
+  Future<PageResult<Album>> fetchAlbumsPage({
+    String? cursor,
+    int limit = AlbumService.defaultPageSize,
+    bool forceRefresh = false,
+  }) {
+    return _singleFlight('albums?cursor=$cursor&limit=$limit', forceRefresh, null, (_) async {
+      final page = await _albumService.fetchAlbumsPage(
+        cursor: cursor,
+        limit: limit,
+        forceRefresh: forceRefresh,
+      );
+      return PageResult(items: _putAlbums(page.items), nextCursor: page.nextCursor, total: page.total);
+    });
+  }
+
+  Future<List<Artist>> fetchArtists({
+    bool forceRefresh = false,
+    void Function(List<Artist> artists)? onUpdated,
+  }) {
+    return _singleFlight('artists', forceRefresh, onUpdated, (notify) async {
+      final artists = await _artistService.fetchArtists(
+        forceRefresh: forceRefresh,
+        onUpdated: (fresh) => notify(_putArtists(fresh)),
+      );
+      return _putArtists(artists);
+    });
+  }
+
+  Future<List<Genre>> fetchGenres({
+    bool forceRefresh = false,
+    void Function(List<Genre> genres)? onUpdated,
+  }) {
+    return _singleFlight('genres', forceRefresh, onUpdated, (notify) async {
+      final genres = await _genreService.getGenres(
+        forceRefresh: forceRefresh,
+        onUpdated: (fresh) => notify(_putGenres(fresh)),
+      );
+      return _putGenres(genres);
+    });
+  }
+
+  // Lấy từ kho nếu đã có, nếu chưa thì gọi API (các lời gọi trùng id dùng chung một request)
+  Future<Artist?> getArtist(String id) async {
+    final cached = _artists[id];
+    if (cached != null) return cached;
+    return _singleFlight('artist/$id', false, null, (_) async {
+      final artist = await _artistService.getArtistById(id);
+      if (artist != null) _artists[artist.id] = artist;
+      return artist;
+    });
+  }
+
+  // Chi tiết bài hát cho NowPlayingScreen / màn hình chi tiết
+  Future<Song?> getSongById(String id, {bool forceRefresh = false}) async {
+    final cached = forceRefresh ? null : _songDetails.remove(id);
+    if (cached != null) {
+      _songDetails[id] = cached; // Đưa lên cuối: vừa được dùng
+      return cached;
+    }
+    return _singleFlight('song/$id', forceRefresh, null, (_) async {
+      final song = await _songService.getSongById(id);
+      if (song != null) {
+        _songDetails.remove(id);
+        _songDetails[id] = song;
+        while (_songDetails.length > maxSongDetails) {
+          _songDetails.remove(_songDetails.keys.first);
+        }
+      }
+      return song;
+    });
+  }
+
+  Future<Genre> getGenre(String id) async {
+    final cached = _genres[id];
+    if (cached != null) return cached;
+    return _singleFlight('genre/$id', false, null, (_) async {
+      final genre = await _genreService.getGenreById(id);
+      _genres[genre.id] = genre;
+      return genre;
+    });
+  }
+
+  // Đăng xuất: bỏ toàn bộ thực thể đã lưu của phiên trước. Request đang chạy không còn
+  // được dùng chung và không gọi onUpdated của các bên đã đăng ký.
+  void clear() {
+    for (final flight in _inFlight.values) {
+      flight.listeners.clear();
+    }
+    _inFlight.clear();
+    _songs.clear();
+    _songDetails.clear();
+    _artists.clear();
+    _albums.clear();
+    _genres.clear();
+  }
+
+  // Chạy task một lần cho mỗi key; các lời gọi trùng key trong lúc task đang chạy
+  // nhận chung kết quả. forceRefresh dùng key riêng để không nhận nhầm dữ liệu cache.
+  Future<T> _singleFlight<T>(
+    String key,
+    bool forceRefresh,
+    void Function(T value)? onUpdated,
+    Future<T> Function(void Function(T value) notify) task,
+  ) {
+    final flightKey = forceRefresh ? '$key#refresh' : key;
+    final existing = _inFlight[flightKey];
+    if (existing is _Flight<T>) {
+      if (onUpdated != null) existing.listeners.add(onUpdated);
+      return existing.future;
+    }
+
+    final flight = _Flight<T>();
+    if (onUpdated != null) flight.listeners.add(onUpdated);
+    _inFlight[flightKey] = flight;
+    flight.future = task((value) {
+      for (final listener in List.of(flight.listeners)) {
+        listener(value);
+      }
+    }).whenComplete(() {
+      if (identical(_inFlight[flightKey], flight)) _inFlight.remove(flightKey);
+    });
+    return flight.future;
+  }
+
+  List<SongSummary> _putSongs(List<SongSummary> songs) {
+    for (final song in songs) {
+      _songs[song.id] = song;
+    }
+    return songs;
+  }
+
+  // Danh sách từ endpoint riêng là dữ liệu đầy đủ nên ghi đè bản đã có trong kho
+  List<Album> _putAlbums(List<Album> albums) {
+    for (final album in albums) {
+      _albums[album.id] = album;
+      if (album.artist != null) _internArtist(album.artist!);
+    }
+    return albums;
+  }
+
+  List<Artist> _putArtists(List<Artist> artists) {
+    for (final artist in artists) {
+      _artists[artist.id] = artist;
+    }
+    return artists;
+  }
+
+  List<Genre> _putGenres(List<Genre> genres) {
+    for (final genre in genres) {
+      _genres[genre.id] = genre;
+    }
+    return genres;
+  }
+
+  Artist _internArtist(Artist artist) => _artists.putIfAbsent(artist.id, () => artist);
+}
+
+class _Flight<T> {
+  late final Future<T> future;
+  final List<void Function(T value)> listeners = [];
+}
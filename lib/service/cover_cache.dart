@@ -0,0 +1,31 @@
+import 'package:flutter/painting.dart';
+import 'package:flutter_cache_manager/flutter_cache_manager.dart';
+
+// Cache ảnh bìa / ảnh ca sĩ dùng chung cho mọi widget hiển thị ảnh (xem CoverImage).
+// - Trên đĩa: tối đa maxDiskObjects file, file không được dùng quá stalePeriod sẽ bị xóa.
+// - Trong bộ nhớ: ImageCache của Flutter (LRU) được giới hạn theo số ảnh và
+//   dung lượng; ảnh được giải mã đúng kích thước hiển thị nên mỗi ảnh nhỏ.
+class CoverCacheManager extends CacheManager with ImageCacheManager {
+  static const String key = 'coverCache';
+  static const int maxDiskObjects = 500;
+  static const Duration stalePeriod = Duration(days: 30);
+
+  static const int maxMemoryImages = 300;
+  static const int maxMemoryBytes = 60 * 1024 * 1024; // 60 MB ảnh đã giải mã
+
+  static final CoverCacheManager _instance = CoverCacheManager._internal();
+  factory CoverCacheManager() => _instance;
+  CoverCacheManager._internal()
+      : super(Config(
+          key,
+          maxNrOfCacheObjects: maxDiskObjects,
+          stalePeriod: stalePeriod,
+        ));
+
+  // Gọi một lần khi khởi động ứng dụng
+  static void configureMemoryCache() {
+    final imageCache = PaintingBinding.instance.imageCache;
+    imageCache.maximumSize = maxMemoryImages;
+    imageCache.maximumSizeBytes = maxMemoryBytes;
+  }
+}
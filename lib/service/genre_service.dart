@@ -1,74 +1,55 @@
 import 'dart:convert';
-import 'package:http/http.dart' as http;
-import 'package:shared_preferences/shared_preferences.dart';
+import 'dart:typed_data';
 import '../models/genre.dart';
+import '../utils/app_log.dart';
+import 'api_client.dart';
+import 'catalog_cache.dart';
+import 'json_worker.dart';
 
 class GenreService {
-  final String baseUrl = "http://10.0.2.2:8080/api/v1/genre";
-
-  Future<List<Genre>> getGenres() async {
+  final String path = "/api/v1/genre";
+  final ApiClient _apiClient = ApiClient();
+  final CatalogCache _catalogCache = CatalogCache();
+  final JsonWorker _jsonWorker = JsonWorker();
+
+  Future<List<Genre>> getGenres({
+    bool forceRefresh = false,
+    void Function(List<Genre> genres)? onUpdated,
+  }) async {
     try {
-      // Lấy access token từ SharedPreferences
-      final prefs = await SharedPreferences.getInstance();
-      final accessToken = prefs.getString('accessToken');
-
-      if (accessToken == null) {
-        throw Exception('Không có access token');
-      }
-
-      final response = await http.get(
-        Uri.parse(baseUrl),
-        headers: {
-          'Authorization': 'Bearer $accessToken',
-          'Content-Type': 'application/json',
-        },
+      final body = await _catalogCache.getBody(
+        path,
+        forceRefresh: forceRefresh,
+        onRevalidated: onUpdated == null
+            ? null
+            : (fresh) async {
+                onUpdated(await _parseGenres(fresh));
+              },
       );
-
-      if (response.statusCode == 200) {
-        final data = jsonDecode(response.body);
-        print("API response (genres): $data"); // Debug
-        if (data['success'] == true) {
-          return (data['data'] as List).map((json) => Genre.fromJson(json)).toList();
-        } else {
-          throw Exception("Failed to fetch genres: ${data['message']}");
-        }
-      } else {
-        print("Response body: ${response.body}"); // Debug thêm
-        throw Exception("Failed to fetch genres: ${response.statusCode}");
-      }
+      return await _parseGenres(body);
     } catch (e) {
       throw Exception("Error: $e");
     }
   }
 
+  // Giải mã và dựng model trên isolate nền
+  Future<List<Genre>> _parseGenres(Uint8List body) {
+    return _jsonWorker.parseList(body, Genre.fromJson, traceKey: path);
+  }
+
   Future<Genre> getGenreById(String gid) async {
     try {
-      // Lấy access token từ SharedPreferences
-      final prefs = await SharedPreferences.getInstance();
-      final accessToken = prefs.getString('accessToken');
-
-      if (accessToken == null) {
-        throw Exception('Không có access token');
-      }
-
-      final response = await http.get(
-        Uri.parse("$baseUrl/$gid"),
-        headers: {
-          'Authorization': 'Bearer $accessToken',
-          'Content-Type': 'application/json',
-        },
-      );
+      final response = await _apiClient.get("$path/$gid");
 
       if (response.statusCode == 200) {
         final data = jsonDecode(response.body);
-        print("API response (genre by id): $data"); // Debug
         if (data['success'] == true) {
           return Genre.fromJson(data['data']);
         } else {
           throw Exception("Failed to fetch genre: ${data['message']}");
         }
       } else {
-        print("Response body: ${response.body}"); // Debug thêm
+        AppLog.d('GenreService', () => 'Response body: ${response.body}');
         throw Exception("Failed to fetch genre: ${response.statusCode}");
       }
     } catch (e) {
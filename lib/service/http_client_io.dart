@@ -0,0 +1,16 @@
+import 'dart:io';
+import 'package:http/http.dart' as http;
+import 'package:http/io_client.dart';
+
+// Yêu cầu nén gzip, HttpClient tự giải nén (autoUncompress)
+const Map<String, String> transportHeaders = {'Accept-Encoding': 'gzip'};
+
+// Android / iOS / desktop: pool kết nối keep-alive và tự giải nén gzip qua HttpClient
+http.Client createHttpClient() {
+  final httpClient = HttpClient()
+    ..idleTimeout = const Duration(seconds: 30) // Giữ kết nối mở giữa các request
+    ..maxConnectionsPerHost = 6
+    ..connectionTimeout = const Duration(seconds: 10)
+    ..autoUncompress = true; // Tự giải nén response gzip
+  return IOClient(httpClient);
+}
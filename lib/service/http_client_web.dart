@@ -0,0 +1,8 @@
+import 'package:http/browser_client.dart';
+import 'package:http/http.dart' as http;
+
+// Trình duyệt tự gửi Accept-Encoding và không cho đặt header này
+const Map<String, String> transportHeaders = {};
+
+// Web: trình duyệt tự quản lý kết nối và giải nén, không có HttpClient của dart:io
+http.Client createHttpClient() => BrowserClient();
@@ -0,0 +1,229 @@
+import 'dart:async';
+import 'dart:convert';
+import 'dart:developer' as developer;
+import 'dart:isolate';
+import 'dart:typed_data';
+
+typedef JsonModelFactory<T> = T Function(Map<String, dynamic> json);
+
+// Isolate nền dùng chung để giải mã JSON và dựng model.
+// Body được gửi sang dạng byte, isolate nền giải mã UTF-8 + JSON, gọi fromJson
+// rồi gửi kết quả về theo từng lô để isolate UI không bị nghẽn khi danh sách lớn.
+// Thời gian giải mã và dựng model được đo trên isolate nền, gửi về cùng thông báo
+// 'done' / 'error' và chuyển cho decodeObserver trên isolate UI (NetworkTrace gắn vào
+// RequestSpan của traceKey). File này chỉ dùng thư viện Dart thuần để chạy được cả
+// ngoài Flutter (dart run test/benchmark/catalog_decode_benchmark.dart).
+class JsonWorker {
+  static final JsonWorker _instance = JsonWorker._internal();
+  factory JsonWorker() => _instance;
+  JsonWorker._internal();
+
+  final int defaultBatchSize = 500;
+
+  DecodeObserver? decodeObserver;
+
+  ReceivePort? _receivePort;
+  Future<SendPort>? _sendPort;
+  final Map<int, _Job> _jobs = {};
+  int _nextJobId = 0;
+
+  Future<SendPort> _start() {
+    return _sendPort ??= () async {
+      final receivePort = ReceivePort();
+      _receivePort = receivePort;
+      final ready = Completer<SendPort>();
+      receivePort.listen((message) {
+        if (message is SendPort) {
+          ready.complete(message);
+          return;
+        }
+        _handleMessage(message as List);
+      });
+      await Isolate.spawn(_workerMain, receivePort.sendPort, debugName: 'json_worker');
+      return ready.future;
+    }();
+  }
+
+  void _handleMessage(List message) {
+    final job = _jobs[message[0] as int];
+    if (job == null) return;
+    switch (message[1] as String) {
+      case 'meta':
+        job.meta = (message[2] as Map).cast<String, dynamic>();
+        break;
+      case 'batch':
+        job.controller.add(message[2] as List);
+        break;
+      case 'error':
+        decodeObserver?.end(job.trace, DecodeTiming(error: message[2] as String));
+        job.controller.addError(FormatException(message[2] as String));
+        _jobs.remove(message[0])?.controller.close();
+        break;
+      case 'done':
+        _jobs.remove(message[0]);
+        decodeObserver?.end(
+          job.trace,
+          DecodeTiming(
+            decode: Duration(microseconds: message[2] as int),
+            mapping: Duration(microseconds: message[3] as int),
+            items: message[4] as int,
+          ),
+        );
+        job.controller.close();
+        break;
+    }
+  }
+
+  _Job _submit(Uint8List body, Function fromJson, int? batchSize, String? traceKey) {
+    final id = _nextJobId++;
+    final job = _Job()..trace = traceKey == null ? null : decodeObserver?.begin(traceKey);
+    _jobs[id] = job;
+    _start().then((port) {
+      port.send([id, body, fromJson, batchSize ?? defaultBatchSize]);
+    }).catchError((e) {
+      _jobs.remove(id);
+      decodeObserver?.end(job.trace, DecodeTiming(error: e.toString()));
+      job.controller.addError(e);
+      job.controller.close();
+    });
+    return job;
+  }
+
+  // Giải mã body (envelope {success, data} hoặc danh sách) và trả model theo từng lô
+  Stream<List<T>> parseInBatches<T>(
+    Uint8List body,
+    JsonModelFactory<T> fromJson, {
+    int? batchSize,
+    String? traceKey,
+  }) {
+    final job = _submit(body, fromJson, batchSize, traceKey);
+    return job.controller.stream.map((batch) => batch.cast<T>());
+  }
+
+  Future<List<T>> parseList<T>(
+    Uint8List body,
+    JsonModelFactory<T> fromJson, {
+    int? batchSize,
+    String? traceKey,
+  }) async {
+    final result = <T>[];
+    await for (final batch in parseInBatches(body, fromJson, batchSize: batchSize, traceKey: traceKey)) {
+      result.addAll(batch);
+    }
+    return result;
+  }
+
+  // Giống parseList nhưng giữ lại các trường phân trang của envelope (nextCursor, total)
+  Future<JsonPage<T>> parsePage<T>(
+    Uint8List body,
+    JsonModelFactory<T> fromJson, {
+    int? batchSize,
+    String? traceKey,
+  }) async {
+    final job = _submit(body, fromJson, batchSize, traceKey);
+    final items = <T>[];
+    await for (final batch in job.controller.stream) {
+      items.addAll(batch.cast<T>());
+    }
+    return JsonPage(items: items, meta: job.meta ?? const {});
+  }
+
+  void dispose() {
+    _receivePort?.close();
+    _receivePort = null;
+    _sendPort = null;
+    for (final job in _jobs.values) {
+      job.controller.close();
+    }
+    _jobs.clear();
+  }
+}
+
+class JsonPage<T> {
+  final List<T> items;
+  final Map<String, dynamic> meta;
+
+  JsonPage({required this.items, required this.meta});
+}
+
+// Thời gian của một lần giải mã, đo trên isolate nền
+class DecodeTiming {
+  final Duration? decode;
+  final Duration? mapping;
+  final int? items;
+  final String? error;
+
+  const DecodeTiming({this.decode, this.mapping, this.items, this.error});
+}
+
+// Nhận thời gian giải mã trên isolate UI. begin() được gọi khi job được gửi đi và trả về
+// đối tượng bất kỳ (vd. RequestSpan), được truyền lại cho end() khi job xong hoặc lỗi.
+abstract class DecodeObserver {
+  Object? begin(String traceKey);
+  void end(Object? token, DecodeTiming timing);
+}
+
+class _Job {
+  final StreamController<List<dynamic>> controller = StreamController<List<dynamic>>();
+  Map<String, dynamic>? meta;
+  Object? trace;
+}
+
+// Các trường phân trang được chuyển kèm danh sách từ isolate nền
+Map<String, dynamic> extractPageMeta(dynamic decoded) {
+  if (decoded is! Map<String, dynamic>) return {};
+  return {
+    'nextCursor': decoded['nextCursor'],
+    'total': decoded['total'],
+  };
+}
+
+// Lấy danh sách phần tử từ envelope {success, data} của API
+List<dynamic> extractDataList(dynamic decoded) {
+  if (decoded is List) return decoded;
+  if (decoded is Map<String, dynamic>) {
+    if (decoded['success'] != true) {
+      // Chạy trên isolate nền (không có AppLog / Flutter), mức 900 = warning
+      developer.log('API error: ${decoded['message']}', name: 'JsonWorker', level: 900);
+      return [];
+    }
+    // Một số endpoint trả về chuỗi thông báo thay vì danh sách rỗng
+    final data = decoded['data'];
+    return data is List ? data : [];
+  }
+  return [];
+}
+
+void _workerMain(SendPort mainPort) {
+  final port = ReceivePort();
+  mainPort.send(port.sendPort);
+  port.listen((message) {
+    final job = message as List;
+    final id = job[0] as int;
+    try {
+      final body = job[1] as Uint8List;
+      final fromJson = job[2] as Function;
+      final batchSize = job[3] as int;
+
+      final watch = Stopwatch()..start();
+      final decoded = json.decode(utf8.decode(body));
+      final decodeTime = watch.elapsedMicroseconds;
+      mainPort.send([id, 'meta', extractPageMeta(decoded)]);
+      final items = extractDataList(decoded);
+      int mappingTime = 0;
+      for (int start = 0; start < items.length; start += batchSize) {
+        final end = start + batchSize < items.length ? start + batchSize : items.length;
+        final batch = <dynamic>[];
+        final batchStart = watch.elapsedMicroseconds;
+        for (int i = start; i < end; i++) {
+          batch.add(fromJson(items[i] as Map<String, dynamic>));
+        }
+        mappingTime += watch.elapsedMicroseconds - batchStart;
+        mainPort.send([id, 'batch', batch]);
+      }
+      mainPort.send([id, 'done', decodeTime, mappingTime, items.length]);
+    } catch (e) {
+      mainPort.send([id, 'error', e.toString()]);
+    }
+  });
+}
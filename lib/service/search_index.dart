@@ -0,0 +1,269 @@
+import '../models/song_summary.dart';
+
+// Chỉ mục tìm kiếm trong bộ nhớ cho danh sách bài hát.
+// Được dựng một lần khi danh sách thay đổi: mỗi bài hát được chuẩn hoá (chữ
+// thường, bỏ dấu tiếng Việt) theo từng trường title / artist / album / genre,
+// rồi đưa vào hai chỉ mục ngược:
+//  - tiền tố 1-2 ký tự của từng từ, dùng cho từ khoá ngắn ("c", "ch")
+//  - trigram của từng từ, dùng cho từ khoá từ 3 ký tự trở lên
+// Mỗi lần gõ phím chỉ phải giao các danh sách posting thay vì quét toàn bộ bài hát.
+class SearchIndex {
+  // Trọng số của từng trường khi xếp hạng, theo thứ tự _fields
+  static const List<int> fieldWeights = [8, 4, 2, 1];
+
+  final int length;
+
+  // _fields[doc] = [title, artist, album, genre] đã chuẩn hoá
+  final List<List<String>> _fields;
+  final Map<String, List<int>> _prefixIndex = {};
+  final Map<int, List<int>> _trigramIndex = {};
+
+  // Kết quả lần tìm trước, dùng để thu hẹp dần khi người dùng gõ thêm ký tự
+  List<String> _lastTerms = const [];
+  List<int>? _lastMatches;
+
+  SearchIndex(List<SongSummary> songs)
+      : length = songs.length,
+        _fields = List.generate(songs.length, (i) => _songFields(songs[i]), growable: false) {
+    for (int doc = 0; doc < _fields.length; doc++) {
+      for (final field in _fields[doc]) {
+        if (field.isEmpty) continue;
+        for (final word in field.split(' ')) {
+          _indexWord(doc, word);
+        }
+      }
+    }
+  }
+
+  static List<String> _songFields(SongSummary song) {
+    return [
+      foldForSearch(song.title),
+      foldForSearch(song.artistName ?? ''),
+      foldForSearch(song.albumTitle ?? ''),
+      foldForSearch(song.genreTitles?.join(' ') ?? ''),
+    ];
+  }
+
+  void _indexWord(int doc, String word) {
+    _addPosting(_prefixIndex.putIfAbsent(word.substring(0, 1), () => []), doc);
+    if (word.length >= 2) {
+      _addPosting(_prefixIndex.putIfAbsent(word.substring(0, 2), () => []), doc);
+    }
+    for (int i = 0; i + 3 <= word.length; i++) {
+      _addPosting(_trigramIndex.putIfAbsent(_trigramKey(word, i), () => []), doc);
+    }
+  }
+
+  // Các doc được thêm theo thứ tự tăng dần nên chỉ cần so với phần tử cuối để tránh trùng
+  static void _addPosting(List<int> postings, int doc) {
+    if (postings.isEmpty || postings.last != doc) postings.add(doc);
+  }
+
+  // Ghép ba code unit (16 bit) thành một số nguyên 48 bit. Ký tự đầu được nhân thay vì
+  // dịch bit: trên web int là số của JS, phép toán bit chỉ dùng 32 bit (dịch << 32
+  // làm mất ký tự đầu và các trigram khác nhau trùng khoá), còn 48 bit vẫn nằm trong
+  // 53 bit chính xác của double.
+  static int _trigramKey(String s, int i) {
+    return s.codeUnitAt(i) * 0x100000000 + ((s.codeUnitAt(i + 1) << 16) | s.codeUnitAt(i + 2));
+  }
+
+  // Trả về vị trí các bài hát khớp với [query], đã xếp hạng (điểm cao trước,
+  // cùng điểm thì giữ thứ tự ban đầu).
+  // Mỗi từ khoá phải khớp ít nhất một trường: từ khoá 1-2 ký tự khớp đầu từ,
+  // từ khoá dài hơn khớp ở bất kỳ vị trí nào trong từ.
+  List<int> search(String query) {
+    final folded = foldForSearch(query);
+    if (folded.isEmpty) {
+      _lastTerms = const [];
+      _lastMatches = null;
+      return List.generate(length, (i) => i);
+    }
+    final terms = folded.split(' ');
+
+    final matches = _canNarrow(terms)
+        ? _lastMatches!.where((doc) => _matchesAll(doc, terms)).toList()
+        : _lookup(terms);
+    _lastTerms = terms;
+    _lastMatches = matches;
+    return _rank(matches, terms, folded);
+  }
+
+  // Kết quả mới là tập con của kết quả cũ khi truy vấn mới chỉ gõ thêm vào truy
+  // vấn cũ, trừ lúc từ khoá cuối vượt từ 2 lên 3 ký tự (đổi từ khớp đầu từ
+  // sang khớp trong từ)
+  bool _canNarrow(List<String> terms) {
+    if (_lastMatches == null || _lastTerms.isEmpty || terms.length < _lastTerms.length) {
+      return false;
+    }
+    final lastIndex = _lastTerms.length - 1;
+    for (int i = 0; i < lastIndex; i++) {
+      if (terms[i] != _lastTerms[i]) return false;
+    }
+    final previous = _lastTerms[lastIndex];
+    final current = terms[lastIndex];
+    if (!current.startsWith(previous)) return false;
+    return previous.length >= 3 || current.length < 3;
+  }
+
+  List<int> _lookup(List<String> terms) {
+    // Từ khoá dài nhất thường chọn lọc nhất, xử lý trước để thu hẹp nhanh
+    final ordered = [...terms]..sort((a, b) => b.length.compareTo(a.length));
+    List<int>? candidates;
+    for (final term in ordered) {
+      candidates = _postingsFor(term, candidates);
+      if (candidates.isEmpty) break;
+    }
+    return candidates ?? [];
+  }
+
+  // Các doc khớp [term], giới hạn trong [candidates] nếu có
+  List<int> _postingsFor(String term, List<int>? candidates) {
+    if (term.length < 3) {
+      final postings = _prefixIndex[term] ?? const <int>[];
+      return candidates == null ? postings : _intersect(candidates, postings);
+    }
+
+    final lists = <List<int>>[];
+    for (int i = 0; i + 3 <= term.length; i++) {
+      final postings = _trigramIndex[_trigramKey(term, i)];
+      if (postings == null) return const [];
+      lists.add(postings);
+    }
+    lists.sort((a, b) => a.length.compareTo(b.length));
+    var result = candidates == null ? lists.first : _intersect(candidates, lists.first);
+    for (int i = 1; i < lists.length && result.isNotEmpty; i++) {
+      result = _intersect(result, lists[i]);
+    }
+    // Trigram chỉ là điều kiện cần, kiểm tra lại chuỗi con thật sự
+    if (term.length == 3) return result;
+    return result.where((doc) => _fields[doc].any((field) => field.contains(term))).toList();
+  }
+
+  bool _matchesAll(int doc, List<String> terms) {
+    final fields = _fields[doc];
+    for (final term in terms) {
+      bool matched = false;
+      for (final field in fields) {
+        if (term.length < 3 ? _hasWordPrefix(field, term) : field.contains(term)) {
+          matched = true;
+          break;
+        }
+      }
+      if (!matched) return false;
+    }
+    return true;
+  }
+
+  static bool _hasWordPrefix(String field, String term) {
+    return field.startsWith(term) || field.contains(' $term');
+  }
+
+  // Xếp hạng bằng bucket theo điểm (điểm là số nguyên nhỏ) để tránh sort O(n log n)
+  // khi từ khoá ngắn khớp rất nhiều bài hát
+  List<int> _rank(List<int> matches, List<String> terms, String query) {
+    final buckets = <int, List<int>>{};
+    for (final doc in matches) {
+      buckets.putIfAbsent(_score(doc, terms, query), () => []).add(doc);
+    }
+    final scores = buckets.keys.toList()..sort((a, b) => b.compareTo(a));
+    final ranked = <int>[];
+    for (final score in scores) {
+      ranked.addAll(buckets[score]!);
+    }
+    return ranked;
+  }
+
+  int _score(int doc, List<String> terms, String query) {
+    final fields = _fields[doc];
+    int score = 0;
+    for (final term in terms) {
+      for (int f = 0; f < fields.length; f++) {
+        final field = fields[f];
+        if (_hasWordPrefix(field, term)) {
+          score += fieldWeights[f] * 2;
+        } else if (field.contains(term)) {
+          score += fieldWeights[f];
+        }
+      }
+    }
+    final title = fields[0];
+    if (title == query) {
+      score += 50;
+    } else if (title.startsWith(query)) {
+      score += 20;
+    }
+    return score;
+  }
+
+  static List<int> _intersect(List<int> a, List<int> b) {
+    final result = <int>[];
+    int i = 0;
+    int j = 0;
+    while (i < a.length && j < b.length) {
+      final x = a[i];
+      final y = b[j];
+      if (x == y) {
+        result.add(x);
+        i++;
+        j++;
+      } else if (x < y) {
+        i++;
+      } else {
+        j++;
+      }
+    }
+    return result;
+  }
+}
+
+// Bảng bỏ dấu: chữ tiếng Việt và các chữ Latin có dấu thường gặp
+const Map<String, String> _foldGroups = {
+  'a': 'àáạảãâầấậẩẫăằắặẳẵäåāą',
+  'c': 'çćč',
+  'd': 'đð',
+  'e': 'èéẹẻẽêềếệểễëēę',
+  'i': 'ìíịỉĩîïī',
+  'n': 'ñń',
+  'o': 'òóọỏõôồốộổỗơờớợởỡöøō',
+  's': 'śš',
+  'u': 'ùúụủũưừứựửữûüū',
+  'y': 'ỳýỵỷỹÿ',
+  'z': 'źżž',
+};
+
+final Map<int, int> _foldTable = () {
+  final table = <int, int>{};
+  _foldGroups.forEach((base, accented) {
+    for (final rune in accented.runes) {
+      table[rune] = base.codeUnitAt(0);
+    }
+  });
+  return table;
+}();
+
+// Chuẩn hoá chuỗi để so khớp: chữ thường, bỏ dấu (kể cả dấu tổ hợp dạng NFD),
+// ký tự không phải chữ/số thành khoảng trắng, gộp các khoảng trắng liên tiếp.
+// Ví dụ: "Chạy Ngay Đi!" -> "chay ngay di"
+String foldForSearch(String input) {
+  final buffer = StringBuffer();
+  bool pendingSpace = false;
+  for (final rune in input.toLowerCase().runes) {
+    // Dấu tổ hợp (U+0300..U+036F)
+    if (rune >= 0x300 && rune <= 0x36F) continue;
+
+    final folded = _foldTable[rune] ?? rune;
+    final isWordChar = (folded >= 0x61 && folded <= 0x7A) ||
+        (folded >= 0x30 && folded <= 0x39) ||
+        (folded >= 0xC0 && !(folded >= 0x2000 && folded <= 0x206F));
+    if (!isWordChar) {
+      pendingSpace = buffer.isNotEmpty;
+      continue;
+    }
+    if (pendingSpace) {
+      buffer.write(' ');
+      pendingSpace = false;
+    }
+    buffer.writeCharCode(folded);
+  }
+  return buffer.toString();
+}
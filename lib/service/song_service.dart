@@ -1,48 +1,101 @@
 import 'dart:convert';
-import 'package:http/http.dart' as http;
-import 'package:shared_preferences/shared_preferences.dart';
+import 'dart:typed_data';
+import '../models/page_result.dart';
 import '../models/song.dart';
+import '../models/song_summary.dart';
+import '../utils/app_log.dart';
+import 'api_client.dart';
+import 'catalog_cache.dart';
+import 'json_worker.dart';
 
 class SongService {
-  final String baseUrl = "http://10.0.2.2:8080";
+  static const int defaultPageSize = 50;
 
-  Future<List<Song>> fetchSongs() async {
-    try {
-      // Lấy access token từ SharedPreferences
-      final prefs = await SharedPreferences.getInstance();
-      final accessToken = prefs.getString('accessToken');
+  // Danh sách chỉ cần các trường hiển thị: server bỏ lyrics / description /
+  // comments / likes và chỉ trả {_id, title} cho artist / album / genre
+  static const Map<String, String> summaryQuery = {'view': 'summary'};
 
-      if (accessToken == null) {
-        print("Không có access token được lưu trữ");
-        throw Exception('Không có access token');
-      }
+  final CatalogCache _catalogCache = CatalogCache();
+  final JsonWorker _jsonWorker = JsonWorker();
+  final ApiClient _apiClient = ApiClient();
 
-      // Thêm header Authorization vào yêu cầu
-      final response = await http.get(
-        Uri.parse('$baseUrl/api/v1/song'),
-        headers: {
-          'Authorization': 'Bearer $accessToken',
-          'Content-Type': 'application/json',
-        },
+  // Trả về danh sách từ cache nếu có, onUpdated được gọi khi server có dữ liệu mới
+  Future<List<SongSummary>> fetchSongs({
+    bool forceRefresh = false,
+    void Function(List<SongSummary> songs)? onUpdated,
+  }) async {
+    try {
+      final body = await _catalogCache.getBody(
+        '/api/v1/song',
+        query: summaryQuery,
+        forceRefresh: forceRefresh,
+        onRevalidated: onUpdated == null
+            ? null
+            : (fresh) async {
+                onUpdated(await _parseSongs(fresh));
+              },
       );
+      return await _parseSongs(body);
+    } catch (e) {
+      AppLog.e('SongService', "Lỗi khi lấy bài hát", e);
+      return [];
+    }
+  }
+
+  // Lấy một trang bài hát theo cursor (cursor = null là trang đầu tiên)
+  Future<PageResult<SongSummary>> fetchSongsPage({
+    String? cursor,
+    int limit = defaultPageSize,
+    bool forceRefresh = false,
+  }) async {
+    final query = {
+      ...summaryQuery,
+      'limit': '$limit',
+      if (cursor != null) 'cursor': cursor,
+    };
+    final body = await _catalogCache.getBody('/api/v1/song', query: query, forceRefresh: forceRefresh);
+    final page = await _jsonWorker.parsePage(
+      body,
+      SongSummary.fromJson,
+      traceKey: CatalogCache.keyFor('/api/v1/song', query),
+    );
+    return PageResult(
+      items: page.items,
+      nextCursor: page.meta['nextCursor']?.toString(),
+      total: (page.meta['total'] as num?)?.toInt(),
+    );
+  }
+
+  // Chi tiết đầy đủ của một bài hát (lyrics, comments, likes), không qua cache trên đĩa
+  Future<Song?> getSongById(String id) async {
+    try {
+      final response = await _apiClient.get('/api/v1/song/$id');
 
       if (response.statusCode == 200) {
         final data = json.decode(response.body);
-        print("API response: $data"); // In dữ liệu để debug
+
         if (data['success'] == true) {
-          return (data['data'] as List).map((json) => Song.fromJson(json)).toList();
+          return Song.fromJson(data['data']);
         } else {
-          print('API error: ${data['message']}');
-          return [];
+          AppLog.w('SongService', 'API error: ${data['message']}');
+          return null;
         }
       } else {
-        print('Error: ${response.statusCode}');
-        print('Response body: ${response.body}');
-        return [];
+        AppLog.w('SongService', 'Lỗi lấy bài hát $id. Mã lỗi: ${response.statusCode}');
+        return null;
       }
     } catch (e) {
-      print("Lỗi khi lấy bài hát: $e");
-      return [];
+      AppLog.e('SongService', "Lỗi khi lấy chi tiết bài hát", e);
+      return null;
     }
   }
+
+  // Giải mã và dựng model trên isolate nền
+  Future<List<SongSummary>> _parseSongs(Uint8List body) {
+    return _jsonWorker.parseList(
+      body,
+      SongSummary.fromJson,
+      traceKey: CatalogCache.keyFor('/api/v1/song', summaryQuery),
+    );
+  }
 }
\ No newline at end of file
@@ -0,0 +1,162 @@
+import 'dart:convert';
+import 'package:flutter/foundation.dart';
+import 'package:shared_preferences/shared_preferences.dart';
+import '../models/album.dart';
+import '../models/genre.dart';
+import '../models/song_summary.dart';
+import '../models/user.dart';
+import '../providers/audio_provider.dart';
+import '../utils/app_log.dart';
+import '../utils/network_trace.dart';
+import '../utils/startup_timeline.dart';
+import 'api_client.dart';
+import 'catalog_cache.dart';
+import 'catalog_repository.dart';
+import 'user_service.dart';
+
+// Dữ liệu trang chủ được tải song song khi khởi động
+typedef HomeCatalog = ({List<SongSummary> songs, List<Album> albums, List<Genre> genres});
+
+// Điều phối quá trình khởi động để không màn hình nào phải chờ mạng trước khi hiển thị:
+// - Phiên đăng nhập được khôi phục ngay từ accessToken / user_data đã lưu,
+//   việc kiểm tra token với server chạy ở nền.
+// - Bài hát, album, thể loại được tải song song ngay khi mở ứng dụng,
+//   HomeScreen chỉ nhận lại kết quả đã (hoặc đang) tải.
+class StartupCoordinator {
+  static const int homeAlbumCount = 5;
+
+  static final StartupCoordinator _instance = StartupCoordinator._internal();
+  factory StartupCoordinator() => _instance;
+  StartupCoordinator._internal();
+
+  final ApiClient _apiClient = ApiClient();
+  final UserService _userService = UserService();
+  final CatalogRepository _repository = CatalogRepository();
+
+  // Người dùng hiện tại: bản lưu trên máy, sau đó là bản từ server
+  final ValueNotifier<User?> user = ValueNotifier<User?>(null);
+  // Chuyển thành false khi server từ chối token đã lưu
+  final ValueNotifier<bool> signedIn = ValueNotifier<bool>(false);
+  // Danh sách bài hát mới khi cache được làm mới ở nền
+  final ValueNotifier<List<SongSummary>?> refreshedSongs = ValueNotifier<List<SongSummary>?>(null);
+
+  Future<User?>? _validation;
+  Future<HomeCatalog>? _catalog;
+
+  // Chỉ đọc dữ liệu trên máy, không gọi mạng. Trả về true nếu có token.
+  Future<bool> restoreSession() async {
+    final token = await _apiClient.getToken();
+    if (token == null) {
+      signedIn.value = false;
+      return false;
+    }
+
+    final prefs = await SharedPreferences.getInstance();
+    final userJson = prefs.getString('user_data');
+    if (userJson != null) {
+      try {
+        user.value = User.fromJson(jsonDecode(userJson) as Map<String, dynamic>);
+      } catch (e) {
+        AppLog.w('StartupCoordinator', "Cached user_data is invalid", e);
+      }
+    }
+    signedIn.value = true;
+    StartupTimeline.mark('session_restored');
+    return true;
+  }
+
+  // Kiểm tra token với server, các lời gọi trùng nhau dùng chung một request
+  Future<User?> validateSession() => _validation ??= _validate();
+
+  Future<User?> _validate() async {
+    try {
+      final fresh = await _userService.validateSession();
+      if (fresh == null) {
+        // Token không hợp lệ, xóa phiên đã lưu
+        await signOut();
+        return null;
+      }
+      user.value = fresh;
+      signedIn.value = true;
+      return fresh;
+    } catch (e) {
+      AppLog.w('StartupCoordinator', "Session validation failed, keeping cached session", e);
+      if (user.value == null) {
+        // Không có dữ liệu user trên máy, không thể tiếp tục phiên
+        await signOut();
+      }
+      return user.value;
+    } finally {
+      StartupTimeline.mark('session_validated');
+    }
+  }
+
+  // Người dùng hiện tại: dùng ngay bản lưu trên máy nếu có, nếu không thì chờ server
+  Future<User?> currentUser() async {
+    if (user.value == null && !await restoreSession()) return null;
+    return user.value ?? await validateSession();
+  }
+
+  // Bắt đầu tải dữ liệu trang chủ, các lần gọi sau nhận lại cùng kết quả
+  Future<HomeCatalog> loadCatalog({bool forceRefresh = false}) {
+    final existing = _catalog;
+    if (existing != null && !forceRefresh) return existing;
+    final catalog = _loadCatalog(forceRefresh);
+    _catalog = catalog;
+    catalog.then((result) {
+      // Không giữ kết quả rỗng (vd. lỗi mạng) để lần sau tải lại
+      if (result.songs.isEmpty && identical(_catalog, catalog)) _catalog = null;
+    });
+    return catalog;
+  }
+
+  Future<HomeCatalog> _loadCatalog(bool forceRefresh) async {
+    // Tạo cả ba future trước khi chờ để các request chạy song song
+    final songs = _orEmpty('songs', _repository.fetchSongs(
+      forceRefresh: forceRefresh,
+      onUpdated: (fresh) => refreshedSongs.value = fresh,
+    ));
+    final albums = _orEmpty('albums', _repository
+        .fetchAlbumsPage(limit: homeAlbumCount, forceRefresh: forceRefresh)
+        .then((page) => page.items));
+    final genres = _orEmpty('genres', _repository.fetchGenres(forceRefresh: forceRefresh));
+
+    final catalog = (songs: await songs, albums: await albums, genres: await genres);
+    StartupTimeline.mark('catalog_ready');
+    AppLog.d('StartupCoordinator', () => 'Catalog ready\n${NetworkTrace.summary()}');
+    return catalog;
+  }
+
+  Future<List<T>> _orEmpty<T>(String label, Future<List<T>> future) {
+    return future.catchError((Object e) {
+      AppLog.w('StartupCoordinator', "Failed to fetch $label", e);
+      return <T>[];
+    });
+  }
+
+  // Đăng nhập / đăng ký thành công: dùng token và user_data vừa được lưu,
+  // bắt đầu tải dữ liệu trang chủ cho người dùng mới
+  Future<void> startSession() async {
+    _validation = null;
+    _catalog = null;
+    refreshedSongs.value = null;
+    if (await restoreSession()) loadCatalog();
+  }
+
+  // Đăng xuất: xóa token, user_data và trạng thái đã tải cho người dùng trước
+  Future<void> signOut() async {
+    await _apiClient.setToken(null);
+    final prefs = await SharedPreferences.getInstance();
+    await prefs.remove('user_data');
+    // Danh sách và ETag trên đĩa, thực thể trong bộ nhớ và hàng đợi phát thuộc phiên trước
+    await CatalogCache().clear();
+    _repository.clear();
+    await AudioProvider().clearQueue();
+    user.value = null;
+    _validation = null;
+    _catalog = null;
+    refreshedSongs.value = null;
+    // Báo sau cùng để màn hình nhận được trạng thái đã xóa
+    signedIn.value = false;
+  }
+}
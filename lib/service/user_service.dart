@@ -1,12 +1,11 @@
 import 'dart:convert';
-import 'package:http/http.dart' as http;
 import 'package:shared_preferences/shared_preferences.dart';
 import '../models/user.dart';
+import '../utils/app_log.dart';
+import 'api_client.dart';
 
 class UserService {
-  final String baseUrl;
-
-  UserService({required this.baseUrl});
+  final ApiClient _apiClient = ApiClient();
 
   // Đăng ký người dùng
   Future<Map<String, dynamic>> register({
@@ -17,26 +16,24 @@ class UserService {
     required String password,
     required String address,
   }) async {
-    final url = Uri.parse('$baseUrl/api/v1/user/register');
-    final response = await http.post(
-      url,
-      body: json.encode({
+    final response = await _apiClient.post(
+      '/api/v1/user/register',
+      body: {
         'firstName': firstName,
         'lastName': lastName,
         'email': email,
         'mobile': mobile,
         'password': password,
         'address': address,
-      }),
-      headers: {'Content-Type': 'application/json'},
+      },
     );
 
     if (response.statusCode == 201) {
       final responseData = json.decode(response.body);
       return responseData;
     } else {
-      print('Đăng ký không thành công. Mã lỗi: ${response.statusCode}');
-      print('Lý do: ${response.body}');
+      AppLog.w('UserService', 'Đăng ký không thành công. Mã lỗi: ${response.statusCode}');
+      AppLog.d('UserService', () => 'Lý do: ${response.body}');
       throw Exception('Đăng ký không thành công');
     }
   }
@@ -46,30 +43,27 @@ class UserService {
     required String email,
     required String password,
   }) async {
-    final url = Uri.parse('$baseUrl/api/v1/user/login');
-    final response = await http.post(
-      url,
-      body: json.encode({
+    final response = await _apiClient.post(
+      '/api/v1/user/login',
+      body: {
         'email': email,
         'password': password,
-      }),
-      headers: {'Content-Type': 'application/json'},
+      },
     );
 
     if (response.statusCode == 200) {
       final responseData = json.decode(response.body);
+      await _apiClient.setToken(responseData['accessToken']);
       final prefs = await SharedPreferences.getInstance();
-      await prefs.setString('accessToken', responseData['accessToken']);
       await prefs.setString('user_data', json.encode(responseData['userData']));
       return responseData;
     } else {
-      print('Đăng nhập không thành công. Mã lỗi: ${response.statusCode}');
-      print('Lý do: ${response.body}');
+      AppLog.w('UserService', 'Đăng nhập không thành công. Mã lỗi: ${response.statusCode}');
       try {
         final responseData = json.decode(response.body);
-        print('Thông báo lỗi từ server: ${responseData['message']}');
+        AppLog.w('UserService', 'Thông báo lỗi từ server: ${responseData['message']}');
       } catch (e) {
-        print('Không thể phân tích lỗi từ response body.');
+        AppLog.w('UserService', 'Không thể phân tích lỗi từ response body.');
       }
       throw Exception('Đăng nhập không thành công');
     }
@@ -78,49 +72,53 @@ class UserService {
   // Lấy thông tin người dùng hiện tại
   Future<User?> getCurrentUser() async {
     try {
-      final prefs = await SharedPreferences.getInstance();
-      final accessToken = prefs.getString('accessToken');
+      final accessToken = await _apiClient.getToken();
 
       if (accessToken == null) {
-        print('Không có access token');
+        AppLog.d('UserService', () => 'Không có access token');
         return null;
       }
 
-      print('Token used for getCurrentUser: $accessToken');
-
-      final url = Uri.parse('$baseUrl/api/v1/user/current');
-      final response = await http.get(
-        url,
-        headers: {
-          'Authorization': 'Bearer $accessToken',
-          'Content-Type': 'application/json',
-        },
-      );
-
-      print('Response from getCurrentUser: ${response.statusCode} - ${response.body}');
+      final response = await _apiClient.get('/api/v1/user/current');
 
       if (response.statusCode == 200) {
         final data = json.decode(response.body);
-        print('Dữ liệu người dùng: $data');
         if (data['success'] == true) {
           final userData = data['response'] ?? data['userData'];
           if (userData == null) {
-            print('User data not found in response');
+            AppLog.w('UserService', 'User data not found in response');
             return null;
           }
           return User.fromJson(userData);
         } else {
-          print('Failed to fetch user: ${data['message']}');
+          AppLog.w('UserService', 'Failed to fetch user: ${data['message']}');
           return null;
         }
       } else {
-        print('Lỗi lấy thông tin người dùng. Mã lỗi: ${response.statusCode}');
-        print('Lý do: ${response.body}');
+        AppLog.w('UserService', 'Lỗi lấy thông tin người dùng. Mã lỗi: ${response.statusCode}');
         return null;
       }
     } catch (e) {
-      print('Error in getCurrentUser: $e');
+      AppLog.e('UserService', 'Error in getCurrentUser', e);
+      return null;
+    }
+  }
+
+  // Kiểm tra token đã lưu với server khi khởi động.
+  // Trả về null nếu token không còn hợp lệ, ném lỗi nếu không kết nối được
+  // (khi đó bên gọi vẫn giữ phiên đã lưu trên máy).
+  Future<User?> validateSession() async {
+    final response = await _apiClient.get('/api/v1/user/current');
+    if (response.statusCode == 401 || response.statusCode == 403) {
       return null;
     }
+    if (response.statusCode != 200) {
+      throw Exception('Lỗi kiểm tra phiên đăng nhập. Mã lỗi: ${response.statusCode}');
+    }
+
+    final data = json.decode(response.body);
+    if (data['success'] != true) return null;
+    final userData = data['response'] ?? data['userData'];
+    return userData == null ? null : User.fromJson(userData);
   }
-}
\ No newline at end of file
+}
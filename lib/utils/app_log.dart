@@ -0,0 +1,60 @@
+import 'package:flutter/foundation.dart';
+
+enum LogLevel { verbose, debug, info, warning, error, off }
+
+// Ghi log theo mức, thay cho print() rải rác trong các service.
+// Mức tối thiểu được cố định lúc biên dịch: mặc định debug khi phát triển và
+// warning trong bản release, có thể đổi bằng --dart-define=LOG_LEVEL=verbose|debug|info|warning|error|off.
+// Các nhánh dưới mức tối thiểu là hằng false nên bị trình biên dịch loại bỏ;
+// v() / d() nhận closure để chuỗi log không bị dựng khi mức đó bị tắt.
+//
+// Dòng log có dạng "<mức>/<tag>: <nội dung>", vd. "W/CatalogCache: Lỗi khi ghi cache ...".
+class AppLog {
+  static const String _configuredLevel = String.fromEnvironment('LOG_LEVEL');
+
+  static const LogLevel minLevel = _configuredLevel == 'verbose'
+      ? LogLevel.verbose
+      : _configuredLevel == 'debug'
+          ? LogLevel.debug
+          : _configuredLevel == 'info'
+              ? LogLevel.info
+              : _configuredLevel == 'warning'
+                  ? LogLevel.warning
+                  : _configuredLevel == 'error'
+                      ? LogLevel.error
+                      : _configuredLevel == 'off'
+                          ? LogLevel.off
+                          : (kReleaseMode ? LogLevel.warning : LogLevel.debug);
+
+  static const bool verboseEnabled = identical(minLevel, LogLevel.verbose);
+  static const bool debugEnabled = verboseEnabled || identical(minLevel, LogLevel.debug);
+  static const bool infoEnabled = debugEnabled || identical(minLevel, LogLevel.info);
+  static const bool warningEnabled = infoEnabled || identical(minLevel, LogLevel.warning);
+  static const bool errorEnabled = warningEnabled || identical(minLevel, LogLevel.error);
+
+  static void v(String tag, String Function() message) {
+    if (verboseEnabled) _emit('V', tag, message());
+  }
+
+  static void d(String tag, String Function() message) {
+    if (debugEnabled) _emit('D', tag, message());
+  }
+
+  static void i(String tag, String message) {
+    if (infoEnabled) _emit('I', tag, message);
+  }
+
+  static void w(String tag, String message, [Object? error]) {
+    if (warningEnabled) _emit('W', tag, error == null ? message : '$message: $error');
+  }
+
+  static void e(String tag, String message, [Object? error, StackTrace? stackTrace]) {
+    if (!errorEnabled) return;
+    _emit('E', tag, error == null ? message : '$message: $error');
+    if (stackTrace != null) _emit('E', tag, stackTrace.toString());
+  }
+
+  static void _emit(String level, String tag, String message) {
+    debugPrint('$level/$tag: $message');
+  }
+}
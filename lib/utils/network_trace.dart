@@ -0,0 +1,200 @@
+import 'dart:collection';
+import 'dart:convert';
+import 'package:flutter/foundation.dart';
+import '../service/json_worker.dart';
+import 'app_log.dart';
+
+// Một lần lấy dữ liệu: request mạng (hoặc đọc cache trên đĩa) cùng thời gian
+// giải mã JSON và dựng model trên isolate nền.
+class RequestSpan {
+  final String key; // path + query, không chứa header / token
+  final String method;
+  final String source; // 'network' hoặc 'cache'
+  final DateTime startedAt = DateTime.now();
+  final Stopwatch _watch = Stopwatch()..start();
+
+  int? status;
+  int bytes = 0;
+  int attempts = 0;
+  Duration? timeToFirstByte;
+  Duration? transfer; // Từ lúc bắt đầu đến khi nhận xong body (hoặc đọc xong cache)
+  Duration? decode;
+  Duration? mapping;
+  int? items;
+  String? error;
+
+  RequestSpan(this.key, {this.method = 'GET', this.source = 'network'});
+
+  void firstByte() => timeToFirstByte = _watch.elapsed;
+
+  void received(int statusCode, int length) {
+    status = statusCode;
+    bytes = length;
+    transfer = _watch.elapsed;
+  }
+
+  void failed(Object e) {
+    error = e.toString();
+    transfer = _watch.elapsed;
+  }
+
+  void decoded(Duration decodeTime, Duration mappingTime, int count) {
+    decode = decodeTime;
+    mapping = mappingTime;
+    items = count;
+  }
+
+  Map<String, dynamic> toJson() => {
+    'key': key,
+    'method': method,
+    'source': source,
+    'startedAt': startedAt.toIso8601String(),
+    'status': status,
+    'bytes': bytes,
+    'attempts': attempts,
+    'ttfbMs': timeToFirstByte?.inMilliseconds,
+    'transferMs': transfer?.inMilliseconds,
+    'decodeMs': decode?.inMilliseconds,
+    'mappingMs': mapping?.inMilliseconds,
+    'items': items,
+    'error': error,
+  };
+
+  @override
+  String toString() {
+    final parts = <String>[
+      '$method $key',
+      source,
+      if (status != null) 'status=$status',
+      'bytes=$bytes',
+      if (timeToFirstByte != null) 'ttfb=${timeToFirstByte!.inMilliseconds}ms',
+      if (transfer != null) 'transfer=${transfer!.inMilliseconds}ms',
+      if (decode != null) 'decode=${decode!.inMilliseconds}ms',
+      if (mapping != null) 'map=${mapping!.inMilliseconds}ms',
+      if (items != null) 'items=$items',
+      if (error != null) 'error=$error',
+    ];
+    return parts.join(' ');
+  }
+}
+
+// Thu thập RequestSpan của các lần tải gần nhất để biết thời gian tải trang
+// nằm ở đâu (mạng, giải mã hay dựng model).
+// Mặc định bật khi phát triển và tắt trong bản release, có thể bật cho bản
+// profile / release bằng --dart-define=NETWORK_TRACE=true.
+//
+// Span có body cần giải mã được giữ trong hàng chờ theo key cho tới khi
+// JsonWorker nhận body đó (parseList / parsePage với cùng traceKey).
+class NetworkTrace {
+  static const bool enabled = bool.fromEnvironment('NETWORK_TRACE', defaultValue: !kReleaseMode);
+  static const int maxSpans = 200;
+  static const int _maxAwaitingPerKey = 4;
+
+  static final ListQueue<RequestSpan> _spans = ListQueue<RequestSpan>();
+  static final Map<String, ListQueue<RequestSpan>> _awaitingDecode = {};
+
+  static List<RequestSpan> get spans => List.unmodifiable(_spans);
+
+  static RequestSpan? begin(String key, {String method = 'GET'}) {
+    if (!enabled) return null;
+    return _record(RequestSpan(key, method: method));
+  }
+
+  // Body được lấy từ cache trên đĩa thay vì từ mạng
+  static RequestSpan? cacheHit(String key, int bytes, Duration readTime) {
+    if (!enabled) return null;
+    final span = RequestSpan(key, source: 'cache')
+      ..bytes = bytes
+      ..transfer = readTime;
+    return _record(span);
+  }
+
+  static RequestSpan _record(RequestSpan span) {
+    _spans.addLast(span);
+    if (_spans.length > maxSpans) _spans.removeFirst();
+    return span;
+  }
+
+  // Body của span sẽ được giải mã bởi JsonWorker
+  static void awaitDecode(RequestSpan? span) {
+    if (span == null) return;
+    final queue = _awaitingDecode.putIfAbsent(span.key, () => ListQueue<RequestSpan>());
+    queue.addLast(span);
+    while (queue.length > _maxAwaitingPerKey) {
+      finish(queue.removeFirst()); // Body không được giải mã (vd. không ai dùng kết quả)
+    }
+  }
+
+  static RequestSpan? takeAwaitingDecode(String? key) {
+    if (!enabled || key == null) return null;
+    final queue = _awaitingDecode[key];
+    if (queue == null || queue.isEmpty) return null;
+    final span = queue.removeFirst();
+    if (queue.isEmpty) _awaitingDecode.remove(key);
+    return span;
+  }
+
+  // Gắn vào JsonWorker().decodeObserver (main.dart): thời gian giải mã do isolate nền gửi về
+  // được ghi vào span đang chờ giải mã của traceKey, trên isolate UI.
+  static const DecodeObserver decodeObserver = _DecodeObserver();
+
+  static void finish(RequestSpan? span) {
+    if (span == null) return;
+    AppLog.d('NetworkTrace', () => span.toString());
+  }
+
+  static void reset() {
+    _spans.clear();
+    _awaitingDecode.clear();
+  }
+
+  static String exportJson() => json.encode(_spans.map((span) => span.toJson()).toList());
+
+  // Tổng hợp theo key: số lần, dung lượng và tổng thời gian từng giai đoạn
+  static String summary() {
+    final byKey = <String, List<RequestSpan>>{};
+    for (final span in _spans) {
+      byKey.putIfAbsent(span.key, () => []).add(span);
+    }
+
+    int ms(Iterable<Duration?> durations) =>
+        durations.fold<int>(0, (sum, d) => sum + (d?.inMilliseconds ?? 0));
+
+    final lines = <String>[];
+    for (final entry in byKey.entries) {
+      final spans = entry.value;
+      final network = spans.where((s) => s.source == 'network').length;
+      lines.add('${entry.key}: count=${spans.length} (network=$network, cache=${spans.length - network})'
+          ' bytes=${spans.fold<int>(0, (sum, s) => sum + s.bytes)}'
+          ' ttfb=${ms(spans.map((s) => s.timeToFirstByte))}ms'
+          ' transfer=${ms(spans.map((s) => s.transfer))}ms'
+          ' decode=${ms(spans.map((s) => s.decode))}ms'
+          ' map=${ms(spans.map((s) => s.mapping))}ms'
+          '${spans.any((s) => s.error != null) ? ' errors=${spans.where((s) => s.error != null).length}' : ''}');
+    }
+    lines.add('total: requests=${_spans.length}'
+        ' bytes=${_spans.fold<int>(0, (sum, s) => sum + s.bytes)}'
+        ' transfer=${ms(_spans.map((s) => s.transfer))}ms'
+        ' decode=${ms(_spans.map((s) => s.decode))}ms'
+        ' map=${ms(_spans.map((s) => s.mapping))}ms');
+    return lines.join('\n');
+  }
+}
+
+class _DecodeObserver implements DecodeObserver {
+  const _DecodeObserver();
+
+  @override
+  Object? begin(String traceKey) => NetworkTrace.takeAwaitingDecode(traceKey);
+
+  @override
+  void end(Object? token, DecodeTiming timing) {
+    if (token is! RequestSpan) return;
+    if (timing.error != null) {
+      token.error = timing.error;
+    } else {
+      token.decoded(timing.decode ?? Duration.zero, timing.mapping ?? Duration.zero, timing.items ?? 0);
+    }
+    NetworkTrace.finish(token);
+  }
+}
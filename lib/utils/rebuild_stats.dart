@@ -0,0 +1,26 @@
+import 'package:flutter/foundation.dart';
+
+// Đếm số lần build của các widget được đánh dấu, dùng để kiểm tra một thay đổi
+// có thực sự giảm số lần rebuild hay không (vd. mini-player khi đang phát nhạc).
+// Không làm gì trong bản release.
+//
+// Cách dùng: gọi RebuildStats.record('MusicPlayer') trong build(), sau đó đọc
+// RebuildStats.counts hoặc in RebuildStats.summary() từ DevTools / test.
+class RebuildStats {
+  static bool enabled = !kReleaseMode;
+  static final Map<String, int> counts = {};
+
+  static void record(String label) {
+    if (!enabled) return;
+    counts[label] = (counts[label] ?? 0) + 1;
+  }
+
+  static int countOf(String label) => counts[label] ?? 0;
+
+  static void reset() => counts.clear();
+
+  static String summary() {
+    final labels = counts.keys.toList()..sort();
+    return labels.map((label) => '$label: ${counts[label]}').join('\n');
+  }
+}
@@ -0,0 +1,36 @@
+import 'package:flutter/foundation.dart';
+
+// Các mốc thời gian khi khởi động ứng dụng, tính từ lúc main() bắt đầu chạy.
+// Mỗi mốc chỉ được ghi lần đầu tiên và được in ra log theo dạng cố định để
+// có thể đọc từ logcat, vd:
+//   StartupTimeline: first_frame +412ms
+//
+// Các mốc hiện có: process_start, session_restored, first_frame,
+// session_validated, catalog_ready, home_data_ready.
+class StartupTimeline {
+  static const String logTag = 'StartupTimeline';
+
+  static final Stopwatch _clock = Stopwatch();
+  static final Map<String, Duration> marks = {};
+
+  // Gọi ở dòng đầu tiên của main()
+  static void start() {
+    if (_clock.isRunning) return;
+    _clock.start();
+    mark('process_start');
+  }
+
+  static void mark(String name) {
+    if (!_clock.isRunning || marks.containsKey(name)) return;
+    final elapsed = _clock.elapsed;
+    marks[name] = elapsed;
+    debugPrint('$logTag: $name +${elapsed.inMilliseconds}ms');
+  }
+
+  static Duration? elapsedAt(String name) => marks[name];
+
+  static String summary() {
+    final entries = marks.entries.toList()..sort((a, b) => a.value.compareTo(b.value));
+    return entries.map((e) => '${e.key}: +${e.value.inMilliseconds}ms').join('\n');
+  }
+}
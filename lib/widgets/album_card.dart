@@ -1,12 +1,13 @@
 import 'package:flutter/material.dart';
+import 'cover_image.dart';
 
 class AlbumCard extends StatelessWidget {
-  final String imagePath;
+  final String? imagePath;
   final String title;
 
   const AlbumCard({
     Key? key,
-    required this.imagePath,
+    this.imagePath,
     required this.title,
   }) : super(key: key);
 
@@ -25,17 +26,11 @@ class AlbumCard extends StatelessWidget {
             // Container chính với ảnh bìa
             ClipRRect(
               borderRadius: BorderRadius.circular(12),
-              child: Image.network(
-                imagePath,
+              child: CoverImage(
+                url: imagePath,
                 width: 160,
                 height: 200,
-                fit: BoxFit.cover,
-                errorBuilder: (context, error, stackTrace) => Container(
-                  width: 160,
-                  height: 200,
-                  color: Colors.grey[300],
-                  child: const Icon(Icons.album, size: 60, color: Colors.grey),
-                ),
+                placeholderIcon: Icons.album,
               ),
             ),
             // Gradient overlay để làm nổi bật tiêu đề
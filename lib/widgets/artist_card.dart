@@ -1,10 +1,11 @@
 import 'package:flutter/material.dart';
+import 'cover_image.dart';
 
 class ArtistCard extends StatelessWidget {
   final String name;
-  final String imagePath;
+  final String? imagePath;
 
-  const ArtistCard({super.key, required this.name, required this.imagePath});
+  const ArtistCard({super.key, required this.name, this.imagePath});
 
   @override
   Widget build(BuildContext context) {
@@ -14,19 +15,11 @@ class ArtistCard extends StatelessWidget {
         children: [
           ClipRRect(
             borderRadius: BorderRadius.circular(50),
-            child: Image.network(
-              imagePath,
+            child: CoverImage(
+              url: imagePath,
               width: 80,
               height: 80,
-              fit: BoxFit.cover,
-              errorBuilder: (context, error, stackTrace) {
-                return Image.network(
-                  'https://via.placeholder.com/80',
-                  width: 80,
-                  height: 80,
-                  fit: BoxFit.cover,
-                );
-              },
+              placeholderIcon: Icons.person,
             ),
           ),
           const SizedBox(height: 8),
@@ -0,0 +1,90 @@
+import 'dart:collection';
+import 'package:cached_network_image/cached_network_image.dart';
+import 'package:flutter/material.dart';
+import '../service/cover_cache.dart';
+
+// Ảnh bìa / ảnh ca sĩ dùng chung cho toàn ứng dụng.
+// Tải qua CoverCacheManager (cache trên đĩa) và giải mã đúng kích thước hiển thị
+// thay vì giải mã ảnh gốc cho một thumbnail 50px.
+class CoverImage extends StatelessWidget {
+  final String? url;
+  final double width;
+  final double height;
+  final BoxFit fit;
+  final IconData placeholderIcon;
+  final Color? placeholderColor;
+
+  const CoverImage({
+    super.key,
+    required this.url,
+    required this.width,
+    required this.height,
+    this.fit = BoxFit.cover,
+    this.placeholderIcon = Icons.music_note,
+    this.placeholderColor,
+  });
+
+  // Các key đã tải trước gần đây, tránh gọi precacheImage lặp lại mỗi lần build
+  static final LinkedHashSet<String> _prefetched = LinkedHashSet<String>();
+  static const int _maxPrefetched = 200;
+
+  static bool _isValidUrl(String? url) {
+    if (url == null) return false;
+    final trimmed = url.trim();
+    return trimmed.startsWith('http://') || trimmed.startsWith('https://');
+  }
+
+  // Provider giải mã theo chiều lớn hơn của ô hiển thị (giữ tỉ lệ ảnh để BoxFit.cover không bị méo)
+  static ImageProvider providerFor(BuildContext context, String url, double width, double height) {
+    final devicePixelRatio = MediaQuery.maybeDevicePixelRatioOf(context) ?? 2.0;
+    final size = width > height ? width : height;
+    final cacheWidth = size.isFinite ? (size * devicePixelRatio).round() : null;
+    return ResizeImage.resizeIfNeeded(
+      cacheWidth,
+      null,
+      CachedNetworkImageProvider(url, cacheManager: CoverCacheManager()),
+    );
+  }
+
+  // Tải trước ảnh cho phần tử sắp cuộn vào màn hình
+  static void prefetch(BuildContext context, String? url, {required double width, required double height}) {
+    if (!_isValidUrl(url)) return;
+    final key = '$url@${width.round()}x${height.round()}';
+    if (_prefetched.contains(key)) return;
+    _prefetched.add(key);
+    if (_prefetched.length > _maxPrefetched) _prefetched.remove(_prefetched.first);
+    precacheImage(
+      providerFor(context, url!, width, height),
+      context,
+      onError: (error, stackTrace) => _prefetched.remove(key),
+    );
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    if (!_isValidUrl(url)) return _placeholder();
+
+    return Image(
+      image: providerFor(context, url!, width, height),
+      width: width,
+      height: height,
+      fit: fit,
+      gaplessPlayback: true,
+      frameBuilder: (context, child, frame, wasSynchronouslyLoaded) {
+        if (wasSynchronouslyLoaded || frame != null) return child;
+        return _placeholder(loading: true);
+      },
+      errorBuilder: (context, error, stackTrace) => _placeholder(),
+    );
+  }
+
+  Widget _placeholder({bool loading = false}) {
+    final iconSize = (width.isFinite ? width : height) * 0.5;
+    return Container(
+      width: width,
+      height: height,
+      color: placeholderColor ?? Colors.grey[300],
+      child: loading ? null : Icon(placeholderIcon, size: iconSize.isFinite ? iconSize : 48, color: Colors.grey),
+    );
+  }
+}
@@ -2,9 +2,10 @@ import 'dart:convert';
 import 'dart:math';
 import 'package:flutter/material.dart';
 import 'package:shared_preferences/shared_preferences.dart';
-import 'package:cached_network_image/cached_network_image.dart';
 import '../models/genre.dart';
 import '../screens/genre_detail_screen.dart';
+import '../utils/app_log.dart';
+import 'cover_image.dart';
 
 class GenreGrid extends StatefulWidget {
   final List<Genre> genres;
@@ -16,7 +17,7 @@ class GenreGrid extends StatefulWidget {
   _GenreGridState createState() => _GenreGridState();
 }
 
-class _GenreGridState extends State<GenreGrid> with TickerProviderStateMixin {
+class _GenreGridState extends State<GenreGrid> {
   final List<Color> availableColors = [
     const Color(0xFFA6B9FF),
     const Color(0xFFB71C1C),
@@ -29,21 +30,12 @@ class _GenreGridState extends State<GenreGrid> with TickerProviderStateMixin {
   ];
 
   late Map<String, Color> genreColors;
-  final Map<int, AnimationController> _animationControllers = {};
 
   @override
   void initState() {
     super.initState();
     genreColors = Map.from(widget.genreColors);
     _loadGenreColors().then((_) => _assignColorsIfNeeded());
-    for (int i = 0; i < widget.genres.length; i++) {
-      _animationControllers[i] = AnimationController(
-        duration: const Duration(milliseconds: 150),
-        vsync: this,
-        lowerBound: 0.95,
-        upperBound: 1.0,
-      );
-    }
   }
 
   Future<void> _loadGenreColors() async {
@@ -58,7 +50,7 @@ class _GenreGridState extends State<GenreGrid> with TickerProviderStateMixin {
         }
       }
     } catch (e) {
-      debugPrint('Error loading genre colors: $e');
+      AppLog.w('GenreGrid', 'Error loading genre colors', e);
     }
   }
 
@@ -88,201 +80,218 @@ class _GenreGridState extends State<GenreGrid> with TickerProviderStateMixin {
       Map<String, int> colorMap = genreColors.map((key, value) => MapEntry(key, value.value));
       await prefs.setString('genreColors', jsonEncode(colorMap));
     } catch (e) {
-      debugPrint('Error saving genre colors: $e');
+      AppLog.w('GenreGrid', 'Error saving genre colors', e);
     }
   }
 
-  @override
-  void dispose() {
-    _animationControllers.forEach((_, controller) => controller.dispose());
-    super.dispose();
-  }
-
+  // Trả về một sliver: chỉ các ô đang hiển thị được dựng (đặt trong CustomScrollView)
   @override
   Widget build(BuildContext context) {
-    return GridView.builder(
-      shrinkWrap: true,
-      physics: const NeverScrollableScrollPhysics(),
-      itemCount: widget.genres.length,
+    return SliverGrid(
       gridDelegate: const SliverGridDelegateWithFixedCrossAxisCount(
         crossAxisCount: 2,
         mainAxisSpacing: 16,
         crossAxisSpacing: 16,
         childAspectRatio: 1.8,
       ),
-      itemBuilder: (context, index) {
-        final genre = widget.genres[index];
-        final genreColor = genreColors[genre.title ?? 'Unknown Genre'] ?? Colors.blueGrey;
-        final animationController = _animationControllers[index]!;
+      delegate: SliverChildBuilderDelegate(
+        (context, index) {
+          final genre = widget.genres[index];
+          return _GenreTile(
+            key: ValueKey(genre.id),
+            genre: genre,
+            genreColor: genreColors[genre.title ?? 'Unknown Genre'] ?? Colors.blueGrey,
+          );
+        },
+        childCount: widget.genres.length,
+      ),
+    );
+  }
+}
+
+class _GenreTile extends StatefulWidget {
+  final Genre genre;
+  final Color genreColor;
+
+  const _GenreTile({super.key, required this.genre, required this.genreColor});
+
+  @override
+  State<_GenreTile> createState() => _GenreTileState();
+}
 
-        return GestureDetector(
-          onTapDown: (_) {
-            animationController.forward();
-          },
-          onTapUp: (_) {
-            animationController.reverse();
-            Navigator.push(
-              context,
-              MaterialPageRoute(
-                builder: (context) => GenreDetailScreen(genre: genre),
+class _GenreTileState extends State<_GenreTile> with SingleTickerProviderStateMixin {
+  static const double _restScale = 0.95;
+
+  // Chỉ tạo khi người dùng chạm vào ô lần đầu
+  AnimationController? _animationController;
+
+  AnimationController _controller() {
+    final existing = _animationController;
+    if (existing != null) return existing;
+    final controller = AnimationController(
+      duration: const Duration(milliseconds: 150),
+      vsync: this,
+      lowerBound: _restScale,
+      upperBound: 1.0,
+    );
+    setState(() {
+      _animationController = controller; // Gắn vào ScaleTransition ở lần build tiếp theo
+    });
+    return controller;
+  }
+
+  @override
+  void dispose() {
+    _animationController?.dispose();
+    super.dispose();
+  }
+
+  @override
+  Widget build(BuildContext context) {
+    final genre = widget.genre;
+    final genreColor = widget.genreColor;
+    final animationController = _animationController;
+
+    return GestureDetector(
+      onTapDown: (_) {
+        _controller().forward();
+      },
+      onTapUp: (_) {
+        _controller().reverse();
+        Navigator.push(
+          context,
+          MaterialPageRoute(
+            builder: (context) => GenreDetailScreen(genre: genre),
+          ),
+        );
+      },
+      onTapCancel: () {
+        _controller().reverse();
+      },
+      child: ScaleTransition(
+        scale: animationController ?? const AlwaysStoppedAnimation<double>(_restScale),
+        child: AnimatedContainer(
+          duration: const Duration(milliseconds: 150),
+          decoration: BoxDecoration(
+            borderRadius: BorderRadius.circular(16),
+            boxShadow: [
+              BoxShadow(
+                color: genreColor.withOpacity(0.6),
+                blurRadius: 14,
+                spreadRadius: 3,
+                offset: const Offset(0, 5),
               ),
-            );
-          },
-          onTapCancel: () {
-            animationController.reverse();
-          },
-          child: ScaleTransition(
-            scale: animationController,
-            child: AnimatedContainer(
-              duration: const Duration(milliseconds: 150),
-              decoration: BoxDecoration(
-                borderRadius: BorderRadius.circular(16),
-                boxShadow: [
-                  BoxShadow(
-                    color: genreColor.withOpacity(0.6),
-                    blurRadius: 14,
-                    spreadRadius: 3,
-                    offset: const Offset(0, 5),
-                  ),
-                  BoxShadow(
-                    color: animationController.isAnimating
-                        ? genreColor.withOpacity(0.5)
-                        : Colors.transparent,
-                    blurRadius: 22,
-                    spreadRadius: 6,
-                  ),
-                ],
+              BoxShadow(
+                color: animationController?.isAnimating ?? false
+                    ? genreColor.withOpacity(0.5)
+                    : Colors.transparent,
+                blurRadius: 22,
+                spreadRadius: 6,
               ),
-              child: ClipRRect(
-                borderRadius: BorderRadius.circular(16),
-                child: Stack(
-                  fit: StackFit.expand,
-                  children: [
-                    // Gradient đậm
-                    Container(
-                      decoration: BoxDecoration(
-                        gradient: RadialGradient(
-                          center: Alignment.topLeft,
-                          radius: 1.5,
-                          colors: [
-                            genreColor.withOpacity(1.0),
-                            genreColor.withOpacity(0.9),
-                            genreColor.withOpacity(0.6),
-                          ],
-                        ),
-                      ),
+            ],
+          ),
+          child: ClipRRect(
+            borderRadius: BorderRadius.circular(16),
+            child: Stack(
+              fit: StackFit.expand,
+              children: [
+                // Gradient đậm
+                Container(
+                  decoration: BoxDecoration(
+                    gradient: RadialGradient(
+                      center: Alignment.topLeft,
+                      radius: 1.5,
+                      colors: [
+                        genreColor.withOpacity(1.0),
+                        genreColor.withOpacity(0.9),
+                        genreColor.withOpacity(0.6),
+                      ],
                     ),
-                    // Glassmorphism overlay
-                    Container(
+                  ),
+                ),
+                // Glassmorphism overlay
+                Container(
+                  decoration: BoxDecoration(
+                    color: Colors.black.withOpacity(0.15),
+                    backgroundBlendMode: BlendMode.overlay,
+                    border: Border.all(
+                      color: Colors.white.withOpacity(0.2),
+                      width: 1,
+                    ),
+                  ),
+                ),
+                // Ảnh bìa hoặc placeholder
+                Positioned(
+                  top: 12,
+                  left: 12,
+                  child: Transform.rotate(
+                    angle: -0.1,
+                    child: Container(
                       decoration: BoxDecoration(
-                        color: Colors.black.withOpacity(0.15),
-                        backgroundBlendMode: BlendMode.overlay,
-                        border: Border.all(
-                          color: Colors.white.withOpacity(0.2),
-                          width: 1,
-                        ),
+                        borderRadius: BorderRadius.circular(8),
+                        border: Border.all(color: Colors.white, width: 1.5),
+                        boxShadow: [
+                          BoxShadow(
+                            color: Colors.black.withOpacity(0.2),
+                            blurRadius: 6,
+                            offset: const Offset(2, 2),
+                          ),
+                        ],
                       ),
-                    ),
-                    // Ảnh bìa hoặc placeholder
-                    Positioned(
-                      top: 12,
-                      left: 12,
-                      child: Transform.rotate(
-                        angle: -0.1,
-                        child: Container(
+                      child: ClipRRect(
+                        borderRadius: BorderRadius.circular(8),
+                        child: (genre.coverImage != null && genre.coverImage!.trim().isNotEmpty)
+                            ? CoverImage(
+                          url: genre.coverImage,
+                          width: 60,
+                          height: 60,
+                          placeholderColor: genreColor.withOpacity(0.3),
+                        )
+                            : Container(
+                          width: 60,
+                          height: 60,
                           decoration: BoxDecoration(
+                            color: genreColor.withOpacity(0.3),
                             borderRadius: BorderRadius.circular(8),
-                            border: Border.all(color: Colors.white, width: 1.5),
-                            boxShadow: [
-                              BoxShadow(
-                                color: Colors.black.withOpacity(0.2),
-                                blurRadius: 6,
-                                offset: const Offset(2, 2),
-                              ),
-                            ],
                           ),
-                          child: ClipRRect(
-                            borderRadius: BorderRadius.circular(8),
-                            child: (genre.coverImage != null && genre.coverImage!.trim().isNotEmpty)
-                                ? CachedNetworkImage(
-                              imageUrl: genre.coverImage!,
-                              width: 60,
-                              height: 60,
-                              fit: BoxFit.cover,
-                              placeholder: (context, url) => Container(
-                                width: 60,
-                                height: 60,
-                                decoration: BoxDecoration(
-                                  color: genreColor.withOpacity(0.3),
-                                  borderRadius: BorderRadius.circular(8),
-                                ),
-                                child: const Center(
-                                  child: CircularProgressIndicator(
-                                    valueColor: AlwaysStoppedAnimation<Color>(Colors.white),
-                                  ),
-                                ),
-                              ),
-                              errorWidget: (context, url, error) => Container(
-                                width: 60,
-                                height: 60,
-                                decoration: BoxDecoration(
-                                  color: genreColor.withOpacity(0.3),
-                                  borderRadius: BorderRadius.circular(8),
-                                ),
-                                child: const Icon(
-                                  Icons.error,
-                                  color: Colors.white,
-                                  size: 30,
-                                ),
-                              ),
-                            )
-                                : Container(
-                              width: 60,
-                              height: 60,
-                              decoration: BoxDecoration(
-                                color: genreColor.withOpacity(0.3),
-                                borderRadius: BorderRadius.circular(8),
-                              ),
-                              child: const Icon(
-                                Icons.music_note,
-                                color: Colors.white,
-                                size: 36,
-                              ),
-                            ),
+                          child: const Icon(
+                            Icons.music_note,
+                            color: Colors.white,
+                            size: 36,
                           ),
                         ),
                       ),
                     ),
-                    // Tiêu đề thể loại với màu đen
-                    Center(
-                      child: Padding(
-                        padding: const EdgeInsets.all(12.0),
-                        child: Text(
-                          genre.title ?? 'Unknown Genre',
-                          textAlign: TextAlign.center,
-                          style: const TextStyle(
-                            color: Colors.black,
-                            fontSize: 18,
-                            fontWeight: FontWeight.bold,
-                            letterSpacing: 0.5,
-                            shadows: [
-                              Shadow(
-                                color: Colors.white54,
-                                offset: Offset(1, 1),
-                                blurRadius: 5,
-                              ),
-                            ],
+                  ),
+                ),
+                // Tiêu đề thể loại với màu đen
+                Center(
+                  child: Padding(
+                    padding: const EdgeInsets.all(12.0),
+                    child: Text(
+                      genre.title ?? 'Unknown Genre',
+                      textAlign: TextAlign.center,
+                      style: const TextStyle(
+                        color: Colors.black,
+                        fontSize: 18,
+                        fontWeight: FontWeight.bold,
+                        letterSpacing: 0.5,
+                        shadows: [
+                          Shadow(
+                            color: Colors.white54,
+                            offset: Offset(1, 1),
+                            blurRadius: 5,
                           ),
-                        ),
+                        ],
                       ),
                     ),
-                  ],
+                  ),
                 ),
-              ),
+              ],
             ),
           ),
-        );
-      },
+        ),
+      ),
     );
   }
-}
\ No newline at end of file
+}
@@ -2,13 +2,17 @@ import 'package:flutter/material.dart';
 import 'package:provider/provider.dart';
 import '../screens/now_playing_screen.dart';
 import '../providers/audio_provider.dart';
+import '../utils/rebuild_stats.dart';
+import 'cover_image.dart';
 
 class MusicPlayer extends StatelessWidget {
   const MusicPlayer({super.key});
 
   @override
   Widget build(BuildContext context) {
-    final audioProvider = Provider.of<AudioProvider>(context);
+    // Không lắng nghe cả provider, chỉ rebuild theo bài đang phát và trạng thái phát
+    final audioProvider = Provider.of<AudioProvider>(context, listen: false);
+    RebuildStats.record('MusicPlayer');
 
     return ValueListenableBuilder<Map<String, String>?>(
       valueListenable: audioProvider.currentSongData,
@@ -18,6 +22,7 @@ class MusicPlayer extends StatelessWidget {
         return ValueListenableBuilder<bool>(
           valueListenable: audioProvider.isPlayingNotifier,
           builder: (context, isPlaying, child) {
+            RebuildStats.record('MusicPlayer.content');
             return GestureDetector(
               onTap: () {
                 Navigator.push(
@@ -46,15 +51,10 @@ class MusicPlayer extends StatelessWidget {
                         children: [
                           ClipRRect(
                             borderRadius: BorderRadius.circular(6), // Giảm bo góc nhẹ
-                            child: Image.network(
-                              songData["imagePath"] ?? 'default_image_url',
+                            child: CoverImage(
+                              url: songData["imagePath"],
                               width: 40, // Giảm từ 50 xuống 40
                               height: 40,
-                              fit: BoxFit.cover,
-                              errorBuilder: (context, error, stackTrace) => const Icon(
-                                Icons.music_note,
-                                size: 40,
-                              ),
                             ),
                           ),
                           const SizedBox(width: 10), // Giảm từ 12 xuống 10
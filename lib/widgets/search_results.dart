@@ -1,9 +1,10 @@
 import 'package:flutter/material.dart';
 
-import '../models/song.dart';
+import '../models/song_summary.dart';
+import 'cover_image.dart';
 
 class SearchResults extends StatelessWidget {
-  final List<Song> filteredSongs;
+  final List<SongSummary> filteredSongs;
 
   const SearchResults({super.key, required this.filteredSongs});
 
@@ -17,9 +18,9 @@ class SearchResults extends StatelessWidget {
         itemBuilder: (context, index) {
           final song = filteredSongs[index];
           return ListTile(
-            leading: Image.network(song.coverImage ?? 'default_image_url', width: 50, height: 50, fit: BoxFit.cover),
+            leading: CoverImage(url: song.coverImage, width: 50, height: 50),
             title: Text(song.title),
-            subtitle: Text(song.artist?.title ?? 'Unknown Artist'),
+            subtitle: Text(song.artistName ?? 'Unknown Artist'),
             onTap: () {},
           );
         },
@@ -1,4 +1,5 @@
 import 'package:flutter/material.dart';
+import 'cover_image.dart';
 import 'package:provider/provider.dart';
 import '../providers/audio_provider.dart'; // Import AudioProvider thay vì AudioPlayerManager
 
@@ -8,6 +9,7 @@ class SongCard extends StatelessWidget {
   final String artist;
   final String songUrl;
   final int index; // Thêm index để xác định vị trí trong danh sách
+  final VoidCallback? onPlay; // Nếu có: dùng thay cho playSong(index), vd. để đặt hàng đợi trước
 
   const SongCard({
     super.key,
@@ -16,6 +18,7 @@ class SongCard extends StatelessWidget {
     required this.artist,
     required this.songUrl,
     required this.index, // Thêm tham số index
+    this.onPlay,
   });
 
   @override
@@ -36,13 +39,11 @@ class SongCard extends StatelessWidget {
                 children: [
                   ClipRRect(
                     borderRadius: BorderRadius.circular(10),
-                    child: Image.network(
-                      imagePath.isNotEmpty ? imagePath : 'default_image_url',
+                    child: CoverImage(
+                      url: imagePath,
                       width: 60,
                       height: 60,
-                      fit: BoxFit.cover,
-                      errorBuilder: (context, error, stackTrace) =>
-                      const Icon(Icons.image, size: 60, color: Colors.grey),
+                      placeholderIcon: Icons.image,
                     ),
                   ),
                   const SizedBox(width: 12),
@@ -70,6 +71,8 @@ class SongCard extends StatelessWidget {
                     onPressed: () {
                       if (isCurrentPlaying) {
                         audioProvider.togglePlayPause(); // Tạm dừng nếu đang phát
+                      } else if (onPlay != null) {
+                        onPlay!();
                       } else {
                         audioProvider.playSong(index); // Phát bài hát theo index
                       }
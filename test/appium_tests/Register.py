@@ -1,65 +1,48 @@
 import unittest
-from appium import webdriver
 from appium.webdriver.common.appiumby import AppiumBy
-import time
-import re
 
-class MobileAppTest(unittest.TestCase):
-    def setUp(self):
-        desired_caps = {
-            "platformName": "Android",
-            "deviceName": "emulator-5554",  # Đổi thành ID thiết bị của bạn nếu dùng điện thoại thật
-            "appPackage": "com.example.app",  # Đổi thành package của ứng dụng
-            "appActivity": ".MainActivity",  # Đổi thành activity chính
-            "automationName": "UiAutomator2"
-        }
-        self.driver = webdriver.Remote("http://localhost:4723/wd/hub", desired_caps)
-        self.driver.implicitly_wait(10)
+from harness import AppTestCase
+
+REGISTER_BUTTON = (AppiumBy.ID, "com.example:id/registerButton")
+USERNAME_FIELD = (AppiumBy.ID, "com.example:id/username")
+PASSWORD_FIELD = (AppiumBy.ID, "com.example:id/password")
+REGISTER_CONFIRM_BUTTON = (AppiumBy.ID, "com.example:id/registerConfirmButton")
+SUCCESS_MESSAGE = (AppiumBy.ID, "com.example:id/successMessage")
+ERROR_MESSAGE = (AppiumBy.ID, "com.example:id/errorMessage")
 
-    def test_register_success(self):
-        """Kiểm thử đăng ký thành công với Gmail hợp lệ"""
-        self.driver.find_element(AppiumBy.ID, "com.example:id/registerButton").click()
+
+class MobileAppTest(AppTestCase):
+    def _register(self, username, password):
+        self.wait_clickable(REGISTER_BUTTON).click()
 
         # Nhập thông tin đăng ký
-        self.driver.find_element(AppiumBy.ID, "com.example:id/username").send_keys("testuser@gmail.com")
-        self.driver.find_element(AppiumBy.ID, "com.example:id/password").send_keys("password123")
-        self.driver.find_element(AppiumBy.ID, "com.example:id/registerConfirmButton").click()
+        self.wait_for(USERNAME_FIELD).send_keys(username)
+        self.wait_for(PASSWORD_FIELD).send_keys(password)
+        self.wait_clickable(REGISTER_CONFIRM_BUTTON).click()
 
-        # Kiểm tra thông báo thành công
-        success_message = self.driver.find_element(AppiumBy.ID, "com.example:id/successMessage").text
+    def test_register_success(self):
+        """Kiểm thử đăng ký thành công với Gmail hợp lệ"""
+        with self.step('register_to_success'):
+            self._register("testuser@gmail.com", "password123")
+            # Kiểm tra thông báo thành công
+            success_message = self.wait_for(SUCCESS_MESSAGE).text
         self.assertEqual(success_message, "Đăng ký thành công")
-        time.sleep(2)
 
     def test_register_failure_invalid_email(self):
         """Kiểm thử đăng ký không thành công với email không hợp lệ"""
-        self.driver.find_element(AppiumBy.ID, "com.example:id/registerButton").click()
-
-        # Nhập thông tin đăng ký với email không hợp lệ
-        self.driver.find_element(AppiumBy.ID, "com.example:id/username").send_keys("invalid-email")
-        self.driver.find_element(AppiumBy.ID, "com.example:id/password").send_keys("password123")
-        self.driver.find_element(AppiumBy.ID, "com.example:id/registerConfirmButton").click()
+        self._register("invalid-email", "password123")
 
         # Kiểm tra thông báo lỗi khi nhập email không hợp lệ
-        error_message = self.driver.find_element(AppiumBy.ID, "com.example:id/errorMessage").text
+        error_message = self.wait_for(ERROR_MESSAGE).text
         self.assertEqual(error_message, "Vui lòng nhập địa chỉ email hợp lệ.")
-        time.sleep(2)
 
     def test_register_failure_empty_fields(self):
         """Kiểm thử đăng ký không thành công với trường thông tin bị bỏ trống"""
-        self.driver.find_element(AppiumBy.ID, "com.example:id/registerButton").click()
-
-        # Nhập thông tin không đầy đủ
-        self.driver.find_element(AppiumBy.ID, "com.example:id/username").send_keys("")  # Email trống
-        self.driver.find_element(AppiumBy.ID, "com.example:id/password").send_keys("")
-        self.driver.find_element(AppiumBy.ID, "com.example:id/registerConfirmButton").click()
+        self._register("", "")  # Email và mật khẩu trống
 
         # Kiểm tra thông báo lỗi khi trường thông tin bị bỏ trống
-        error_message = self.driver.find_element(AppiumBy.ID, "com.example:id/errorMessage").text
+        error_message = self.wait_for(ERROR_MESSAGE).text
         self.assertEqual(error_message, "Vui lòng điền đầy đủ thông tin.")
-        time.sleep(2)
-
-    def tearDown(self):
-        self.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,30 @@
+"""Harness dùng chung cho các test Appium của app_music.
+
+- config: một bộ capabilities và danh sách endpoint (APPIUM_ENDPOINTS)
+- pool: session dùng lại giữa các test trên cùng một endpoint
+- case: AppTestCase với chờ theo điều kiện và đo thời gian từng bước
+- report: báo cáo thời gian JSON
+- fake_webdriver: WebDriver server giả lập để chạy thử không cần emulator
+"""
+
+from .case import AppTestCase, HarnessContext, current_context, use_context
+from .config import APP_PACKAGE, CAPABILITIES, Endpoint, load_endpoints, make_options, parse_endpoints
+from .pool import DriverPool, create_driver
+from .report import TimingReport, load_durations
+
+__all__ = [
+    'APP_PACKAGE',
+    'CAPABILITIES',
+    'AppTestCase',
+    'DriverPool',
+    'Endpoint',
+    'HarnessContext',
+    'TimingReport',
+    'create_driver',
+    'current_context',
+    'load_durations',
+    'load_endpoints',
+    'make_options',
+    'parse_endpoints',
+    'use_context',
+]
@@ -0,0 +1,182 @@
+"""Lớp cơ sở cho các test Appium: lấy session từ pool, chờ theo điều kiện và đo thời gian.
+
+Mỗi thread chạy test có một HarnessContext (endpoint, pool, báo cáo) do run_suite.py gán.
+Khi chạy trực tiếp một file (python login.py), context mặc định dùng endpoint đầu tiên
+của config và ghi báo cáo khi thoát.
+"""
+
+import atexit
+import os
+import threading
+import time
+import unittest
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .config import APP_PACKAGE, Endpoint, load_endpoints
+from .pool import DriverPool
+from .report import TimingReport
+
+DEFAULT_REPORT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'reports', 'appium_timing.json')
+APP_STATE_FOREGROUND = 4
+
+
+@dataclass
+class HarnessContext:
+    endpoint: Endpoint
+    pool: DriverPool
+    report: TimingReport
+
+
+_local = threading.local()
+_default = None
+_default_lock = threading.Lock()
+
+
+@contextmanager
+def use_context(context):
+    previous = getattr(_local, 'context', None)
+    _local.context = context
+    try:
+        yield context
+    finally:
+        _local.context = previous
+
+
+def current_context():
+    context = getattr(_local, 'context', None)
+    return context if context is not None else _default_context()
+
+
+def _default_context():
+    global _default
+    with _default_lock:
+        if _default is None:
+            report = TimingReport()
+            _default = HarnessContext(load_endpoints()[0], DriverPool(report), report)
+            atexit.register(_close_default)
+        return _default
+
+
+def _close_default():
+    _default.pool.close()
+    path = _default.report.write(os.environ.get('APPIUM_REPORT', DEFAULT_REPORT_PATH))
+    print(f'✅ Báo cáo thời gian: {path}')
+
+
+def _outcome(result, before):
+    counts = (len(result.failures), len(result.errors), len(result.skipped), len(result.expectedFailures))
+    if counts[0] > before[0]:
+        return 'failed'
+    if counts[1] > before[1]:
+        return 'error'
+    if counts[2] > before[2]:
+        return 'skipped'
+    if counts[3] > before[3]:
+        return 'expected_failure'
+    return 'passed'
+
+
+class AppTestCase(unittest.TestCase):
+    wait_timeout = 20
+    poll_interval = 0.2
+
+    def run(self, result=None):
+        if result is None:
+            result = self.defaultTestResult()
+            result.startTestRun()
+            try:
+                return self.run(result)
+            finally:
+                result.stopTestRun()
+
+        context = current_context()
+        self.context = context
+        self.record = context.report.begin_test(self.id(), context.endpoint)
+        before = (len(result.failures), len(result.errors), len(result.skipped), len(result.expectedFailures))
+        try:
+            return super().run(result)
+        finally:
+            status = _outcome(result, before)
+            self.record.finish(status)
+            driver = self.__dict__.pop('driver', None)
+            if driver is not None:
+                context.pool.release(context.endpoint, driver, check=status not in ('passed', 'skipped'))
+
+    def setUp(self):
+        self.driver = self.context.pool.acquire(self.context.endpoint)
+        self.wait = WebDriverWait(self.driver, self.wait_timeout, poll_frequency=self.poll_interval)
+
+    # ---- Đo thời gian ----
+
+    @contextmanager
+    def step(self, name):
+        """Ghi thời gian của một đoạn thao tác vào báo cáo, kể cả khi đoạn đó lỗi."""
+        started = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record.add_step(name, (time.perf_counter() - started) * 1000, ok)
+
+    # ---- Chờ theo điều kiện ----
+
+    def wait_until(self, condition, timeout=None, message=''):
+        wait = self.wait if timeout is None else WebDriverWait(self.driver, timeout, poll_frequency=self.poll_interval)
+        return wait.until(condition, message)
+
+    def wait_for(self, locator, timeout=None):
+        return self.wait_until(EC.presence_of_element_located(locator), timeout, f'Không tìm thấy {locator}')
+
+    def wait_clickable(self, locator, timeout=None):
+        return self.wait_until(EC.element_to_be_clickable(locator), timeout, f'{locator} không bấm được')
+
+    def wait_for_text(self, locator, expected, timeout=None):
+        """Chờ phần tử có text mong đợi; hết thời gian thì trả về text hiện tại để assert báo lỗi rõ ràng."""
+        def has_text(driver):
+            try:
+                text = driver.find_element(*locator).text
+            except StaleElementReferenceException:
+                return False
+            return text if text == expected else False
+
+        try:
+            return self.wait_until(has_text, timeout)
+        except TimeoutException:
+            return self.wait_for(locator, timeout=0.5).text
+
+    def is_present(self, locator, timeout=0):
+        """True nếu phần tử xuất hiện trong khoảng timeout (0 = chỉ kiểm tra một lần)."""
+        if timeout == 0:
+            return bool(self.driver.find_elements(*locator))
+        try:
+            self.wait_for(locator, timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    # ---- Ứng dụng ----
+
+    def restart_app(self, clear_data=False):
+        """Đóng và mở lại ứng dụng; clear_data=True xoá dữ liệu (phiên đăng nhập, cache)."""
+        with self.step('restart_app'):
+            if clear_data:
+                self.driver.execute_script('mobile: clearApp', {'appId': APP_PACKAGE})
+            else:
+                self.driver.terminate_app(APP_PACKAGE)
+            self.driver.activate_app(APP_PACKAGE)
+            self.wait_until(lambda d: d.query_app_state(APP_PACKAGE) == APP_STATE_FOREGROUND)
+
+    def dump_screen(self):
+        """In text / content-desc của các TextView đang hiển thị để dễ tìm nguyên nhân khi test lỗi."""
+        print('🔍 Kiểm tra giao diện hiện tại:')
+        for element in self.driver.find_elements(AppiumBy.CLASS_NAME, 'android.widget.TextView'):
+            text = element.text or 'Không có text'
+            content_desc = element.get_attribute('content-desc') or 'Không có content-desc'
+            print(f"Text: '{text}', Content-desc: '{content_desc}'")
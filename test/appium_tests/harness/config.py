@@ -0,0 +1,72 @@
+"""Cấu hình Appium dùng chung cho mọi test: một bộ capabilities và danh sách endpoint.
+
+Endpoint lấy từ biến môi trường APPIUM_ENDPOINTS, dạng "<udid>@<url>" cách nhau bởi dấu phẩy:
+  APPIUM_ENDPOINTS=emulator-5554@http://127.0.0.1:4723/wd/hub,emulator-5556@http://127.0.0.1:4723/wd/hub
+Nhiều emulator trên cùng một Appium server cần systemPort khác nhau, được gán tự động.
+APP_PATH (tuỳ chọn) là đường dẫn APK để Appium cài trước khi chạy.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from appium.options.android import UiAutomator2Options
+
+APP_PACKAGE = 'com.example.app_music'
+APP_ACTIVITY = '.MainActivity'
+DEFAULT_SERVER_URL = 'http://127.0.0.1:4723/wd/hub'
+DEFAULT_DEVICE = 'emulator-5554'
+FIRST_SYSTEM_PORT = 8200
+
+CAPABILITIES = dict(
+    platformName='Android',
+    automationName='uiautomator2',
+    appPackage=APP_PACKAGE,
+    appActivity=APP_ACTIVITY,
+    language='en',
+    locale='US',
+    # Giữ dữ liệu ứng dụng giữa các session; test nào cần trạng thái sạch tự gọi restart_app(clear_data=True)
+    noReset=True,
+    autoGrantPermissions=True,
+    newCommandTimeout=600,  # Session được dùng lại giữa các test trong pool
+)
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    url: str = DEFAULT_SERVER_URL
+    udid: str = DEFAULT_DEVICE
+    system_port: Optional[int] = None
+
+    def __str__(self):
+        return f'{self.udid}@{self.url}'
+
+
+def parse_endpoints(spec):
+    """Đọc danh sách "<udid>@<url>" (hoặc chỉ "<url>"), gán systemPort khi có nhiều thiết bị."""
+    items = [part.strip() for part in spec.split(',') if part.strip()]
+    endpoints = []
+    for index, item in enumerate(items):
+        udid, _, url = item.rpartition('@') if '@' in item.split('://')[0] else ('', '', item)
+        endpoints.append(Endpoint(
+            url=url or DEFAULT_SERVER_URL,
+            udid=udid or DEFAULT_DEVICE,
+            system_port=FIRST_SYSTEM_PORT + index if len(items) > 1 else None,
+        ))
+    return endpoints
+
+
+def load_endpoints():
+    spec = os.environ.get('APPIUM_ENDPOINTS')
+    return parse_endpoints(spec) if spec else [Endpoint()]
+
+
+def make_options(endpoint):
+    options = UiAutomator2Options().load_capabilities(CAPABILITIES)
+    options.udid = endpoint.udid
+    options.device_name = endpoint.udid
+    if endpoint.system_port is not None:
+        options.system_port = endpoint.system_port
+    if os.environ.get('APP_PATH'):
+        options.app = os.environ['APP_PATH']
+    return options
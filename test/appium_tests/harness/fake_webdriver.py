@@ -0,0 +1,355 @@
+"""WebDriver server giả lập để chạy thử harness mà không cần thiết bị / Appium.
+
+Cài đặt phần giao thức W3C WebDriver mà Appium Python client dùng trong các test
+(tạo / đóng session, tìm phần tử, click, nhập text, text / attribute / displayed,
+mobile: terminateApp / activateApp / clearApp / queryAppState).
+Giao diện được mô phỏng bởi FakeApp: mỗi server là một "thiết bị" giữ trạng thái
+ứng dụng qua các session, giống emulator thật khi dùng noReset.
+
+Chạy riêng:  python -m harness.fake_webdriver --port 4723
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+APP_PACKAGE = 'com.example.app_music'
+
+
+class FakeElement:
+    def __init__(self, text='', class_name='android.widget.TextView', content_desc=None, enabled=True):
+        self.id = uuid.uuid4().hex
+        self.text = text
+        self.class_name = class_name
+        self.content_desc = content_desc
+        self.enabled = enabled
+
+    def attribute(self, name):
+        return {
+            'content-desc': self.content_desc,
+            'contentDescription': self.content_desc,
+            'text': self.text,
+            'class': self.class_name,
+            'enabled': str(self.enabled).lower(),
+            'displayed': 'true',
+        }.get(name)
+
+
+class FakeApp:
+    """Giao diện giả lập: phần tử được tìm theo (using, value); thay đổi có thể hẹn sau một khoảng trễ."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._locators = {}
+        self._elements = {}
+        self._scheduled = []
+        self._handlers = {}
+        self.running = False
+
+    # ---- Dựng giao diện ----
+
+    def add(self, using, value, element=None, on_click=None, on_value=None):
+        element = element or FakeElement(content_desc=value if using == 'accessibility id' else None)
+        with self._lock:
+            self._locators.setdefault((using, value), []).append(element)
+            self._elements[element.id] = element
+            self._handlers[element.id] = (on_click, on_value)
+        return element
+
+    def clear_screen(self):
+        with self._lock:
+            self._locators.clear()
+            self._elements.clear()
+            self._handlers.clear()
+            self._scheduled.clear()
+
+    def later(self, delay, action):
+        """Chạy action sau delay giây (tính theo lần truy vấn kế tiếp), mô phỏng màn hình cập nhật chậm."""
+        with self._lock:
+            self._scheduled.append((time.monotonic() + delay, action))
+
+    def _run_due(self):
+        now = time.monotonic()
+        due = [item for item in self._scheduled if item[0] <= now]
+        self._scheduled = [item for item in self._scheduled if item[0] > now]
+        for _, action in sorted(due, key=lambda item: item[0]):
+            action()
+
+    # ---- Dùng bởi server ----
+
+    def find(self, using, value):
+        with self._lock:
+            self._run_due()
+            if using == 'class name':
+                return [e for e in self._elements.values() if e.class_name == value]
+            return list(self._locators.get((using, value), []))
+
+    def element(self, element_id):
+        with self._lock:
+            self._run_due()
+            return self._elements.get(element_id)
+
+    def click(self, element):
+        with self._lock:
+            on_click = self._handlers.get(element.id, (None, None))[0]
+        if on_click:
+            on_click()
+
+    def type_text(self, element, text):
+        with self._lock:
+            element.text += text
+            on_value = self._handlers.get(element.id, (None, None))[1]
+        if on_value:
+            on_value(element.text)
+
+    def launch(self):
+        self.running = True
+
+    def terminate(self):
+        self.running = False
+        self.clear_screen()
+
+    def clear_data(self):
+        self.terminate()
+
+
+class AppMusicFake(FakeApp):
+    """Màn hình đăng nhập của app_music với cùng locator như login.py.
+
+    Tài khoản thuong@gmail.com / 123456; đăng nhập thành công chuyển sang màn hình "Hi, Thuong"
+    sau login_delay giây, thông báo lỗi xuất hiện sau error_delay giây.
+    """
+
+    def __init__(self, login_delay=0.3, error_delay=0.2):
+        super().__init__()
+        self.login_delay = login_delay
+        self.error_delay = error_delay
+        self.logged_in = False
+
+    def launch(self):
+        super().launch()
+        self.clear_screen()
+        if self.logged_in:
+            self._show_home()
+        else:
+            self._show_login()
+
+    def clear_data(self):
+        super().clear_data()
+        self.logged_in = False
+
+    def _show_login(self):
+        email = self.add('xpath', '//android.widget.EditText[1]', FakeElement(class_name='android.widget.EditText'))
+        password = self.add('xpath', '//android.widget.EditText[2]', FakeElement(class_name='android.widget.EditText'))
+        self.add('accessibility id', 'login_button', FakeElement('Login', 'android.widget.Button', 'login_button'),
+                 on_click=lambda: self._submit(email.text, password.text))
+
+    def _submit(self, email, password):
+        if not email or not password:
+            self._show_error('Please enter email and password')
+        elif email != 'thuong@gmail.com':
+            self._show_error('Email not found')
+        elif password != '123456':
+            self._show_error('Invalid password')
+        else:
+            def done():
+                self.logged_in = True
+                self.clear_screen()
+                self._show_home()
+            self.later(self.login_delay, done)
+
+    def _show_error(self, message):
+        self.later(self.error_delay, lambda: self.add(
+            'accessibility id', 'error_message', FakeElement(message, content_desc='error_message')))
+
+    def _show_home(self):
+        self.add('accessibility id', 'Hi, Thuong', FakeElement('Hi, Thuong', content_desc='Hi, Thuong'))
+
+
+class FakeWebDriverServer:
+    def __init__(self, app=None, host='127.0.0.1', port=0, session_delay=0.0, base_path='/wd/hub'):
+        self.app = app or AppMusicFake()
+        self.session_delay = session_delay  # Mô phỏng thời gian khởi động UiAutomator2
+        self.base_path = base_path
+        self.sessions = set()
+        self.sessions_created = 0
+        self.commands = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}{self.base_path}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def new_session(self):
+        time.sleep(self.session_delay)
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self.sessions.add(session_id)
+            self.sessions_created += 1
+        if not self.app.running:
+            self.app.launch()
+        return session_id
+
+
+class _WebDriverError(Exception):
+    def __init__(self, status, error, message):
+        super().__init__(message)
+        self.status = status
+        self.error = error
+
+
+def _make_handler(server):
+    app = server.app
+
+    def execute_script(script, args):
+        params = args[0] if args else {}
+        if script == 'mobile: terminateApp':
+            was_running = app.running
+            app.terminate()
+            return was_running
+        if script == 'mobile: activateApp':
+            if not app.running:
+                app.launch()
+            return None
+        if script == 'mobile: clearApp':
+            app.clear_data()
+            return None
+        if script == 'mobile: queryAppState':
+            return 4 if app.running and params.get('appId') == APP_PACKAGE else 1
+        raise _WebDriverError(404, 'unknown method', f'Unsupported script {script}')
+
+    def find(body):
+        elements = app.find(body.get('using'), body.get('value'))
+        return elements
+
+    def element_or_error(element_id):
+        element = app.element(element_id)
+        if element is None:
+            raise _WebDriverError(404, 'stale element reference', f'Element {element_id} is no longer attached')
+        return element
+
+    routes = [
+        ('POST', r'/session/(\w+)/element$', lambda m, b: _element_ref(find(b), b)),
+        ('POST', r'/session/(\w+)/elements$', lambda m, b: [{ELEMENT_KEY: e.id} for e in find(b)]),
+        ('GET', r'/session/(\w+)/element/(\w+)/text$', lambda m, b: element_or_error(m[2]).text),
+        ('GET', r'/session/(\w+)/element/(\w+)/displayed$', lambda m, b: element_or_error(m[2]) is not None),
+        ('GET', r'/session/(\w+)/element/(\w+)/enabled$', lambda m, b: element_or_error(m[2]).enabled),
+        ('GET', r'/session/(\w+)/element/(\w+)/attribute/([\w-]+)$',
+         lambda m, b: element_or_error(m[2]).attribute(m[3])),
+        ('POST', r'/session/(\w+)/element/(\w+)/click$', lambda m, b: app.click(element_or_error(m[2]))),
+        ('POST', r'/session/(\w+)/element/(\w+)/clear$', lambda m, b: setattr(element_or_error(m[2]), 'text', '')),
+        ('POST', r'/session/(\w+)/element/(\w+)/value$',
+         lambda m, b: app.type_text(element_or_error(m[2]), b.get('text') or ''.join(b.get('value', [])))),
+        ('POST', r'/session/(\w+)/execute/sync$', lambda m, b: execute_script(b.get('script'), b.get('args') or [])),
+        ('POST', r'/session/(\w+)/timeouts$', lambda m, b: None),
+        ('GET', r'/session/(\w+)/window/rect$', lambda m, b: {'x': 0, 'y': 0, 'width': 1080, 'height': 2340}),
+    ]
+    compiled = [(method, re.compile(pattern), action) for method, pattern, action in routes]
+
+    def _element_ref(elements, body):
+        if not elements:
+            raise _WebDriverError(404, 'no such element', f'No element matches {body.get("using")}={body.get("value")}')
+        return {ELEMENT_KEY: elements[0].id}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self._dispatch('GET')
+
+        def do_POST(self):
+            self._dispatch('POST')
+
+        def do_DELETE(self):
+            self._dispatch('DELETE')
+
+        def _dispatch(self, method):
+            length = int(self.headers.get('Content-Length') or 0)
+            raw = self.rfile.read(length) if length else b''
+            path = self.path.split('?')[0]
+            if server.base_path and path.startswith(server.base_path):
+                path = path[len(server.base_path):]
+            with server._lock:
+                server.commands += 1
+            try:
+                body = json.loads(raw) if raw else {}
+                self._reply(200, {'value': self._handle(method, path, body)})
+            except _WebDriverError as e:
+                self._reply(e.status, {'value': {'error': e.error, 'message': str(e), 'stacktrace': ''}})
+
+        def _handle(self, method, path, body):
+            if method == 'GET' and path == '/status':
+                return {'ready': True, 'message': 'fake webdriver'}
+            if method == 'POST' and path == '/session':
+                session_id = server.new_session()
+                capabilities = body.get('capabilities', {}).get('alwaysMatch', {})
+                return {'sessionId': session_id, 'capabilities': capabilities}
+
+            match = re.match(r'/session/(\w+)', path)
+            if match is None or match[1] not in server.sessions:
+                raise _WebDriverError(404, 'invalid session id', f'Unknown session for {path}')
+            if method == 'DELETE' and path == f'/session/{match[1]}':
+                with server._lock:
+                    server.sessions.discard(match[1])
+                return None
+
+            for route_method, pattern, action in compiled:
+                route_match = pattern.match(path)
+                if route_match and route_method == method:
+                    return action(route_match, body)
+            raise _WebDriverError(404, 'unknown command', f'{method} {path} is not supported')
+
+        def _reply(self, status, payload):
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='WebDriver server giả lập màn hình đăng nhập của app_music.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4723)
+    parser.add_argument('--session-delay', type=float, default=1.0, help='Thời gian tạo session (giây)')
+    args = parser.parse_args(argv)
+
+    server = FakeWebDriverServer(host=args.host, port=args.port, session_delay=args.session_delay).start()
+    print(f'✅ Fake WebDriver đang chạy tại {server.url}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Pool session Appium: mỗi endpoint giữ một session và dùng lại cho các test kế tiếp.
+
+Tạo session (khởi động UiAutomator2, mở ứng dụng) tốn vài giây; trước đây mỗi test
+tạo và đóng một session riêng. Session chỉ bị bỏ khi test lỗi và session không còn phản hồi.
+"""
+
+import threading
+import time
+
+from appium import webdriver
+
+from .config import make_options
+
+
+def create_driver(endpoint):
+    driver = webdriver.Remote(endpoint.url, options=make_options(endpoint))
+    driver.implicitly_wait(0)  # Chỉ dùng chờ theo điều kiện (WebDriverWait)
+    return driver
+
+
+class DriverPool:
+    def __init__(self, report=None, factory=create_driver):
+        self._report = report
+        self._factory = factory
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, endpoint):
+        with self._lock:
+            driver = self._idle.pop(endpoint, None)
+        if driver is not None:
+            if self._report:
+                self._report.session_reused(endpoint)
+            return driver
+
+        started = time.perf_counter()
+        driver = self._factory(endpoint)
+        if self._report:
+            self._report.session_created(endpoint, (time.perf_counter() - started) * 1000)
+        return driver
+
+    def release(self, endpoint, driver, check=False):
+        """Trả session về pool. check=True (sau test lỗi) thì kiểm tra session còn sống không."""
+        if check and not is_alive(driver):
+            quit_quietly(driver)
+            return
+        with self._lock:
+            previous = self._idle.pop(endpoint, None)
+            self._idle[endpoint] = driver
+        if previous is not None and previous is not driver:
+            quit_quietly(previous)
+
+    def close(self):
+        with self._lock:
+            drivers = list(self._idle.values())
+            self._idle.clear()
+        for driver in drivers:
+            quit_quietly(driver)
+
+
+def is_alive(driver):
+    try:
+        driver.get_window_size()
+        return True
+    except Exception:  # WebDriverException hoặc lỗi kết nối tới Appium server
+        return False
+
+
+def quit_quietly(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
@@ -0,0 +1,129 @@
+"""Báo cáo thời gian chạy: từng test, từng bước đo bên trong test và các session Appium."""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _stats(values):
+    return {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values), 1),
+        'p50_ms': round(_percentile(values, 0.5), 1),
+        'p90_ms': round(_percentile(values, 0.9), 1),
+        'max_ms': round(max(values), 1),
+    }
+
+
+class TestRecord:
+    def __init__(self, test_id, endpoint):
+        self.test_id = test_id
+        self.endpoint = str(endpoint)
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.duration_ms = None
+        self.status = 'running'
+        self.steps = []
+
+    def add_step(self, name, duration_ms, ok=True):
+        self.steps.append({'name': name, 'duration_ms': round(duration_ms, 1), 'ok': ok})
+
+    def finish(self, status):
+        self.status = status
+        self.duration_ms = round((time.perf_counter() - self._started) * 1000, 1)
+
+    def to_dict(self):
+        return {
+            'id': self.test_id,
+            'endpoint': self.endpoint,
+            'status': self.status,
+            'started_at': datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            'duration_ms': self.duration_ms,
+            'steps': self.steps,
+        }
+
+
+class TimingReport:
+    """Thu thập số liệu từ nhiều thread (mỗi endpoint một thread) rồi ghi ra một file JSON."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.tests = []
+        self.sessions = []
+
+    def begin_test(self, test_id, endpoint):
+        record = TestRecord(test_id, endpoint)
+        with self._lock:
+            self.tests.append(record)
+        return record
+
+    def session_created(self, endpoint, duration_ms):
+        with self._lock:
+            self.sessions.append({'endpoint': str(endpoint), 'event': 'created', 'duration_ms': round(duration_ms, 1)})
+
+    def session_reused(self, endpoint):
+        with self._lock:
+            self.sessions.append({'endpoint': str(endpoint), 'event': 'reused'})
+
+    def test_durations(self):
+        """Thời gian theo test id, dùng để chia shard cho lần chạy sau."""
+        return {record.test_id: record.duration_ms for record in self.tests if record.duration_ms is not None}
+
+    def to_dict(self):
+        with self._lock:
+            tests = [record.to_dict() for record in self.tests]
+            sessions = list(self.sessions)
+
+        statuses = {}
+        for test in tests:
+            statuses[test['status']] = statuses.get(test['status'], 0) + 1
+
+        steps = {}
+        for test in tests:
+            for step in test['steps']:
+                steps.setdefault(step['name'], []).append(step['duration_ms'])
+
+        endpoints = {}
+        for test in tests:
+            entry = endpoints.setdefault(test['endpoint'], {'tests': 0, 'busy_ms': 0.0})
+            entry['tests'] += 1
+            entry['busy_ms'] = round(entry['busy_ms'] + (test['duration_ms'] or 0), 1)
+        for session in sessions:
+            entry = endpoints.setdefault(session['endpoint'], {'tests': 0, 'busy_ms': 0.0})
+            entry[f'sessions_{session["event"]}'] = entry.get(f'sessions_{session["event"]}', 0) + 1
+
+        created = [s['duration_ms'] for s in sessions if s['event'] == 'created']
+        return {
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'wall_ms': round((time.perf_counter() - self._started) * 1000, 1),
+            'totals': {'tests': len(tests), **statuses},
+            'session_startup': _stats(created) if created else None,
+            'endpoints': endpoints,
+            'steps': {name: _stats(values) for name, values in sorted(steps.items())},
+            'tests': tests,
+        }
+
+    def write(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+        return path
+
+
+def load_durations(path):
+    """Thời gian từng test của lần chạy trước (nếu có báo cáo)."""
+    try:
+        with open(path, encoding='utf-8') as file:
+            return {test['id']: test['duration_ms'] or 0 for test in json.load(file).get('tests', [])}
+    except (OSError, ValueError):
+        return {}
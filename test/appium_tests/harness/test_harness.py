@@ -0,0 +1,131 @@
+"""Test cho harness, chạy với WebDriver server giả lập (không cần emulator / Appium).
+
+Chạy từ test/appium_tests:  python -m unittest harness.test_harness
+"""
+
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from . import AppTestCase, DriverPool, Endpoint, HarnessContext, TimingReport, parse_endpoints, use_context
+from .fake_webdriver import FakeWebDriverServer
+
+class _DelayedGreeting(AppTestCase):
+    __test__ = False  # pytest: chỉ chạy qua HarnessTest
+    wait_timeout = 3
+    poll_interval = 0.05
+
+    def test_login(self):
+        self.wait_for((AppiumBy.XPATH, '//android.widget.EditText[1]')).send_keys('thuong@gmail.com')
+        self.wait_for((AppiumBy.XPATH, '//android.widget.EditText[2]')).send_keys('123456')
+        with self.step('login_to_greeting'):
+            self.wait_clickable((AppiumBy.ACCESSIBILITY_ID, 'login_button')).click()
+            self.wait_for((AppiumBy.ACCESSIBILITY_ID, 'Hi, Thuong'))
+
+    def test_missing(self):
+        self.assertFalse(self.is_present((AppiumBy.ACCESSIBILITY_ID, 'error_message'), timeout=0.2))
+
+
+class HarnessTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeWebDriverServer(session_delay=0.05).start()
+        self.endpoint = Endpoint(url=self.server.url, udid='fake-0')
+        self.report = TimingReport()
+        self.pool = DriverPool(self.report)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.stop()
+
+    def _run(self, *names):
+        suite = unittest.TestSuite(_DelayedGreeting(name) for name in names)
+        with use_context(HarnessContext(self.endpoint, self.pool, self.report)):
+            return unittest.TextTestRunner(stream=io.StringIO()).run(suite)
+
+    def test_session_is_reused_between_tests(self):
+        result = self._run('test_missing', 'test_login')
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(self.server.sessions_created, 1)
+        events = [session['event'] for session in self.report.sessions]
+        self.assertEqual(events, ['created', 'reused'])
+
+    def test_waits_for_delayed_element_and_records_step(self):
+        self.server.app.login_delay = 0.4
+        started = time.perf_counter()
+        result = self._run('test_login')
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertLess(time.perf_counter() - started, 2)
+        step = self.report.tests[0].steps[0]
+        self.assertEqual(step['name'], 'login_to_greeting')
+        self.assertTrue(step['ok'])
+        self.assertGreaterEqual(step['duration_ms'], 400)
+
+    def test_failed_wait_is_reported(self):
+        self.server.app.login_delay = 10
+        _DelayedGreeting.wait_timeout = 0.3
+        try:
+            result = self._run('test_login')
+        finally:
+            _DelayedGreeting.wait_timeout = 3
+
+        self.assertEqual(len(result.errors), 1)
+        record = self.report.tests[0]
+        self.assertEqual(record.status, 'error')
+        self.assertFalse(record.steps[0]['ok'])
+
+    def test_report_aggregates_steps(self):
+        report = TimingReport()
+        for duration in (100, 200, 300):
+            record = report.begin_test('t', self.endpoint)
+            record.add_step('login_to_greeting', duration)
+            record.finish('passed')
+        report.session_created(self.endpoint, 1500)
+
+        data = report.to_dict()
+        self.assertEqual(data['totals'], {'tests': 3, 'passed': 3})
+        self.assertEqual(data['steps']['login_to_greeting']['p50_ms'], 200)
+        self.assertEqual(data['steps']['login_to_greeting']['max_ms'], 300)
+        self.assertEqual(data['session_startup']['count'], 1)
+        self.assertEqual(data['endpoints'][str(self.endpoint)]['sessions_created'], 1)
+
+
+class ConfigTest(unittest.TestCase):
+    def test_parse_endpoints_assigns_system_ports(self):
+        endpoints = parse_endpoints('emulator-5554@http://127.0.0.1:4723/wd/hub, emulator-5556@http://127.0.0.1:4724')
+
+        self.assertEqual([e.udid for e in endpoints], ['emulator-5554', 'emulator-5556'])
+        self.assertEqual(endpoints[1].url, 'http://127.0.0.1:4724')
+        self.assertEqual([e.system_port for e in endpoints], [8200, 8201])
+        self.assertIsNone(parse_endpoints('http://127.0.0.1:4723')[0].system_port)
+
+
+class RunSuiteTest(unittest.TestCase):
+    def test_login_suite_shards_across_fake_endpoints(self):
+        import run_suite
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'report.json')
+            exit_code = run_suite.main(['--fake', '2', '--report', path, 'login', 'test_open_app'])
+            with open(path, encoding='utf-8') as file:
+                report = json.load(file)
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(report['totals'], {'tests': 3, 'passed': 3})
+        self.assertEqual(len(report['endpoints']), 2)
+        self.assertIn('login_to_greeting', report['steps'])
+
+
+def load_tests(loader, tests, pattern):
+    # _DelayedGreeting chỉ chạy qua HarnessTest (cần context trỏ tới server giả lập)
+    return unittest.TestSuite(loader.loadTestsFromTestCase(cls) for cls in (HarnessTest, ConfigTest, RunSuiteTest))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,309 @@
+"""Phân tích logcat: thời gian khởi động theo từng lần mở ứng dụng và độ trễ phát nhạc.
+
+Đọc logcat dạng threadtime (`adb logcat -v threadtime`, như flutter_log.txt) từng dòng một,
+nên dùng được với file log rất lớn hoặc đọc trực tiếp từ adb qua stdin:
+  python logcat_analyzer.py flutter_log.txt --csv launches.csv --json logcat.json
+  adb logcat -d -v threadtime | python logcat_analyzer.py - --max first_frame_ms=2000
+
+Mỗi lần mở ứng dụng (một pid) bắt đầu từ dòng nativeloader nạp libflutter.so. Các mốc
+(tính bằng ms từ lúc nạp libflutter.so, theo timestamp của logcat):
+  assets_extracted_ms  ResourceExtractor giải nén xong kernel_blob.bin / snapshot (chỉ lần đầu)
+  engine_ready_ms      dòng "Using the Impeller rendering backend" (engine đã tạo surface)
+  dart_ready_ms        dòng "The Dart VM service is listening" (bản debug / profile)
+  <mốc>_ms             các mốc StartupTimeline của ứng dụng (first_frame_ms, catalog_ready_ms, ...)
+Lần mở có giải nén asset là "first" (sau khi cài hoặc xoá dữ liệu), còn lại là "warm".
+Độ trễ phát nhạc lấy từ dòng "D/AudioProvider: Time to audio: <n>ms".
+
+Ngưỡng (--max / --thresholds) so với p90 của từng chỉ số; --baseline so p50 với báo cáo JSON
+của lần chạy trước. Vượt ngưỡng thì thoát với mã 1.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from datetime import datetime
+
+APP_PACKAGE = 'com.example.app_music'
+KINDS = ('first', 'warm')
+
+LINE = re.compile(
+    r'^(?P<date>\d\d-\d\d)\s+(?P<time>\d\d:\d\d:\d\d\.\d{3})\s+(?P<pid>\d+)\s+(?P<tid>\d+)\s+'
+    r'(?P<level>[VDIWEF])\s+(?P<tag>[^:]*?)\s*: (?P<message>.*)$'
+)
+IMPELLER = re.compile(r'Using the Impeller rendering backend \((?P<backend>[^)]+)\)')
+STARTUP_MARK = re.compile(r'StartupTimeline: (?P<name>\w+) \+(?P<ms>\d+)ms')
+TIME_TO_AUDIO = re.compile(r'Time to audio: (?P<ms>\d+)ms \(preloaded: (?P<preloaded>true|false)\)')
+
+PHASES = ('assets_extracted_ms', 'engine_ready_ms', 'dart_ready_ms')
+
+
+def _timestamp(date, time, year):
+    return datetime.strptime(f'{year}-{date} {time}', '%Y-%m-%d %H:%M:%S.%f').timestamp()
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _stats(values):
+    return {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values), 1),
+        'p50_ms': round(_percentile(values, 0.5), 1),
+        'p90_ms': round(_percentile(values, 0.9), 1),
+        'max_ms': round(max(values), 1),
+    }
+
+
+class Launch:
+    """Một lần mở ứng dụng (một process)."""
+
+    def __init__(self, pid, started_at, started_label, after_install=False):
+        self.pid = pid
+        self.started_at = started_at
+        self.started_label = started_label
+        self.after_install = after_install
+        self.extracted = []
+        self.backend = None
+        self.metrics = {}
+        self.app_marks = {}  # Mốc do ứng dụng tự đo, tính từ main()
+        self.time_to_audio = []
+
+    @property
+    def kind(self):
+        return 'first' if self.extracted else 'warm'
+
+    def _offset(self, at):
+        return round((at - self.started_at) * 1000, 1)
+
+    def _first(self, name, at):
+        self.metrics.setdefault(name, self._offset(at))
+
+    def handle(self, at, tag, message):
+        if tag == 'ResourceExtractor' and 'Extracted' in message:
+            self.extracted.append(message.rsplit('/', 1)[-1])
+            self.metrics['assets_extracted_ms'] = self._offset(at)
+        elif tag == 'flutter':
+            if 'Impeller rendering backend' in message:
+                match = IMPELLER.search(message)
+                self.backend = match['backend'] if match else self.backend
+                self._first('engine_ready_ms', at)
+            elif 'Dart VM service is listening' in message:
+                self._first('dart_ready_ms', at)
+            elif 'StartupTimeline:' in message:
+                match = STARTUP_MARK.search(message)
+                if match:
+                    self._first(f"{match['name']}_ms", at)
+                    self.app_marks.setdefault(match['name'], int(match['ms']))
+            elif 'Time to audio:' in message:
+                match = TIME_TO_AUDIO.search(message)
+                if match:
+                    self.time_to_audio.append((int(match['ms']), match['preloaded'] == 'true'))
+
+    def to_dict(self):
+        return {
+            'pid': self.pid,
+            'started': self.started_label,
+            'kind': self.kind,
+            'after_install': self.after_install,
+            'backend': self.backend,
+            'extracted': self.extracted,
+            'metrics': self.metrics,
+            'app_marks': self.app_marks,
+            'time_to_audio_ms': [ms for ms, _ in self.time_to_audio],
+        }
+
+
+def parse_launches(lines, package=APP_PACKAGE, year=None):
+    """Đọc từng dòng, trả về (generator) các Launch khi lần mở đó kết thúc.
+
+    Khi một process mới của ứng dụng nạp libflutter.so thì các lần mở trước được coi là
+    đã kết thúc, nên bộ nhớ chỉ giữ lần mở hiện tại dù log dài bao nhiêu.
+    """
+    year = year or datetime.now().year
+    open_launches = {}
+    pending_install = False
+    last_at = None
+
+    for line in lines:
+        match = LINE.match(line.rstrip('\r\n'))
+        if match is None:
+            continue
+        tag, message = match['tag'], match['message']
+        pid = int(match['pid'])
+
+        if tag == 'nativeloader' and 'libflutter.so' in message and package in message:
+            at = _timestamp(match['date'], match['time'], year)
+            if last_at is not None and at < last_at - 86400:
+                year += 1  # Log vắt qua năm mới (logcat không in năm)
+                at = _timestamp(match['date'], match['time'], year)
+            last_at = at
+            for launch in open_launches.values():
+                yield launch
+            open_launches = {pid: Launch(pid, at, f"{match['date']} {match['time']}", pending_install)}
+            pending_install = False
+        elif tag == 'NativeLibraryHelper' and 'libflutter.so' in message:
+            pending_install = True  # PackageManager đang cài APK mới
+        elif pid in open_launches:
+            at = _timestamp(match['date'], match['time'], year)
+            open_launches[pid].handle(at, tag, message)
+
+    yield from open_launches.values()
+
+
+def summarize(launches):
+    summary = {}
+    for kind in KINDS:
+        group = [launch for launch in launches if launch.kind == kind]
+        metrics = {}
+        for launch in group:
+            for name, value in launch.metrics.items():
+                metrics.setdefault(name, []).append(value)
+        audio = [ms for launch in group for ms, _ in launch.time_to_audio]
+        if audio:
+            metrics['time_to_audio_ms'] = audio
+        summary[kind] = {
+            'launches': len(group),
+            'metrics': {name: _stats(values) for name, values in sorted(metrics.items())},
+        }
+    return summary
+
+
+def parse_threshold(spec):
+    """"[first:|warm:]<chỉ số>=<ms>" -> (kind hoặc None, chỉ số, ms)."""
+    name, _, value = spec.partition('=')
+    kind, _, metric = name.rpartition(':')
+    if kind and kind not in KINDS:
+        raise ValueError(f'Loại lần mở không hợp lệ: {kind}')
+    return kind or None, metric, float(value)
+
+
+def load_thresholds(path):
+    """File JSON dạng {"any": {"first_frame_ms": 2000}, "first": {...}, "warm": {...}}."""
+    with open(path, encoding='utf-8') as file:
+        data = json.load(file)
+    return [
+        (None if kind == 'any' else kind, metric, float(limit))
+        for kind, limits in data.items() for metric, limit in limits.items()
+    ]
+
+
+def check_thresholds(summary, thresholds):
+    violations = []
+    for kind, metric, limit in thresholds:
+        for group in ([kind] if kind else KINDS):
+            stats = summary[group]['metrics'].get(metric)
+            if stats and stats['p90_ms'] > limit:
+                violations.append({
+                    'kind': group, 'metric': metric, 'stat': 'p90_ms', 'value': stats['p90_ms'], 'limit': limit,
+                })
+    return violations
+
+
+def check_baseline(summary, baseline, tolerance):
+    """So p50 với báo cáo trước; chậm hơn quá tolerance (tỉ lệ, vd 0.2 = 20%) là hồi quy."""
+    violations = []
+    for kind in KINDS:
+        previous = baseline.get('summary', {}).get(kind, {}).get('metrics', {})
+        for metric, stats in summary[kind]['metrics'].items():
+            if metric not in previous:
+                continue
+            limit = round(previous[metric]['p50_ms'] * (1 + tolerance), 1)
+            if stats['p50_ms'] > limit:
+                violations.append({
+                    'kind': kind, 'metric': metric, 'stat': 'p50_ms', 'value': stats['p50_ms'], 'limit': limit,
+                    'baseline': previous[metric]['p50_ms'],
+                })
+    return violations
+
+
+def write_csv(launches, path):
+    columns = sorted({name for launch in launches for name in launch.metrics}, key=_column_order)
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['pid', 'started', 'kind', 'after_install', 'backend', *columns, 'time_to_audio_ms'])
+        for launch in launches:
+            writer.writerow([
+                launch.pid, launch.started_label, launch.kind, int(launch.after_install), launch.backend or '',
+                *(launch.metrics.get(name, '') for name in columns),
+                ' '.join(str(ms) for ms, _ in launch.time_to_audio),
+            ])
+
+
+def _column_order(name):
+    return (PHASES.index(name) if name in PHASES else len(PHASES), name)
+
+
+def analyze(lines, package=APP_PACKAGE, thresholds=(), baseline=None, tolerance=0.2, year=None):
+    launches = list(parse_launches(lines, package, year))
+    summary = summarize(launches)
+    violations = check_thresholds(summary, thresholds)
+    if baseline:
+        violations += check_baseline(summary, baseline, tolerance)
+    return launches, {
+        'package': package,
+        'summary': summary,
+        'violations': violations,
+        'launches': [launch.to_dict() for launch in launches],
+    }
+
+
+def print_summary(result, out=None):
+    out = out or sys.stdout
+    for kind in KINDS:
+        group = result['summary'][kind]
+        print(f"{kind}: {group['launches']} lần mở", file=out)
+        for name, stats in sorted(group['metrics'].items(), key=lambda item: _column_order(item[0])):
+            print(f"  {name:<22} p50 {stats['p50_ms']:>8}  p90 {stats['p90_ms']:>8}  max {stats['max_ms']:>8}"
+                  f"  (n={stats['count']})", file=out)
+    for violation in result['violations']:
+        print(f"❌ {violation['kind']} {violation['metric']}: {violation['stat']} {violation['value']}ms"
+              f" > {violation['limit']}ms", file=out)
+    if not result['violations']:
+        print('✅ Không vượt ngưỡng nào', file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Đo thời gian khởi động / phát nhạc từ logcat.')
+    parser.add_argument('log', help='File logcat (threadtime), "-" để đọc từ stdin')
+    parser.add_argument('--package', default=APP_PACKAGE)
+    parser.add_argument('--csv', help='Ghi từng lần mở ra file CSV')
+    parser.add_argument('--json', help='Ghi tổng hợp + từng lần mở ra file JSON')
+    parser.add_argument('--max', action='append', default=[], metavar='[KIND:]METRIC=MS',
+                        help='Ngưỡng p90, vd first_frame_ms=2000 hoặc warm:engine_ready_ms=400')
+    parser.add_argument('--thresholds', help='File JSON chứa các ngưỡng')
+    parser.add_argument('--baseline', help='Báo cáo JSON lần trước để phát hiện hồi quy')
+    parser.add_argument('--tolerance', type=float, default=20, help='Phần trăm chậm hơn baseline cho phép')
+    parser.add_argument('--year', type=int, help='Năm của log (logcat không in năm)')
+    args = parser.parse_args(argv)
+
+    thresholds = [parse_threshold(spec) for spec in args.max]
+    if args.thresholds:
+        thresholds += load_thresholds(args.thresholds)
+    baseline = None
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+
+    if args.log == '-':
+        source = sys.stdin
+    else:
+        source = open(args.log, encoding='utf-8', errors='replace')
+    with source:
+        launches, result = analyze(source, args.package, thresholds, baseline, args.tolerance / 100, args.year)
+
+    if args.csv:
+        write_csv(launches, args.csv)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(result, file, ensure_ascii=False, indent=2)
+    print_summary(result)
+    return 1 if result['violations'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
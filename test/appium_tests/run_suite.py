@@ -0,0 +1,186 @@
+"""Chạy các test Appium song song trên nhiều emulator / Appium endpoint.
+
+Mỗi endpoint có một thread lấy test class từ một hàng đợi chung (test class là đơn vị chia
+shard vì các test trong một class thường phụ thuộc trạng thái ứng dụng của nhau). Class chạy
+lâu nhất ở lần trước được lấy trước, nên các endpoint xong gần cùng lúc. Session Appium được
+dùng lại giữa các test trên cùng endpoint (harness.DriverPool).
+
+Ví dụ:
+  APPIUM_ENDPOINTS=emulator-5554@http://127.0.0.1:4723/wd/hub,emulator-5556@http://127.0.0.1:4723/wd/hub \\
+      python run_suite.py
+  python run_suite.py login test_open_app          # chỉ chạy các file đã chọn
+  python run_suite.py --fake 2 login               # chạy thử với WebDriver server giả lập
+  python run_suite.py --logcat --logcat-thresholds thresholds.json
+      # xoá logcat trước khi chạy, sau đó phân tích thời gian khởi động trên từng thiết bị
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import unittest
+
+SUITE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, SUITE_DIR)
+
+from harness import AppTestCase, DriverPool, Endpoint, HarnessContext, TimingReport, load_durations, load_endpoints, \
+    parse_endpoints, use_context  # noqa: E402
+from harness.case import DEFAULT_REPORT_PATH  # noqa: E402
+import logcat_analyzer  # noqa: E402
+
+
+def discover_modules(names=None):
+    if names:
+        return [name[:-3] if name.endswith('.py') else name for name in names]
+    return sorted(
+        file[:-3] for file in os.listdir(SUITE_DIR)
+        if file.endswith('.py') and file != os.path.basename(__file__)
+    )
+
+
+def collect_units(module_names):
+    """Mỗi AppTestCase class là một đơn vị công việc: (tên, TestSuite, danh sách test id)."""
+    loader = unittest.TestLoader()
+    units = []
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        for name in sorted(dir(module)):
+            cls = getattr(module, name)
+            if not (isinstance(cls, type) and issubclass(cls, AppTestCase) and cls is not AppTestCase):
+                continue
+            if cls.__module__ != module.__name__:
+                continue
+            suite = loader.loadTestsFromTestCase(cls)
+            test_ids = [test.id() for test in suite]
+            if test_ids:
+                units.append((f'{module_name}.{name}', suite, test_ids))
+    return units
+
+
+def order_units(units, durations):
+    """Class chạy lâu nhất trước; class chưa có số liệu coi như lâu nhất (chưa biết)."""
+    def expected(unit):
+        known = [durations[test_id] for test_id in unit[2] if test_id in durations]
+        return float('inf') if len(known) < len(unit[2]) else sum(known)
+    return sorted(units, key=expected, reverse=True)
+
+
+def run_units(units, endpoints, report, verbosity=1):
+    pool = DriverPool(report)
+    work = queue.Queue()
+    for unit in units:
+        work.put(unit)
+
+    results = []
+    print_lock = threading.Lock()
+
+    def worker(endpoint):
+        context = HarnessContext(endpoint, pool, report)
+        with use_context(context):
+            while True:
+                try:
+                    name, suite, _ = work.get_nowait()
+                except queue.Empty:
+                    return
+                # Gom kết quả unittest của từng class, in một lần để các endpoint không xen lẫn nhau
+                stream = io.StringIO()
+                started = time.perf_counter()
+                result = unittest.TextTestRunner(stream=stream, verbosity=verbosity).run(suite)
+                elapsed = time.perf_counter() - started
+                with print_lock:
+                    results.append(result)
+                    mark = '✅' if result.wasSuccessful() else '❌'
+                    print(f'{mark} [{endpoint}] {name}: {result.testsRun} test, {elapsed:.1f}s')
+                    if not result.wasSuccessful() or verbosity > 1:
+                        print(stream.getvalue())
+
+    threads = [threading.Thread(target=worker, args=(endpoint,), name=str(endpoint)) for endpoint in endpoints]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        pool.close()
+    return results
+
+
+def clear_logcat(endpoints):
+    for endpoint in endpoints:
+        subprocess.run(['adb', '-s', endpoint.udid, 'logcat', '-c'], check=False)
+
+
+def analyze_logcat(endpoints, report_dir, thresholds):
+    """Đọc logcat của từng thiết bị (stream từ adb, không lưu cả log vào bộ nhớ) và ghi báo cáo."""
+    ok = True
+    for endpoint in endpoints:
+        command = ['adb', '-s', endpoint.udid, 'logcat', '-d', '-v', 'threadtime']
+        with subprocess.Popen(command, stdout=subprocess.PIPE, text=True, encoding='utf-8', errors='replace') as adb:
+            launches, result = logcat_analyzer.analyze(adb.stdout, thresholds=thresholds)
+        path = os.path.join(report_dir, f'logcat_{endpoint.udid}')
+        logcat_analyzer.write_csv(launches, f'{path}.csv')
+        with open(f'{path}.json', 'w', encoding='utf-8') as file:
+            json.dump(result, file, ensure_ascii=False, indent=2)
+        print(f'▶ Logcat {endpoint.udid}: {path}.json')
+        logcat_analyzer.print_summary(result)
+        ok = ok and not result['violations']
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Chạy test Appium song song trên nhiều endpoint.')
+    parser.add_argument('modules', nargs='*', help='File test cần chạy (mặc định: tất cả trong thư mục)')
+    parser.add_argument('--endpoints', help='"<udid>@<url>,..." (mặc định: APPIUM_ENDPOINTS)')
+    parser.add_argument('--report', default=os.environ.get('APPIUM_REPORT', DEFAULT_REPORT_PATH),
+                        help='File báo cáo thời gian JSON')
+    parser.add_argument('--fake', type=int, default=0, metavar='N',
+                        help='Chạy với N WebDriver server giả lập thay cho emulator')
+    parser.add_argument('--logcat', action='store_true',
+                        help='Phân tích logcat của từng thiết bị sau khi chạy (logcat_analyzer.py)')
+    parser.add_argument('--logcat-thresholds', help='File JSON ngưỡng cho logcat_analyzer')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+
+    fakes = []
+    if args.fake:
+        from harness.fake_webdriver import FakeWebDriverServer
+        fakes = [FakeWebDriverServer(session_delay=0.5).start() for _ in range(args.fake)]
+        endpoints = [Endpoint(url=fake.url, udid=f'fake-{index}') for index, fake in enumerate(fakes)]
+    else:
+        endpoints = parse_endpoints(args.endpoints) if args.endpoints else load_endpoints()
+    # Server giả lập không có logcat
+    logcat = args.logcat and not fakes
+    if logcat:
+        clear_logcat(endpoints)
+
+    try:
+        units = order_units(collect_units(discover_modules(args.modules)), load_durations(args.report))
+        print(f'▶ {len(units)} test class trên {len(endpoints)} endpoint')
+        report = TimingReport()
+        results = run_units(units, endpoints, report, verbosity=2 if args.verbose else 1)
+    finally:
+        for fake in fakes:
+            fake.stop()
+
+    report.write(args.report)
+    summary = report.to_dict()
+    print(f"Tổng: {summary['totals']}, {summary['wall_ms'] / 1000:.1f}s")
+    for name, stats in summary['steps'].items():
+        print(f"  {name}: p50 {stats['p50_ms']}ms, p90 {stats['p90_ms']}ms (n={stats['count']})")
+    print(f'✅ Báo cáo thời gian: {args.report}')
+
+    passed = all(result.wasSuccessful() for result in results)
+    if logcat:
+        thresholds = logcat_analyzer.load_thresholds(args.logcat_thresholds) if args.logcat_thresholds else []
+        passed = analyze_logcat(endpoints, os.path.dirname(os.path.abspath(args.report)), thresholds) and passed
+    return 0 if passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Test cho logcat_analyzer, dùng log mẫu flutter_log.txt (không cần thiết bị).
+
+Chạy từ test/appium_tests:  python -m unittest test_logcat_analyzer
+"""
+
+import csv
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import logcat_analyzer
+
+SAMPLE_LOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'flutter_log.txt')
+
+SYNTHETIC_LOG = """\
+04-08 10:00:00.000  100  110 D nativeloader: Load /data/app/~~a==/com.example.app_music-b==/lib/x86_64/libflutter.so using ns clns-7: ok
+04-08 10:00:00.300  100  111 I ResourceExtractor: Extracted baseline resource assets/flutter_assets/kernel_blob.bin
+04-08 10:00:00.400  100  100 I flutter : [IMPORTANT:flutter/shell/platform/android/android_context_vk_impeller.cc(60)] Using the Impeller rendering backend (Vulkan).
+04-08 10:00:00.500  100  120 I flutter : The Dart VM service is listening on http://127.0.0.1:33443/abc=/
+04-08 10:00:00.550  100  120 I flutter : StartupTimeline: process_start +0ms
+04-08 10:00:00.900  100  120 I flutter : StartupTimeline: first_frame +350ms
+04-08 10:00:05.000  100  120 I flutter : D/AudioProvider: Time to audio: 180ms (preloaded: false)
+04-08 10:00:09.000  999  999 I flutter : StartupTimeline: first_frame +1ms
+04-08 10:01:00.000  200  210 D nativeloader: Load /data/app/~~a==/com.example.app_music-b==/lib/x86_64/libflutter.so using ns clns-7: ok
+04-08 10:01:00.200  200  200 I flutter : [IMPORTANT:flutter/shell/platform/android/android_context_vk_impeller.cc(60)] Using the Impeller rendering backend (Vulkan).
+04-08 10:01:00.250  200  220 I flutter : StartupTimeline: first_frame +150ms
+04-08 10:01:03.000  200  220 I flutter : D/AudioProvider: Time to audio: 40ms (preloaded: true)
+"""
+
+
+class LogcatAnalyzerTest(unittest.TestCase):
+    def test_phases_marks_and_playback_per_launch(self):
+        first, warm = logcat_analyzer.parse_launches(io.StringIO(SYNTHETIC_LOG), year=2025)
+
+        self.assertEqual((first.pid, first.kind, first.backend), (100, 'first', 'Vulkan'))
+        self.assertEqual(first.metrics, {
+            'assets_extracted_ms': 300.0, 'engine_ready_ms': 400.0, 'dart_ready_ms': 500.0,
+            'process_start_ms': 550.0, 'first_frame_ms': 900.0,
+        })
+        self.assertEqual(first.app_marks, {'process_start': 0, 'first_frame': 350})
+        self.assertEqual(first.time_to_audio, [(180, False)])
+
+        # Dòng của pid khác (999) không thuộc lần mở nào
+        self.assertEqual(warm.kind, 'warm')
+        self.assertEqual(warm.metrics, {'engine_ready_ms': 200.0, 'first_frame_ms': 250.0})
+        self.assertEqual(warm.time_to_audio, [(40, True)])
+
+    def test_thresholds_and_baseline(self):
+        thresholds = [logcat_analyzer.parse_threshold('warm:first_frame_ms=200'),
+                      logcat_analyzer.parse_threshold('time_to_audio_ms=500')]
+        baseline = {'summary': {'first': {'metrics': {'first_frame_ms': {'p50_ms': 600}}}}}
+        _, result = logcat_analyzer.analyze(io.StringIO(SYNTHETIC_LOG), thresholds=thresholds,
+                                            baseline=baseline, tolerance=0.2, year=2025)
+
+        violations = [(v['kind'], v['metric'], v['stat']) for v in result['violations']]
+        self.assertEqual(violations, [('warm', 'first_frame_ms', 'p90_ms'), ('first', 'first_frame_ms', 'p50_ms')])
+        self.assertRaises(ValueError, logcat_analyzer.parse_threshold, 'cold:first_frame_ms=1')
+
+    def test_sample_log(self):
+        with open(SAMPLE_LOG, encoding='utf-8') as file:
+            launches, result = logcat_analyzer.analyze(file, year=2025)
+
+        self.assertEqual(len(launches), 48)
+        self.assertEqual(result['summary']['first']['launches'], 21)
+        self.assertEqual(result['summary']['warm']['launches'], 27)
+        self.assertNotIn('assets_extracted_ms', result['summary']['warm']['metrics'])
+        # Lần mở đầu tiên sau khi cài APK mới
+        self.assertEqual([launch.pid for launch in launches if launch.after_install][:1], [8426])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'launches.csv')
+            logcat_analyzer.write_csv(launches, path)
+            with open(path, encoding='utf-8') as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 48)
+        self.assertEqual(rows[1]['assets_extracted_ms'], '611.0')
+
+    def test_cli_exit_code(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(logcat_analyzer.main([SAMPLE_LOG, '--year', '2025']), 0)
+            self.assertEqual(logcat_analyzer.main([SAMPLE_LOG, '--year', '2025', '--max', 'first:dart_ready_ms=500']), 1)
+        self.assertIn('❌ first dart_ready_ms', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
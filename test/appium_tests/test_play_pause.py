@@ -1,50 +1,39 @@
 import unittest
-from appium import webdriver
 from appium.webdriver.common.appiumby import AppiumBy
-import time
-
-class PlayPauseMusicTest(unittest.TestCase):
-    def setUp(self):
-        desired_caps = {
-            "platformName": "Android",
-            "deviceName": "emulator-5554",  # Đổi thành ID thiết bị của bạn nếu dùng điện thoại thật
-            "appPackage": "com.example.app",  # Đổi thành package của ứng dụng
-            "appActivity": ".MainActivity",  # Đổi thành activity chính
-            "automationName": "UiAutomator2"
-        }
-        self.driver = webdriver.Remote("http://localhost:4723/wd/hub", desired_caps)
-        self.driver.implicitly_wait(10)
 
+from harness import AppTestCase
+
+PLAY_BUTTON = (AppiumBy.ID, "com.example:id/playButton")
+PAUSE_BUTTON = (AppiumBy.ID, "com.example:id/pauseButton")
+MUSIC_STATUS = (AppiumBy.ID, "com.example:id/musicStatus")
+ERROR_MESSAGE = (AppiumBy.ID, "com.example:id/errorMessage")
+
+
+class PlayPauseMusicTest(AppTestCase):
     def test_play_music_success(self):
         """Kiểm thử phát nhạc thành công"""
-        self.driver.find_element(AppiumBy.ID, "com.example:id/playButton").click()
-
-        # Kiểm tra trạng thái phát nhạc
-        music_status = self.driver.find_element(AppiumBy.ID, "com.example:id/musicStatus").text
+        with self.step('play'):
+            self.wait_clickable(PLAY_BUTTON).click()
+            # Kiểm tra trạng thái phát nhạc
+            music_status = self.wait_for_text(MUSIC_STATUS, "Đang phát")
         self.assertEqual(music_status, "Đang phát")
-        time.sleep(2)
 
     def test_pause_music_success(self):
         """Kiểm thử dừng nhạc thành công"""
-        self.driver.find_element(AppiumBy.ID, "com.example:id/playButton").click()  # Phát nhạc
-        self.driver.find_element(AppiumBy.ID, "com.example:id/pauseButton").click()  # Dừng nhạc
-
-        # Kiểm tra trạng thái nhạc đã dừng
-        music_status = self.driver.find_element(AppiumBy.ID, "com.example:id/musicStatus").text
+        self.wait_clickable(PLAY_BUTTON).click()  # Phát nhạc
+        with self.step('pause'):
+            self.wait_clickable(PAUSE_BUTTON).click()  # Dừng nhạc
+            # Kiểm tra trạng thái nhạc đã dừng
+            music_status = self.wait_for_text(MUSIC_STATUS, "Đã dừng")
         self.assertEqual(music_status, "Đã dừng")
-        time.sleep(2)
 
     def test_play_music_failure(self):
         """Kiểm thử phát nhạc không thành công (Ví dụ nhạc bị lỗi)"""
-        self.driver.find_element(AppiumBy.ID, "com.example:id/playButton").click()
+        self.wait_clickable(PLAY_BUTTON).click()
 
         # Giả sử ứng dụng sẽ hiển thị thông báo lỗi nếu không thể phát nhạc
-        error_message = self.driver.find_element(AppiumBy.ID, "com.example:id/errorMessage").text
+        error_message = self.wait_for(ERROR_MESSAGE).text
         self.assertEqual(error_message, "Không thể phát nhạc.")
-        time.sleep(2)
-
-    def tearDown(self):
-        self.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,157 @@
+// Micro-benchmark: giải mã danh sách bài hát trên isolate chính so với JsonWorker,
+// và payload đầy đủ so với payload rút gọn (?view=summary, SongSummary).
+//
+// Chạy bằng: dart run test/benchmark/catalog_decode_benchmark.dart
+//
+// Mặc định dùng payload dựng trong bộ nhớ. Đặt CATALOG_URL để lấy payload thật từ
+// mock server (test/mock_server/mock_server.py) hoặc một server khác:
+//   CATALOG_URL=http://127.0.0.1:8080 dart run test/benchmark/catalog_decode_benchmark.dart
+// (các kích thước lớn hơn số bài hát của server được bỏ qua).
+//
+// Với mỗi kích thước catalog (1k, 10k, 50k bài hát) in ra:
+//  - bytes: kích thước body
+//  - wall: tổng thời gian đến khi có đủ danh sách model
+//  - max stall: khoảng nghẽn dài nhất của event loop trên isolate chính
+//    (đây là con số quyết định việc rớt frame, 16ms = 1 frame ở 60Hz)
+
+import 'dart:async';
+import 'dart:convert';
+import 'dart:io';
+import 'dart:typed_data';
+import 'package:app_music/models/song.dart';
+import 'package:app_music/models/song_summary.dart';
+import 'package:app_music/service/json_worker.dart';
+
+Uint8List buildSongsPayload(int count) {
+  final songs = List.generate(count, (i) {
+    final createdAt = DateTime.utc(2025, 1, 1).add(Duration(minutes: i)).toIso8601String();
+    return {
+      '_id': 'song_$i',
+      'title': 'Bài hát số $i',
+      'description': 'Mô tả cho bài hát $i',
+      'lyrics': 'Lời bài hát $i ' * 20,
+      'artist': {'_id': 'artist_${i % 200}', 'title': 'Ca sĩ ${i % 200}', 'createdAt': createdAt, 'updatedAt': createdAt},
+      'album': {'_id': 'album_${i % 500}', 'title': 'Album ${i % 500}', 'slugify': 'album-${i % 500}', 'createdAt': createdAt, 'updatedAt': createdAt},
+      'genre': [
+        {'_id': 'genre_${i % 12}', 'title': 'Thể loại ${i % 12}', 'createdAt': createdAt, 'updatedAt': createdAt},
+      ],
+      'duration': '3:${(i % 60).toString().padLeft(2, '0')}',
+      'slugify': 'bai-hat-so-$i',
+      'url': 'https://example.com/songs/$i.mp3',
+      'coverImage': 'https://example.com/covers/$i.jpg',
+      'likes': List.generate(10, (j) => 'user_$j'),
+      'comments': List.generate(3, (j) => {'user': 'user_$j', 'text': 'Hay quá $j', 'createdAt': createdAt}),
+      'createdAt': createdAt,
+      'updatedAt': createdAt,
+    };
+  });
+  return Uint8List.fromList(utf8.encode(json.encode({'success': true, 'data': songs})));
+}
+
+// Payload của /api/v1/song?view=summary: không có lyrics / description / likes /
+// comments, artist / album / genre chỉ còn {_id, title}
+Uint8List buildSummaryPayload(int count) {
+  final songs = List.generate(count, (i) => {
+    '_id': 'song_$i',
+    'title': 'Bài hát số $i',
+    'artist': {'_id': 'artist_${i % 200}', 'title': 'Ca sĩ ${i % 200}'},
+    'album': {'_id': 'album_${i % 500}', 'title': 'Album ${i % 500}'},
+    'genre': [
+      {'_id': 'genre_${i % 12}', 'title': 'Thể loại ${i % 12}'},
+    ],
+    'duration': '3:${(i % 60).toString().padLeft(2, '0')}',
+    'url': 'https://example.com/songs/$i.mp3',
+    'coverImage': 'https://example.com/covers/$i.jpg',
+  });
+  return Uint8List.fromList(utf8.encode(json.encode({'success': true, 'data': songs})));
+}
+
+// Một trang count bài hát từ server, trả về null nếu server có ít bài hát hơn
+Future<Uint8List?> fetchSongsPayload(String baseUrl, int count, {bool summary = false}) async {
+  final uri = Uri.parse('$baseUrl/api/v1/song').replace(queryParameters: {
+    if (summary) 'view': 'summary',
+    'limit': '$count',
+  });
+  final client = HttpClient();
+  try {
+    final response = await (await client.getUrl(uri)).close();
+    if (response.statusCode != 200) throw HttpException('GET $uri: ${response.statusCode}');
+    final builder = BytesBuilder(copy: false);
+    await response.forEach(builder.add);
+    final body = builder.takeBytes();
+    final total = (json.decode(utf8.decode(body))['total'] as num?)?.toInt();
+    return total != null && total < count ? null : body;
+  } finally {
+    client.close();
+  }
+}
+
+// Đo khoảng nghẽn lớn nhất của event loop trong lúc chạy [action]
+Future<(Duration, Duration)> measure(Future<void> Function() action) async {
+  final tick = Stopwatch()..start();
+  var lastTick = Duration.zero;
+  var maxStall = Duration.zero;
+  final timer = Timer.periodic(const Duration(milliseconds: 1), (_) {
+    final now = tick.elapsed;
+    final gap = now - lastTick;
+    if (gap > maxStall) maxStall = gap;
+    lastTick = now;
+  });
+
+  final wall = Stopwatch()..start();
+  await action();
+  wall.stop();
+
+  final gap = tick.elapsed - lastTick;
+  if (gap > maxStall) maxStall = gap;
+  timer.cancel();
+  return (wall.elapsed, maxStall);
+}
+
+Future<void> main() async {
+  final worker = JsonWorker();
+  // Khởi động isolate trước để không tính chi phí spawn vào lần đo đầu tiên
+  await worker.parseList(buildSongsPayload(1), Song.fromJson);
+
+  final baseUrl = Platform.environment['CATALOG_URL'];
+
+  print('songs\tmode\tbytes\twall_ms\tmax_stall_ms');
+  for (final count in [1000, 10000, 50000]) {
+    final Uint8List payload;
+    final Uint8List summaryPayload;
+    if (baseUrl == null) {
+      payload = buildSongsPayload(count);
+      summaryPayload = buildSummaryPayload(count);
+    } else {
+      final full = await fetchSongsPayload(baseUrl, count);
+      final summary = await fetchSongsPayload(baseUrl, count, summary: true);
+      if (full == null || summary == null) {
+        print('$count\tskipped (server has fewer songs)');
+        continue;
+      }
+      payload = full;
+      summaryPayload = summary;
+    }
+
+    final (mainWall, mainStall) = await measure(() async {
+      final decoded = json.decode(utf8.decode(payload));
+      final songs = extractDataList(decoded).map((json) => Song.fromJson(json)).toList();
+      if (songs.length != count) throw StateError('unexpected length ${songs.length}');
+    });
+    print('$count\tmain\t${payload.length}\t${mainWall.inMilliseconds}\t${mainStall.inMilliseconds}');
+
+    final (isolateWall, isolateStall) = await measure(() async {
+      final songs = await worker.parseList(payload, Song.fromJson);
+      if (songs.length != count) throw StateError('unexpected length ${songs.length}');
+    });
+    print('$count\tisolate\t${payload.length}\t${isolateWall.inMilliseconds}\t${isolateStall.inMilliseconds}');
+
+    final (summaryWall, summaryStall) = await measure(() async {
+      final songs = await worker.parseList(summaryPayload, SongSummary.fromJson);
+      if (songs.length != count) throw StateError('unexpected length ${songs.length}');
+    });
+    print('$count\tsummary\t${summaryPayload.length}\t${summaryWall.inMilliseconds}\t${summaryStall.inMilliseconds}');
+  }
+
+  worker.dispose();
+}
@@ -0,0 +1,95 @@
+// Micro-benchmark: độ trễ mỗi lần gõ phím của SearchIndex so với quét tuyến tính cũ.
+//
+// Chạy bằng: dart run test/benchmark/search_index_benchmark.dart
+//
+// Với mỗi kích thước catalog (10k, 100k bài hát) in ra:
+//  - build: thời gian dựng chỉ mục (chỉ chạy một lần trong setSongs)
+//  - p50 / max: độ trễ mỗi phím khi gõ lần lượt từng ký tự của các truy vấn mẫu
+// Mục tiêu: max của "index" < 16ms (1 frame ở 60Hz).
+
+import 'package:app_music/models/song_summary.dart';
+import 'package:app_music/service/search_index.dart';
+
+const _words = [
+  'Chạy', 'Ngay', 'Đi', 'Em', 'Của', 'Ngày', 'Hôm', 'Qua', 'Nơi', 'Này', 'Có',
+  'Anh', 'Lạc', 'Trôi', 'Hãy', 'Trao', 'Cho', 'Muộn', 'Rồi', 'Mà', 'Sao', 'Còn',
+  'Nắng', 'Mưa', 'Yêu', 'Thương', 'Xa', 'Về', 'Đêm', 'Trăng', 'Hoa', 'Gió',
+];
+const _artistNames = [
+  'Sơn Tùng M-TP', 'Mỹ Tâm', 'Đen Vâu', 'Hà Anh Tuấn', 'Hoàng Thùy Linh',
+  'Vũ', 'Bích Phương', 'Noo Phước Thịnh', 'Tóc Tiên', 'Đức Phúc',
+];
+const _genreNames = ['Pop', 'Ballad', 'Rap', 'Indie', 'Bolero', 'EDM', 'Rock', 'R&B'];
+
+List<SongSummary> buildSongs(int count) {
+  return List.generate(count, (i) {
+    final title = List.generate(
+      2 + i % 3,
+      (j) => _words[(i * 31 + j * 17 + i ~/ _words.length) % _words.length],
+    ).join(' ');
+    final artist = i % 200;
+    final album = i % 500;
+    final genre = i % _genreNames.length;
+    return SongSummary(
+      id: 'song_$i',
+      title: i % 1000 == 0 ? 'Chạy Ngay Đi' : '$title $i',
+      artistId: 'artist_$artist',
+      artistName: '${_artistNames[artist % _artistNames.length]} ${artist ~/ _artistNames.length}',
+      albumId: 'album_$album',
+      albumTitle: 'Album ${_words[album % _words.length]} ${_words[(album * 7) % _words.length]}',
+      genreIds: ['genre_$genre'],
+      genreTitles: [_genreNames[genre]],
+    );
+  });
+}
+
+// Cách lọc cũ của SearchProvider, giữ lại để so sánh
+List<SongSummary> linearScan(List<SongSummary> songs, String query) {
+  return songs.where((song) => song.title.toLowerCase().contains(query.toLowerCase())).toList();
+}
+
+// Độ trễ từng phím khi gõ lần lượt các tiền tố của mỗi truy vấn
+List<Duration> typeQueries(List<String> queries, void Function(String query) onKey) {
+  final latencies = <Duration>[];
+  for (final query in queries) {
+    for (int i = 1; i <= query.length; i++) {
+      final stopwatch = Stopwatch()..start();
+      onKey(query.substring(0, i));
+      latencies.add(stopwatch.elapsed);
+    }
+  }
+  return latencies;
+}
+
+String summarize(List<Duration> latencies) {
+  final sorted = [...latencies]..sort();
+  final p50 = sorted[sorted.length ~/ 2];
+  final max = sorted.last;
+  return '${(p50.inMicroseconds / 1000).toStringAsFixed(2)}\t${(max.inMicroseconds / 1000).toStringAsFixed(2)}';
+}
+
+void main() {
+  const queries = ['chay ngay di', 'Chạy Ngay Đi', 'son tung', 'em cua ngay hom qua', 'ballad', 'a'];
+
+  print('songs\tmode\tbuild_ms\tp50_ms\tmax_ms');
+  for (final count in [10000, 100000]) {
+    final songs = buildSongs(count);
+
+    // Khởi động JIT trước khi đo
+    typeQueries(queries, (q) => linearScan(songs, q));
+    final linear = typeQueries(queries, (q) => linearScan(songs, q));
+    print('$count\tlinear\t-\t${summarize(linear)}');
+
+    final build = Stopwatch()..start();
+    final index = SearchIndex(songs);
+    build.stop();
+    typeQueries(queries, (q) => index.search(q));
+    final indexed = typeQueries(queries, (q) => index.search(q));
+    print('$count\tindex\t${build.elapsedMilliseconds}\t${summarize(indexed)}');
+
+    final hits = index.search('chay ngay di');
+    if (hits.isEmpty || foldForSearch(songs[hits.first].title) != 'chay ngay di') {
+      throw StateError('"chay ngay di" should rank "Chạy Ngay Đi" first');
+    }
+  }
+}
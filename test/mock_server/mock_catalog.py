@@ -0,0 +1,311 @@
+"""Sinh catalog giả lập (song / album / artist / genre / user) có cấu trúc giống API thật.
+
+Cùng seed và cùng số bài hát luôn cho ra cùng một catalog: id, tên, quan hệ và
+thời gian đều được suy ra từ (seed, loại, chỉ số), nên có thể so sánh kết quả đo
+giữa các lần chạy. Chỉ các trường hiển thị của bài hát được giữ trong bộ nhớ;
+lyrics / description / likes / comments được sinh lại khi cần (payload đầy đủ),
+nhờ vậy catalog 100k bài hát vẫn dựng được trong vài giây.
+"""
+
+import hashlib
+import random
+from datetime import datetime, timedelta, timezone
+
+MAX_SONGS = 100_000
+
+_VI_WORDS = [
+    'Em', 'Anh', 'Ngày', 'Mai', 'Nắng', 'Mưa', 'Yêu', 'Thương', 'Nhớ', 'Về', 'Đêm',
+    'Trăng', 'Hoa', 'Gió', 'Phố', 'Cũ', 'Xa', 'Lạc', 'Trôi', 'Muộn', 'Rồi', 'Chạy',
+    'Ngay', 'Đi', 'Hẹn', 'Mùa', 'Thu', 'Hạ', 'Đông', 'Xuân', 'Biển', 'Sông', 'Quê',
+    'Hương', 'Tình', 'Một', 'Mình', 'Cô', 'Đơn', 'Bình', 'Yên', 'Giấc', 'Mơ', 'Hà',
+    'Nội', 'Sài', 'Gòn', 'Còn', 'Mãi', 'Lời', 'Hứa', 'Vội', 'Vàng', 'Bên', 'Nhau',
+]
+_VI_TEMPLATES = [
+    '{0} {1}', '{0} {1} {2}', '{0} {1} {2} {3}', 'Chỉ Là {0} {1}', '{0} Của {1}',
+    'Nơi {0} {1}', 'Có {0} {1} {2}', '{0} {1} Và {2}',
+]
+_EN_WORDS = [
+    'Love', 'Night', 'Summer', 'Dreams', 'Lights', 'Heart', 'Fire', 'Rain', 'Forever',
+    'Golden', 'Blue', 'Midnight', 'City', 'Home', 'Wild', 'Young', 'Stars', 'Ocean',
+    'Dance', 'Shadows', 'Echoes', 'Gravity', 'Paradise', 'Runaway', 'Sweet', 'Lonely',
+    'Broken', 'Electric', 'Memories', 'Highway', 'Velvet', 'Sunrise',
+]
+_EN_TEMPLATES = [
+    '{0} {1}', 'The {0} {1}', '{0} of {1}', '{0} in the {1}', 'Only {0}',
+    '{0} {1} {2}', 'Lost in {0}', 'Chasing {0} {1}',
+]
+_VI_FAMILY = ['Nguyễn', 'Trần', 'Lê', 'Phạm', 'Hoàng', 'Vũ', 'Đặng', 'Bùi', 'Đỗ', 'Hồ']
+_VI_GIVEN = [
+    'Thảo', 'Linh', 'Tuấn', 'Anh', 'Phương', 'Minh', 'Hà', 'Tùng', 'Quân', 'Trang',
+    'Vy', 'Hiếu', 'Ngọc', 'Khang', 'My', 'Duy',
+]
+_EN_FIRST = ['Alex', 'Jamie', 'Taylor', 'Jordan', 'Casey', 'Riley', 'Morgan', 'Sam', 'Avery', 'Quinn']
+_EN_LAST = ['Reed', 'Hayes', 'Carter', 'Brooks', 'Monroe', 'Lane', 'Parker', 'Wells', 'Hart', 'Stone']
+_GENRES = [
+    'Pop', 'Ballad', 'Rap', 'Indie', 'Bolero', 'EDM', 'Rock', 'R&B', 'Jazz', 'Acoustic',
+    'Lo-fi', 'V-Pop', 'K-Pop', 'Nhạc Trịnh', 'Dân Ca', 'Hip Hop',
+]
+_COMMENTS = ['Hay quá!', 'Nghe mãi không chán', 'Love this song', 'Giai điệu đẹp quá', 'On repeat 🔁', 'Nhớ ngày xưa']
+
+_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Tài khoản cố định, trùng với dữ liệu của các test Appium (login.py)
+DEFAULT_USERS = [
+    {'firstName': 'Thuong', 'lastName': 'Vu', 'email': 'thuong@gmail.com', 'password': '123456',
+     'mobile': '0900000001', 'role': 'user', 'address': 'Hà Nội'},
+    {'firstName': 'Admin', 'lastName': 'User', 'email': 'admin@example.com', 'password': '123456',
+     'mobile': '0900000002', 'role': 'admin', 'address': 'TP. Hồ Chí Minh'},
+]
+
+
+def object_id(seed, kind, index):
+    """Id 24 ký tự hex giống ObjectId của MongoDB, cố định theo (seed, loại, chỉ số)."""
+    return hashlib.md5(f'{seed}:{kind}:{index}'.encode()).hexdigest()[:24]
+
+
+def _slugify(text):
+    return '-'.join(text.lower().split())
+
+
+def _timestamp(minutes):
+    return (_EPOCH + timedelta(minutes=minutes)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+def _title(rng):
+    if rng.random() < 0.6:
+        words, templates = _VI_WORDS, _VI_TEMPLATES
+    else:
+        words, templates = _EN_WORDS, _EN_TEMPLATES
+    return rng.choice(templates).format(*rng.sample(words, 4))
+
+
+class Catalog:
+    """Catalog cố định theo seed. Các list_* / *_detail trả về dict đúng dạng JSON của API."""
+
+    def __init__(self, songs=10_000, seed=42, media_base='https://cdn.example.com', genre_song_limit=200):
+        if not 1 <= songs <= MAX_SONGS:
+            raise ValueError(f'songs phải nằm trong khoảng 1..{MAX_SONGS}')
+        self.seed = seed
+        self.media_base = media_base.rstrip('/')
+        self.genre_song_limit = genre_song_limit
+        self.song_count = songs
+        self.artist_count = max(1, songs // 50)
+        self.album_count = max(1, songs // 10)
+        self.genre_count = len(_GENRES)
+
+        self._artists = [self._make_artist(i) for i in range(self.artist_count)]
+        self._genres = [self._make_genre(i) for i in range(self.genre_count)]
+        self._albums = [self._make_album(i) for i in range(self.album_count)]
+        # (id, title, album, [genre], duration, created) của từng bài hát
+        self._songs = [self._make_song(i) for i in range(songs)]
+
+        self._song_index = {song[0]: i for i, song in enumerate(self._songs)}
+        self._artist_index = {artist['_id']: i for i, artist in enumerate(self._artists)}
+        self._album_index = {album['_id']: i for i, album in enumerate(self._albums)}
+        self._genre_index = {genre['_id']: i for i, genre in enumerate(self._genres)}
+        self._songs_by_genre = [[] for _ in range(self.genre_count)]
+        for i, song in enumerate(self._songs):
+            for genre in song[3]:
+                self._songs_by_genre[genre].append(i)
+
+        # Người nghe dùng cho likes / comments
+        self._listeners = [object_id(seed, 'listener', i) for i in range(5000)]
+        rng = self._rng('lyrics', 0)
+        self._lyric_lines = [' '.join(rng.sample(_VI_WORDS, rng.randrange(4, 8))) for _ in range(512)]
+
+        self.users = []
+        for user in DEFAULT_USERS:
+            self.add_user(user)
+
+    # ---- Dựng dữ liệu ----
+
+    def _rng(self, kind, index):
+        return random.Random(f'{self.seed}:{kind}:{index}')
+
+    def _make_artist(self, i):
+        rng = self._rng('artist', i)
+        if rng.random() < 0.6:
+            name = f'{rng.choice(_VI_FAMILY)} {rng.choice(_VI_GIVEN)}'
+        elif rng.random() < 0.7:
+            name = f'{rng.choice(_EN_FIRST)} {rng.choice(_EN_LAST)}'
+        else:
+            name = f'The {rng.choice(_EN_WORDS)}'
+        if i >= 100:
+            name = f'{name} {i // 100}'  # Giữ tên nghệ sĩ không trùng nhau
+        artist_id = object_id(self.seed, 'artist', i)
+        created = _timestamp(i)
+        return {
+            '_id': artist_id,
+            'title': name,
+            'avatar': f'{self.media_base}/avatars/{artist_id}.jpg',
+            'slugify': _slugify(name),
+            'createdAt': created,
+            'updatedAt': created,
+        }
+
+    def _make_genre(self, i):
+        genre_id = object_id(self.seed, 'genre', i)
+        created = _timestamp(i)
+        return {
+            '_id': genre_id,
+            'title': _GENRES[i],
+            'description': f'Tuyển tập {_GENRES[i]} hay nhất',
+            'coverImage': f'{self.media_base}/genres/{genre_id}.jpg',
+            'createdAt': created,
+            'updatedAt': created,
+        }
+
+    def _make_album(self, i):
+        rng = self._rng('album', i)
+        title = _title(rng)
+        album_id = object_id(self.seed, 'album', i)
+        created = _timestamp(i * 3)
+        return {
+            '_id': album_id,
+            'title': title,
+            'slugify': _slugify(title),
+            'coverImageURL': f'{self.media_base}/albums/{album_id}.jpg',
+            '_artist': i % self.artist_count,
+            '_genre': rng.randrange(self.genre_count),
+            'createdAt': created,
+            'updatedAt': created,
+        }
+
+    def _make_song(self, i):
+        rng = self._rng('song', i)
+        # Phân bố lệch: một số album / nghệ sĩ có nhiều bài hát hơn hẳn
+        album = int(self.album_count * rng.random() ** 2)
+        genres = [self._albums[album]['_genre']]
+        if rng.random() < 0.3:
+            extra = rng.randrange(self.genre_count)
+            if extra != genres[0]:
+                genres.append(extra)
+        seconds = rng.randrange(150, 330)
+        duration = f'{seconds // 60}:{seconds % 60:02d}'
+        return object_id(self.seed, 'song', i), _title(rng), album, genres, duration, i * 7
+
+    def add_user(self, fields):
+        index = len(self.users)
+        created = _timestamp(index)
+        user = {
+            '_id': object_id(self.seed, 'user', index),
+            'role': 'user',
+            'address': None,
+            'isBlocked': False,
+            'createdAt': created,
+            'updatedAt': created,
+            **fields,
+        }
+        self.users.append(user)
+        return user
+
+    def find_user(self, email):
+        return next((user for user in self.users if user['email'] == email), None)
+
+    # ---- Dạng JSON trả về ----
+
+    @staticmethod
+    def public_user(user):
+        return {key: value for key, value in user.items() if key != 'password'}
+
+    def _artist_ref(self, index, full=True):
+        artist = self._artists[index]
+        return artist if full else {'_id': artist['_id'], 'title': artist['title']}
+
+    def _genre_ref(self, index, full=True):
+        genre = self._genres[index]
+        return genre if full else {'_id': genre['_id'], 'title': genre['title']}
+
+    def _album_json(self, index, full=True, nested=True):
+        album = self._albums[index]
+        if not full:
+            return {'_id': album['_id'], 'title': album['title']}
+        data = {key: value for key, value in album.items() if not key.startswith('_') or key == '_id'}
+        # Album lồng trong bài hát chỉ được populate một cấp (không kèm artist / genre)
+        if nested:
+            data['artist'] = self._artist_ref(album['_artist'])
+            data['genre'] = self._genre_ref(album['_genre'])
+        return data
+
+    def song_json(self, index, summary=False):
+        song_id, title, album, genres, duration, created = self._songs[index]
+        artist = self._albums[album]['_artist']
+        data = {
+            '_id': song_id,
+            'title': title,
+            'artist': self._artist_ref(artist, full=not summary),
+            'album': self._album_json(album, full=not summary, nested=False),
+            'genre': [self._genre_ref(g, full=not summary) for g in genres],
+            'duration': duration,
+            'url': f'{self.media_base}/songs/{song_id}.mp3',
+            'coverImage': f'{self.media_base}/covers/{song_id}.jpg',
+        }
+        if summary:
+            return data
+
+        # Các trường nặng chỉ có trong payload đầy đủ, sinh lại từ seed của bài hát
+        rng = self._rng('song-detail', index)
+        lines = rng.choices(self._lyric_lines, k=rng.randrange(6, 12))
+        likes = rng.sample(self._listeners, rng.randrange(0, 30))
+        comments = [
+            {
+                'user': rng.choice(self._listeners),
+                'text': rng.choice(_COMMENTS),
+                'createdAt': _timestamp(created + rng.randrange(1, 60 * 24 * 30)),
+            }
+            for _ in range(rng.randrange(0, 6))
+        ]
+        timestamp = _timestamp(created)
+        data.update({
+            'description': f'{title} - {self._artists[artist]["title"]}',
+            'lyrics': '\n'.join(lines),
+            'slugify': _slugify(title),
+            'likes': likes,
+            'comments': comments,
+            'createdAt': timestamp,
+            'updatedAt': timestamp,
+        })
+        return data
+
+    def list_songs(self, start=0, stop=None, summary=False):
+        return [self.song_json(i, summary) for i in range(start, min(stop or self.song_count, self.song_count))]
+
+    def list_albums(self, start=0, stop=None):
+        return [self._album_json(i) for i in range(start, min(stop or self.album_count, self.album_count))]
+
+    def list_artists(self):
+        return list(self._artists)
+
+    def list_genres(self):
+        return [self.genre_detail(genre['_id']) for genre in self._genres]
+
+    def contains(self, kind, item_id):
+        indexes = {
+            'song': self._song_index,
+            'album': self._album_index,
+            'artist': self._artist_index,
+            'genre': self._genre_index,
+        }
+        return item_id in indexes[kind]
+
+    def song_detail(self, song_id):
+        index = self._song_index.get(song_id)
+        return None if index is None else self.song_json(index)
+
+    def album_detail(self, album_id):
+        index = self._album_index.get(album_id)
+        return None if index is None else self._album_json(index)
+
+    def artist_detail(self, artist_id):
+        index = self._artist_index.get(artist_id)
+        return None if index is None else self._artists[index]
+
+    def genre_detail(self, genre_id):
+        """Thể loại kèm bài hát (GenreDetailScreen hiển thị genre.songs), tối đa genre_song_limit bài."""
+        index = self._genre_index.get(genre_id)
+        if index is None:
+            return None
+        song_indexes = self._songs_by_genre[index]
+        if self.genre_song_limit:
+            song_indexes = song_indexes[:self.genre_song_limit]
+        return {**self._genres[index], 'songs': [self.song_json(i) for i in song_indexes]}
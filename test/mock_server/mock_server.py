@@ -0,0 +1,434 @@
+"""Mock backend cho app_music: chạy offline thay cho server thật ở 10.0.2.2:8080.
+
+Cài đặt các endpoint mà ứng dụng dùng, cùng envelope {success, data}:
+  POST /api/v1/user/login | /api/v1/user/register,  GET /api/v1/user/current
+  GET  /api/v1/song[?view=summary][&limit=&cursor=],  /api/v1/song/<id>
+  GET  /api/v1/album[?limit=&cursor=],  /api/v1/album/<id>
+  GET  /api/v1/artist,  /api/v1/artist/<id>
+  GET  /api/v1/genre,   /api/v1/genre/<id>
+  GET  /__mock/stats  (số request theo endpoint / mã trạng thái, số byte đã gửi)
+
+Chạy:
+  python test/mock_server/mock_server.py --songs 100000 --latency-ms 120 --bandwidth-kbps 2000
+
+Emulator Android truy cập máy host qua 10.0.2.2 nên với cổng mặc định 8080 ứng dụng
+không cần sửa gì. Thiết bị thật: build với --dart-define=API_BASE_URL=http://<ip-máy>:8080.
+Tài khoản có sẵn: thuong@gmail.com / 123456 (xem mock_catalog.DEFAULT_USERS).
+"""
+
+import argparse
+import gzip
+import hashlib
+import http.client
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from mock_catalog import Catalog, MAX_SONGS
+
+
+# Các danh sách ứng dụng tải khi khởi động (xem StartupCoordinator.loadCatalog)
+WARM_PATHS = ['/api/v1/song?view=summary', '/api/v1/album?limit=5', '/api/v1/album', '/api/v1/artist', '/api/v1/genre']
+
+
+@dataclass
+class ServerOptions:
+    latency_ms: float = 0  # Thời gian chờ trước khi trả header (TTFB)
+    jitter_ms: float = 0  # Dao động ngẫu nhiên ± quanh latency_ms
+    bandwidth_kbps: float = 0  # Giới hạn tốc độ gửi body, 0 = không giới hạn
+    error_rate: float = 0  # Tỉ lệ request /api/ bị trả lỗi giả lập
+    error_status: int = 503
+    etag: bool = True  # ETag / Last-Modified và trả 304 cho request có điều kiện
+    gzip: bool = True  # Nén body khi client gửi Accept-Encoding: gzip
+    require_auth: bool = False  # Bắt buộc Bearer token hợp lệ cho các endpoint catalog
+    seed: int = 42  # Seed cho latency / lỗi giả lập, để các lần chạy giống nhau
+    quiet: bool = False
+
+
+class _Body:
+    """Body đã mã hoá của một response, dùng lại cho các request giống nhau."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.etag = '"%s"' % hashlib.sha1(raw).hexdigest()[:20]
+        self._gzipped = None
+
+    def gzipped(self):
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.raw, compresslevel=6)
+        return self._gzipped
+
+
+class MockServer:
+    """Server chạy trên thread nền, dùng được cả từ dòng lệnh lẫn trong test."""
+
+    max_cached_bodies = 32
+
+    def __init__(self, catalog, options=None, host='127.0.0.1', port=0):
+        self.catalog = catalog
+        self.options = options or ServerOptions()
+        self.last_modified = formatdate(time.time(), usegmt=True)
+        self.stats = Counter()
+        self.bytes_sent = 0
+        self._tokens = {}
+        self._bodies = OrderedDict()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.options.seed)
+        self._thread = None
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    # ---- Hỗ trợ cho handler ----
+
+    def random(self):
+        with self._lock:
+            return self._rng.random()
+
+    def record(self, route, status, sent):
+        with self._lock:
+            self.stats[f'{route} {status}'] += 1
+            self.stats['requests'] += 1
+            self.bytes_sent += sent
+
+    def issue_token(self, user):
+        token = 'mock.' + hashlib.sha1(f'{user["_id"]}:{len(self._tokens)}'.encode()).hexdigest()
+        with self._lock:
+            self._tokens[token] = user
+        return token
+
+    def user_for(self, authorization):
+        if not authorization or not authorization.startswith('Bearer '):
+            return None
+        return self._tokens.get(authorization[len('Bearer '):])
+
+    def cached_body(self, key, build):
+        """Mã hoá JSON một lần cho mỗi (path, query); danh sách 100k bài hát tốn vài giây để dựng."""
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+                return body
+        body = _Body(json.dumps(build(), ensure_ascii=False, separators=(',', ':')).encode())
+        with self._lock:
+            self._bodies[key] = body
+            while len(self._bodies) > self.max_cached_bodies:
+                self._bodies.popitem(last=False)
+        return body
+
+    def warm(self, paths):
+        """Gọi trước các đường dẫn để body (và bản gzip) nằm sẵn trong cache."""
+        host, port = self.httpd.server_address[:2]
+        host = '127.0.0.1' if host == '0.0.0.0' else host
+        for path in paths:
+            connection = http.client.HTTPConnection(host, port, timeout=600)
+            try:
+                connection.request('GET', path, headers={'Accept-Encoding': 'gzip', 'X-Mock-Warm': '1'})
+                connection.getresponse().read()
+            finally:
+                connection.close()
+
+    def snapshot(self):
+        with self._lock:
+            return {'requests': dict(self.stats), 'bytesSent': self.bytes_sent}
+
+
+def _ok(data, **extra):
+    return {'success': True, 'data': data, **extra}
+
+
+def _page(items_for, total, query, default_limit=None):
+    """Phân trang theo cursor (offset dạng chuỗi) giống CatalogRepository.fetch*Page."""
+    limit = int(query.get('limit', default_limit or 0) or 0)
+    start = int(query.get('cursor', 0) or 0)
+    if not limit:
+        return _ok(items_for(0, None))
+    stop = min(start + limit, total)
+    return _ok(items_for(start, stop), nextCursor=str(stop) if stop < total else None, total=total)
+
+
+def _make_handler(server):
+    catalog = server.catalog
+    options = server.options
+
+    routes = [
+        ('GET', re.compile(r'^/api/v1/song$'), 'song.list'),
+        ('GET', re.compile(r'^/api/v1/song/([^/]+)$'), 'song.detail'),
+        ('GET', re.compile(r'^/api/v1/album$'), 'album.list'),
+        ('GET', re.compile(r'^/api/v1/album/([^/]+)$'), 'album.detail'),
+        ('GET', re.compile(r'^/api/v1/artist$'), 'artist.list'),
+        ('GET', re.compile(r'^/api/v1/artist/([^/]+)$'), 'artist.detail'),
+        ('GET', re.compile(r'^/api/v1/genre$'), 'genre.list'),
+        ('GET', re.compile(r'^/api/v1/genre/([^/]+)$'), 'genre.detail'),
+        ('GET', re.compile(r'^/api/v1/user/current$'), 'user.current'),
+        ('POST', re.compile(r'^/api/v1/user/login$'), 'user.login'),
+        ('POST', re.compile(r'^/api/v1/user/register$'), 'user.register'),
+        ('GET', re.compile(r'^/__mock/stats$'), 'mock.stats'),
+    ]
+    details = {
+        'song.detail': catalog.song_detail,
+        'album.detail': catalog.album_detail,
+        'artist.detail': catalog.artist_detail,
+        'genre.detail': catalog.genre_detail,
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # Giữ kết nối keep-alive như ApiClient
+        server_version = 'app_music-mock/1.0'
+
+        def do_GET(self):
+            self._dispatch('GET')
+
+        def do_POST(self):
+            self._dispatch('POST')
+
+        def log_message(self, format, *args):
+            if not options.quiet:
+                super().log_message(format, *args)
+
+        def _dispatch(self, method):
+            # Đọc hết body trước để kết nối keep-alive không còn dữ liệu thừa khi trả lỗi sớm
+            self.json_body = self._read_json() if method == 'POST' else {}
+            self.warm = bool(self.headers.get('X-Mock-Warm'))
+            url = urlsplit(self.path)
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            for route_method, pattern, name in routes:
+                match = pattern.match(url.path)
+                if match and route_method == method:
+                    break
+            else:
+                self._send_json('unknown', 404, {'success': False, 'message': f'Route {url.path} not found'})
+                return
+
+            # Request của warm() / stats không bị làm chậm, trả lỗi giả lập hay kiểm tra token
+            if name != 'mock.stats' and not self.warm:
+                self._delay()
+                if options.error_rate and server.random() < options.error_rate:
+                    self._send_json(name, options.error_status, {'success': False, 'message': 'Injected failure'})
+                    return
+            if options.require_auth and not self.warm and name.split('.')[0] in ('song', 'album', 'artist', 'genre') \
+                    and server.user_for(self.headers.get('Authorization')) is None:
+                self._send_json(name, 401, {'success': False, 'message': 'Invalid access token'})
+                return
+
+            try:
+                if name in details:
+                    self._detail(name, match.group(1))
+                else:
+                    getattr(self, '_' + name.replace('.', '_'))(name, query)
+            except ValueError as e:  # limit / cursor không phải số
+                self._send_json(name, 400, {'success': False, 'message': f'Invalid query: {e}'})
+
+        # ---- Catalog ----
+
+        def _song_list(self, name, query):
+            summary = query.get('view') == 'summary'
+            self._send_cached(name, lambda: _page(
+                lambda start, stop: catalog.list_songs(start, stop, summary=summary),
+                catalog.song_count, query))
+
+        def _album_list(self, name, query):
+            self._send_cached(name, lambda: _page(catalog.list_albums, catalog.album_count, query))
+
+        def _artist_list(self, name, query):
+            self._send_cached(name, lambda: _ok(catalog.list_artists()))
+
+        def _genre_list(self, name, query):
+            self._send_cached(name, lambda: _ok(catalog.list_genres()))
+
+        def _detail(self, name, item_id):
+            if not catalog.contains(name.split('.')[0], item_id):
+                self._send_json(name, 404, {'success': False, 'message': f'{item_id} not found'})
+                return
+            self._send_cached(name, lambda: _ok(details[name](item_id)))
+
+        def _mock_stats(self, name, query):
+            self._send_json(name, 200, server.snapshot())
+
+        # ---- User ----
+
+        def _read_json(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                return json.loads(self.rfile.read(length) or b'{}')
+            except ValueError:
+                return {}
+
+        def _user_login(self, name, query):
+            body = self.json_body
+            email, password = body.get('email'), body.get('password')
+            if not email or not password:
+                self._send_json(name, 400, {'success': False, 'message': 'Missing Inputs'})
+                return
+            user = catalog.find_user(email)
+            if user is None:
+                self._send_json(name, 401, {'success': False, 'message': 'This email does not exist'})
+            elif user['password'] != password:
+                self._send_json(name, 401, {'success': False, 'message': 'Invalid Password'})
+            else:
+                self._send_json(name, 200, {
+                    'success': True,
+                    'accessToken': server.issue_token(user),
+                    'userData': catalog.public_user(user),
+                })
+
+        def _user_register(self, name, query):
+            body = self.json_body
+            fields = ('firstName', 'lastName', 'email', 'mobile', 'password')
+            if not all(body.get(field) for field in fields):
+                self._send_json(name, 400, {'success': False, 'message': 'Missing Inputs'})
+            elif catalog.find_user(body['email']) is not None:
+                self._send_json(name, 400, {'success': False, 'message': 'User has existed'})
+            else:
+                catalog.add_user({field: body.get(field) for field in fields + ('address',)})
+                self._send_json(name, 201, {'success': True, 'message': 'Register is successfully'})
+
+        def _user_current(self, name, query):
+            user = server.user_for(self.headers.get('Authorization'))
+            if user is None:
+                self._send_json(name, 401, {'success': False, 'message': 'Invalid access token'})
+            else:
+                self._send_json(name, 200, {'success': True, 'response': catalog.public_user(user)})
+
+        # ---- Gửi response ----
+
+        def _delay(self):
+            if not options.latency_ms and not options.jitter_ms:
+                return
+            jitter = (server.random() * 2 - 1) * options.jitter_ms
+            time.sleep(max(0.0, options.latency_ms + jitter) / 1000)
+
+        def _send_cached(self, name, build):
+            body = server.cached_body(self.path, build)
+            if options.etag:
+                if_none_match = self.headers.get('If-None-Match')
+                if (if_none_match and body.etag in [tag.strip() for tag in if_none_match.split(',')]) or \
+                        (not if_none_match and self.headers.get('If-Modified-Since') == server.last_modified):
+                    self._send(name, 304, b'', {'ETag': body.etag, 'Last-Modified': server.last_modified})
+                    return
+            headers = {'ETag': body.etag, 'Last-Modified': server.last_modified} if options.etag else {}
+            self._send(name, 200, body.raw, headers, body)
+
+        def _send_json(self, name, status, payload):
+            self._send(name, status, json.dumps(payload, ensure_ascii=False).encode())
+
+        def _send(self, name, status, raw, headers=None, body=None):
+            payload = raw
+            use_gzip = options.gzip and raw and 'gzip' in (self.headers.get('Accept-Encoding') or '')
+            if use_gzip:
+                payload = body.gzipped() if body is not None else gzip.compress(raw)
+
+            self.send_response(status)
+            if status != 304:
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+            if use_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            if not self.warm:
+                server.record(name, status, len(payload))
+            self._write_throttled(payload)
+
+        def _write_throttled(self, payload):
+            if not options.bandwidth_kbps:
+                self.wfile.write(payload)
+                return
+            # Gửi từng phần nhỏ để thời gian truyền tỉ lệ với kích thước body
+            bytes_per_second = options.bandwidth_kbps * 1000 / 8
+            chunk = max(1024, int(bytes_per_second / 20))
+            for offset in range(0, len(payload), chunk):
+                part = payload[offset:offset + chunk]
+                self.wfile.write(part)
+                self.wfile.flush()
+                time.sleep(len(part) / bytes_per_second)
+
+    return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mock backend cho app_music (dữ liệu giả lập, chạy offline).')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--songs', type=int, default=10_000, help=f'Số bài hát (1..{MAX_SONGS})')
+    parser.add_argument('--seed', type=int, default=42, help='Cùng seed cho ra cùng catalog')
+    parser.add_argument('--media-base', default='https://cdn.example.com', help='Tiền tố URL của file nhạc / ảnh')
+    parser.add_argument('--genre-song-limit', type=int, default=200,
+                        help='Số bài hát tối đa lồng trong mỗi thể loại, 0 = tất cả')
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--bandwidth-kbps', type=float, default=0, help='0 = không giới hạn')
+    parser.add_argument('--error-rate', type=float, default=0, help='Tỉ lệ request bị trả lỗi, vd. 0.05')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--no-etag', action='store_true', help='Tắt ETag / 304')
+    parser.add_argument('--no-gzip', action='store_true')
+    parser.add_argument('--require-auth', action='store_true', help='Catalog cần Bearer token hợp lệ')
+    parser.add_argument('--quiet', action='store_true', help='Không in log từng request')
+    parser.add_argument('--warm', action='store_true',
+                        help='Dựng sẵn body của các danh sách trước khi nhận request (catalog lớn)')
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.songs <= MAX_SONGS:
+        parser.error(f'--songs phải nằm trong khoảng 1..{MAX_SONGS}')
+    if not 0 <= args.error_rate <= 1:
+        parser.error('--error-rate phải nằm trong khoảng 0..1')
+
+    started = time.perf_counter()
+    catalog = Catalog(args.songs, seed=args.seed, media_base=args.media_base,
+                      genre_song_limit=args.genre_song_limit)
+    print(f'✅ Catalog: {catalog.song_count} bài hát, {catalog.album_count} album, '
+          f'{catalog.artist_count} nghệ sĩ, {catalog.genre_count} thể loại '
+          f'({time.perf_counter() - started:.1f}s)')
+
+    options = ServerOptions(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        bandwidth_kbps=args.bandwidth_kbps,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        etag=not args.no_etag,
+        gzip=not args.no_gzip,
+        require_auth=args.require_auth,
+        seed=args.seed,
+        quiet=args.quiet,
+    )
+    server = MockServer(catalog, options, host=args.host, port=args.port).start()
+    if args.warm:
+        started = time.perf_counter()
+        server.warm(WARM_PATHS)
+        print(f'✅ Đã dựng sẵn {len(WARM_PATHS)} danh sách ({time.perf_counter() - started:.1f}s)')
+    print(f'✅ Mock server đang chạy tại {server.url}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+import gzip
+import http.client
+import json
+import unittest
+
+from mock_catalog import Catalog
+from mock_server import MockServer, ServerOptions
+
+
+class CatalogTest(unittest.TestCase):
+    def test_same_seed_same_catalog(self):
+        """Cùng seed và số bài hát cho ra cùng dữ liệu"""
+        first, second = Catalog(500, seed=7), Catalog(500, seed=7)
+        self.assertEqual(first.list_songs(0, 50), second.list_songs(0, 50))
+        self.assertEqual(first.list_albums(), second.list_albums())
+        self.assertNotEqual(first.list_songs(0, 50), Catalog(500, seed=8).list_songs(0, 50))
+
+    def test_summary_view_drops_heavy_fields(self):
+        """view=summary chỉ giữ các trường hiển thị, quan hệ là {_id, title}"""
+        catalog = Catalog(200)
+        full, summary = catalog.song_json(3), catalog.song_json(3, summary=True)
+        for field in ('lyrics', 'description', 'likes', 'comments', 'createdAt'):
+            self.assertIn(field, full)
+            self.assertNotIn(field, summary)
+        self.assertEqual(summary['artist'], {'_id': full['artist']['_id'], 'title': full['artist']['title']})
+        self.assertEqual(summary['album']['_id'], full['album']['_id'])
+
+    def test_relations_are_consistent(self):
+        """Bài hát tham chiếu tới album / nghệ sĩ / thể loại có thật trong catalog"""
+        catalog = Catalog(300)
+        for song in catalog.list_songs(summary=True):
+            self.assertIsNotNone(catalog.album_detail(song['album']['_id']))
+            self.assertIsNotNone(catalog.artist_detail(song['artist']['_id']))
+            for genre in song['genre']:
+                self.assertIsNotNone(catalog.genre_detail(genre['_id']))
+
+    def test_song_count_limit(self):
+        with self.assertRaises(ValueError):
+            Catalog(0)
+
+
+class MockServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockServer(Catalog(1000), ServerOptions(quiet=True)).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def request(self, method, path, body=None, headers=None, server=None):
+        host, port = (server or self.server).httpd.server_address[:2]
+        connection = http.client.HTTPConnection(host, port, timeout=10)
+        try:
+            payload = json.dumps(body).encode() if body is not None else None
+            connection.request(method, path, body=payload, headers=headers or {})
+            response = connection.getresponse()
+            raw = response.read()
+            if response.getheader('Content-Encoding') == 'gzip':
+                raw = gzip.decompress(raw)
+            return response, json.loads(raw) if raw else None
+        finally:
+            connection.close()
+
+    def login(self, email='thuong@gmail.com', password='123456'):
+        return self.request('POST', '/api/v1/user/login', {'email': email, 'password': password})
+
+    def test_login_and_current_user(self):
+        response, data = self.login()
+        self.assertEqual(response.status, 200)
+        self.assertEqual(data['userData']['firstName'], 'Thuong')
+        self.assertNotIn('password', data['userData'])
+
+        response, current = self.request(
+            'GET', '/api/v1/user/current', headers={'Authorization': f'Bearer {data["accessToken"]}'})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(current['response']['email'], 'thuong@gmail.com')
+
+        response, _ = self.request('GET', '/api/v1/user/current', headers={'Authorization': 'Bearer expired'})
+        self.assertEqual(response.status, 401)
+
+    def test_login_errors_match_login_screen(self):
+        """Thông báo lỗi khớp với các chuỗi LoginScreen kiểm tra"""
+        self.assertEqual(self.login(email='nobody@example.com')[1]['message'], 'This email does not exist')
+        self.assertEqual(self.login(password='wrong')[1]['message'], 'Invalid Password')
+        self.assertEqual(self.login(password='')[1]['message'], 'Missing Inputs')
+
+    def test_song_pages(self):
+        response, page = self.request('GET', '/api/v1/song?view=summary&limit=400')
+        self.assertEqual(response.status, 200)
+        self.assertTrue(page['success'])
+        self.assertEqual((len(page['data']), page['total'], page['nextCursor']), (400, 1000, '400'))
+
+        ids = [song['_id'] for song in page['data']]
+        while page['nextCursor']:
+            _, page = self.request('GET', f'/api/v1/song?view=summary&limit=400&cursor={page["nextCursor"]}')
+            ids += [song['_id'] for song in page['data']]
+        self.assertEqual(len(set(ids)), 1000)
+
+        _, detail = self.request('GET', f'/api/v1/song/{ids[0]}')
+        self.assertIn('lyrics', detail['data'])
+        self.assertEqual(self.request('GET', '/api/v1/song/missing')[0].status, 404)
+        self.assertEqual(self.request('GET', '/api/v1/song?limit=abc')[0].status, 400)
+
+    def test_etag_revalidation(self):
+        """Request có If-None-Match trùng ETag nhận 304 không kèm body"""
+        response, data = self.request('GET', '/api/v1/genre')
+        etag = response.getheader('ETag')
+        self.assertTrue(etag)
+        self.assertEqual(len(data['data']), 16)
+
+        response, data = self.request('GET', '/api/v1/genre', headers={'If-None-Match': etag})
+        self.assertEqual(response.status, 304)
+        self.assertIsNone(data)
+
+        response, _ = self.request('GET', '/api/v1/genre', headers={'If-None-Match': '"stale"'})
+        self.assertEqual(response.status, 200)
+
+    def test_gzip(self):
+        response, data = self.request('GET', '/api/v1/artist', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.getheader('Content-Encoding'), 'gzip')
+        self.assertEqual(len(data['data']), 20)
+
+    def test_injected_errors_and_auth(self):
+        server = MockServer(Catalog(50), ServerOptions(error_rate=1, error_status=500, quiet=True)).start()
+        try:
+            response, data = self.request('GET', '/api/v1/song', server=server)
+            self.assertEqual(response.status, 500)
+            self.assertFalse(data['success'])
+        finally:
+            server.stop()
+
+        server = MockServer(Catalog(50), ServerOptions(require_auth=True, quiet=True)).start()
+        try:
+            self.assertEqual(self.request('GET', '/api/v1/album', server=server)[0].status, 401)
+            _, login = self.request('POST', '/api/v1/user/login',
+                                    {'email': 'thuong@gmail.com', 'password': '123456'}, server=server)
+            response, _ = self.request('GET', '/api/v1/album', server=server,
+                                       headers={'Authorization': f'Bearer {login["accessToken"]}'})
+            self.assertEqual(response.status, 200)
+        finally:
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import 'dart:math';
+
+import 'package:app_music/providers/play_queue.dart';
+import 'package:flutter_test/flutter_test.dart';
+
+List<String> _ids(int count) => [for (int i = 0; i < count; i++) 's$i'];
+
+// Chuyển bài cho tới khi hết hàng đợi, trả về các index đã phát
+List<int> _drain(PlayQueue queue) {
+  final played = <int>[];
+  for (int? index = queue.advance(); index != null; index = queue.advance()) {
+    played.add(index);
+  }
+  return played;
+}
+
+void main() {
+  group('shuffle', () {
+    test('visits every track exactly once per round', () {
+      final queue = PlayQueue(random: Random(42))
+        ..replace(_ids(50))
+        ..setShuffle(true);
+
+      final played = _drain(queue);
+
+      expect(played, hasLength(50));
+      expect(played.toSet(), hasLength(50));
+      // RepeatMode.all: vòng mới bắt đầu lại từ bài đầu của hoán vị
+      expect(queue.advance(wrap: true), played.first);
+    });
+
+    test('jumpTo starts a new round from the chosen track', () {
+      final queue = PlayQueue(random: Random(3))
+        ..replace(_ids(20))
+        ..setShuffle(true);
+      queue.advance();
+      queue.advance();
+
+      expect(queue.jumpTo(7), isTrue);
+      expect(queue.currentIndex, 7);
+
+      final rest = _drain(queue);
+      expect(rest, hasLength(19));
+      expect({7, ...rest}, hasLength(20));
+      expect(queue.previous(), rest[rest.length - 2]);
+    });
+
+    test('jumpTo rejects removed and out of range indexes', () {
+      final queue = PlayQueue(random: Random(3))
+        ..replace(_ids(5))
+        ..setShuffle(true);
+      queue.remove(3);
+
+      expect(queue.jumpTo(3), isFalse);
+      expect(queue.jumpTo(5), isFalse);
+      expect(queue.currentIndex, -1);
+    });
+  });
+
+  group('remove', () {
+    test('before the current index is skipped by previous', () {
+      final queue = PlayQueue()..replace(_ids(5));
+      queue.jumpTo(0);
+      queue.advance();
+      queue.advance();
+
+      queue.remove(1);
+
+      expect(queue.currentIndex, 2);
+      expect(queue.isPlayable(1), isFalse);
+      expect(queue.indexOf('s1'), -1);
+      expect(queue.previous(), 0);
+      expect(queue.advance(), 2);
+    });
+
+    test('after the current index is skipped by next', () {
+      final queue = PlayQueue()..replace(_ids(5));
+      queue.jumpTo(2);
+
+      queue.remove(3);
+
+      expect(queue.peekNext(), 4);
+      expect(queue.advance(), 4);
+      expect(queue.advance(), isNull);
+    });
+  });
+
+  test('previous after the history is trimmed to maxHistory', () {
+    final queue = PlayQueue(random: Random(7))
+      ..replace(_ids(150))
+      ..setShuffle(true);
+    final played = [for (int i = 0; i < 121; i++) queue.advance()!];
+
+    expect(queue.historyLength, 100);
+    for (int i = 119; i >= 20; i--) {
+      expect(queue.previous(), played[i]);
+    }
+    expect(queue.historyLength, 0);
+    // Hết lịch sử: lùi theo thứ tự phát
+    expect(queue.previous(), played[19]);
+  });
+
+  group('repeat', () {
+    test('none stops at the end of the queue', () {
+      final queue = PlayQueue()..replace(_ids(3));
+      queue.jumpTo(2);
+
+      expect(queue.peekNext(), isNull);
+      expect(queue.advance(), isNull);
+      expect(queue.currentIndex, 2);
+    });
+
+    test('all wraps around and skips removed tracks', () {
+      final queue = PlayQueue()..replace(_ids(3));
+      queue.jumpTo(2);
+      queue.remove(0);
+
+      expect(queue.peekNext(wrap: true), 1);
+      expect(queue.advance(wrap: true), 1);
+    });
+
+    test('all wraps previous from the first track', () {
+      final queue = PlayQueue()..replace(_ids(3));
+      queue.jumpTo(0);
+
+      expect(queue.previous(), isNull);
+      expect(queue.previous(wrap: true), 2);
+    });
+  });
+}
@@ -0,0 +1,24 @@
+// Driver cho các benchmark trong integration_test/: chuyển timeline thu được
+// bằng traceAction thành timeline summary (thời gian build / raster từng frame)
+// và ghi các số liệu còn lại ra file JSON trong build/.
+
+import 'package:flutter_driver/flutter_driver.dart' as driver;
+import 'package:integration_test/integration_test_driver.dart';
+
+Future<void> main() {
+  return integrationDriver(
+    responseDataCallback: (data) async {
+      if (data == null) return;
+      for (final entry in Map<String, dynamic>.from(data).entries) {
+        final value = entry.value;
+        if (value is Map<String, dynamic> && value.containsKey('traceEvents')) {
+          final timeline = driver.Timeline.fromJson(value);
+          final summary = driver.TimelineSummary.summarize(timeline);
+          await summary.writeTimelineToFile(entry.key, pretty: true, includeSummary: true);
+          data.remove(entry.key);
+        }
+      }
+      await writeResponseData(data, testOutputFilename: 'genre_scroll_benchmark');
+    },
+  );
+}